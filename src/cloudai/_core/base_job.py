@@ -27,3 +27,4 @@ class BaseJob:
     test_run: TestRun
     id: Union[str, int]
     terminated_by_dependency: bool = field(default=False, init=False)
+    stopped_early: bool = field(default=False, init=False)
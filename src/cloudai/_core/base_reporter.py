@@ -16,7 +16,6 @@
 
 from __future__ import annotations
 
-import copy
 import logging
 from abc import ABC, abstractmethod
 from pathlib import Path
@@ -52,7 +51,7 @@ class Reporter(ABC):
     def load_test_runs(self):
         """Load test runs from the results directory."""
         for _tr in self.test_scenario.test_runs:
-            tr = copy.deepcopy(_tr)
+            tr = _tr.variant()
             tr_root = self.results_root / tr.name
             iters = list(subdir for subdir in tr_root.glob("*") if subdir.is_dir())
             for iter in sorted(iters, key=lambda x: int(x.name)):
@@ -62,12 +61,12 @@ class Reporter(ABC):
                         tr.current_iteration = int(iter.name)
                         tr.step = int(step.name)
                         tr.output_path = tr_root / f"{tr.current_iteration}" / f"{tr.step}"
-                        self.trs.append(copy.deepcopy(tr))
+                        self.trs.append(tr.variant())
                 else:
                     tr.current_iteration = int(iter.name)
                     tr.step = 0
                     tr.output_path = tr_root / f"{tr.current_iteration}"
-                    self.trs.append(copy.deepcopy(tr))
+                    self.trs.append(tr.variant())
 
         logging.debug(f"Loaded {len(self.trs)} test runs for {self.test_scenario.name} in {self.results_root}")
         for tr in self.trs:
@@ -15,11 +15,13 @@
 # limitations under the License.
 
 import asyncio
+import contextlib
 import logging
+import time
 from abc import ABC, abstractmethod
 from asyncio import Task
 from pathlib import Path
-from typing import Dict, List
+from typing import Callable, Dict, List, Optional
 
 from .base_job import BaseJob
 from .command_gen_strategy import CommandGenStrategy
@@ -42,12 +44,17 @@ class BaseRunner(ABC):
         system (System): The system schema object.
         test_scenario (TestScenario): The test scenario to run.
         output_path (Path): Path to the output directory.
-        monitor_interval (int): Interval in seconds for monitoring jobs.
+        monitor_interval (int): Maximum interval in seconds between job monitoring ticks.
+        min_monitor_interval (float): Interval in seconds used right after jobs were submitted or completed. The
+            interval then grows with the time since the last change up to `monitor_interval`.
+        max_concurrent_submissions (int): Maximum number of test submissions executed concurrently.
         jobs (List[BaseJob]): List to track jobs created by the runner.
         test_to_job_map (Dict[Test, BaseJob]): Mapping from tests to their jobs.
         logger (logging.Logger): Logger for the runner.
         shutting_down (bool): A flag indicating whether a shutdown process has been initiated, preventing the start of
             new tests and ensuring a graceful termination of all running tests.
+        early_stop (Optional[Callable[[TestRun], bool]]): Check evaluated for running jobs on every monitoring tick,
+            a job is killed as soon as it returns True. Used to stop dominated DSE steps.
     """
 
     def __init__(self, mode: str, system: System, test_scenario: TestScenario, output_path: Path):
@@ -65,18 +72,27 @@ class BaseRunner(ABC):
         self.test_scenario = test_scenario
         self.scenario_root = output_path
         self.monitor_interval = system.monitor_interval
+        self.min_monitor_interval: float = 1.0
+        self.last_jobs_change = time.monotonic()
+        self.jobs_changed: asyncio.Event | None = None
+        self.max_concurrent_submissions = 8
+        self.submission_semaphore: asyncio.Semaphore | None = None
+        self.pending_submissions: Dict[TestRun, Task] = {}
         self.jobs: List[BaseJob] = []
         self.testrun_to_job_map: Dict[TestRun, BaseJob] = {}
         logging.debug(f"{self.__class__.__name__} initialized")
         self.shutting_down = False
+        self.early_stop: Optional[Callable[[TestRun], bool]] = None
 
     async def shutdown(self):
         """Gracefully shut down the runner, terminating all outstanding jobs."""
         self.shutting_down = True
         logging.info("Terminating all jobs...")
+        for task in self.pending_submissions.values():
+            task.cancel()
         for job in self.jobs:
             logging.info(f"Terminating job {job.id} for test {job.test_run.name}")
-            self.system.kill(job)
+            await asyncio.to_thread(self.system.kill, job)
         logging.info("All jobs have been killed.")
 
     async def run(self):
@@ -84,17 +100,75 @@ class BaseRunner(ABC):
         if self.shutting_down:
             return
 
+        self.jobs_changed = asyncio.Event()
+        self.submission_semaphore = asyncio.Semaphore(self.max_concurrent_submissions)
         total_tests = len(self.test_scenario.test_runs)
         dependency_free_trs = self.find_dependency_free_tests()
-        for tr in dependency_free_trs:
-            await self.submit_test(tr)
+        await asyncio.gather(*(self.submit_test(tr) for tr in dependency_free_trs))
 
         logging.debug(f"Total tests: {total_tests}, dependency free tests: {[tr.name for tr in dependency_free_trs]}")
-        while self.jobs:
+        while self.jobs or self.pending_submissions:
+            self.reap_pending_submissions()
+            if self.mode == "run" and self.jobs:
+                await asyncio.to_thread(self.system.update_jobs_state, self.jobs)
+                await self.check_early_stop()
             await self.check_start_post_init_dependencies()
             await self.monitor_jobs()
-            logging.debug(f"sleeping for {self.monitor_interval} seconds")
-            await asyncio.sleep(self.monitor_interval)
+            await self.wait_for_next_tick()
+
+    async def check_early_stop(self) -> None:
+        """Kill running jobs for which the early stop check returns True."""
+        if self.early_stop is None:
+            return
+
+        for job in list(self.jobs):
+            if job.stopped_early or job.terminated_by_dependency:
+                continue
+            if not await asyncio.to_thread(self.system.is_job_running, job):
+                continue
+            if await asyncio.to_thread(self.early_stop, job.test_run):
+                logging.info(f"Stopping job {job.id} for test {job.test_run.name} early")
+                job.stopped_early = True
+                await asyncio.to_thread(self.system.kill, job)
+
+    def reap_pending_submissions(self) -> None:
+        """Forget finished delayed submissions, re-raising errors if any of them has failed."""
+        for tr, task in list(self.pending_submissions.items()):
+            if task.done():
+                del self.pending_submissions[tr]
+                if not task.cancelled():
+                    task.result()
+
+    def next_monitor_interval(self) -> float:
+        """
+        Compute the delay before the next monitoring tick.
+
+        Polling is frequent right after jobs were submitted or completed and backs off as the time since the last
+        change grows, up to `monitor_interval`.
+
+        Returns:
+            float: Delay in seconds.
+        """
+        since_last_change = time.monotonic() - self.last_jobs_change
+        return min(float(self.monitor_interval), max(self.min_monitor_interval, since_last_change))
+
+    def notify_jobs_changed(self) -> None:
+        """Reset the polling backoff and wake up the monitoring loop, e.g. after a job was submitted or completed."""
+        self.last_jobs_change = time.monotonic()
+        if self.jobs_changed is not None:
+            self.jobs_changed.set()
+
+    async def wait_for_next_tick(self) -> None:
+        """Wait until the next monitoring tick is due or the set of jobs has changed, whatever comes first."""
+        interval = self.next_monitor_interval()
+        logging.debug(f"sleeping for up to {interval:.1f} seconds")
+        if self.jobs_changed is None:
+            await asyncio.sleep(interval)
+            return
+
+        with contextlib.suppress(asyncio.TimeoutError):
+            await asyncio.wait_for(self.jobs_changed.wait(), timeout=interval)
+        self.jobs_changed.clear()
 
     async def submit_test(self, tr: TestRun):
         """
@@ -105,15 +179,20 @@ class BaseRunner(ABC):
         """
         logging.info(f"Starting test: {tr.name}")
         tr.output_path = self.get_job_output_path(tr)
-        self.on_job_submit(tr)
         try:
-            job = self._submit_test(tr)
+            async with self.submission_semaphore or contextlib.nullcontext():
+                job = await asyncio.to_thread(self._prepare_and_submit_test, tr)
             self.jobs.append(job)
             self.testrun_to_job_map[tr] = job
+            self.notify_jobs_changed()
         except JobSubmissionError as e:
             logging.error(e)
             exit(1)
 
+    def _prepare_and_submit_test(self, tr: TestRun) -> BaseJob:
+        self.on_job_submit(tr)
+        return self._submit_test(tr)
+
     def on_job_submit(self, tr: TestRun) -> None:
         return
 
@@ -129,6 +208,23 @@ class BaseRunner(ABC):
         await asyncio.sleep(delay)
         await self.submit_test(tr)
 
+    def schedule_delayed_submit_test(self, tr: TestRun, delay: int = 5) -> Task:
+        """
+        Schedule a delayed start of a test as a background task, so that multiple delays run concurrently.
+
+        A test that already has a pending submission is not scheduled again.
+
+        Args:
+            tr (TestRun): The test to start after a delay.
+            delay (int): Delay in seconds before starting the test.
+
+        Returns:
+            asyncio.Task: The task performing the delayed submission.
+        """
+        if tr not in self.pending_submissions:
+            self.pending_submissions[tr] = asyncio.create_task(self.delayed_submit_test(tr, delay))
+        return self.pending_submissions[tr]
+
     @abstractmethod
     def _submit_test(self, tr: TestRun) -> BaseJob:
         """
@@ -152,13 +248,16 @@ class BaseRunner(ABC):
         items = list(self.testrun_to_job_map.items())
 
         for tr, job in items:
+            if not self.test_scenario.get_dependents("start_post_init", tr):
+                continue
+
             is_running, is_completed = False, False
             if self.mode == "dry-run":
                 is_running, is_completed = True, True
             else:
                 is_running, is_completed = (
-                    self.system.is_job_running(job),
-                    self.system.is_job_completed(job),
+                    await asyncio.to_thread(self.system.is_job_running, job),
+                    await asyncio.to_thread(self.system.is_job_completed, job),
                 )
 
             logging.debug(f"start_post_init for test {tr.name} ({is_running=}, {is_completed=}, {self.mode=})")
@@ -172,11 +271,9 @@ class BaseRunner(ABC):
         Args:
             started_test_run (TestRun): The test that has just started.
         """
-        for tr in self.test_scenario.test_runs:
+        for tr in self.test_scenario.get_dependents("start_post_init", started_test_run):
             if tr not in self.testrun_to_job_map:
-                for dep_type, dep in tr.dependencies.items():
-                    if (dep_type == "start_post_init") and (dep.test_run == started_test_run):
-                        await self.delayed_submit_test(tr)
+                self.schedule_delayed_submit_test(tr)
 
     def find_dependency_free_tests(self) -> List[TestRun]:
         """
@@ -239,11 +336,13 @@ class BaseRunner(ABC):
 
         logging.debug(f"Monitoring {len(self.jobs)} jobs")
         for job in list(self.jobs):
-            is_completed = True if self.mode == "dry-run" else self.system.is_job_completed(job)
+            is_completed = (
+                True if self.mode == "dry-run" else await asyncio.to_thread(self.system.is_job_completed, job)
+            )
 
             if is_completed:
                 logging.debug(f"Job {job.id} for test {job.test_run.name} completed ({self.mode=}, {is_completed=})")
-                self.on_job_completion(job)
+                await asyncio.to_thread(self.on_job_completion, job)
 
                 if self.mode == "dry-run":
                     successful_jobs_count += 1
@@ -287,6 +386,9 @@ class BaseRunner(ABC):
         Returns:
             JobStatusResult: The result containing the job status and an optional error message.
         """
+        if job.stopped_early:
+            return JobStatusResult(is_successful=True)
+
         runner_job_status_result = self.get_runner_job_status(job)
         workload_run_results = job.test_run.test.test_definition.was_run_successful(job.test_run)
         if not runner_job_status_result.is_successful:
@@ -309,6 +411,7 @@ class BaseRunner(ABC):
 
         self.jobs.remove(completed_job)
         del self.testrun_to_job_map[completed_job.test_run]
+        self.notify_jobs_changed()
 
         if completed_job.test_run.step <= 0:
             if not completed_job.terminated_by_dependency and completed_job.test_run.has_more_iterations():
@@ -344,20 +447,16 @@ class BaseRunner(ABC):
         tasks = []
 
         # Handling start_post_comp dependencies
-        for tr in self.test_scenario.test_runs:
+        for tr in self.test_scenario.get_dependents("start_post_comp", completed_job.test_run):
             if tr not in self.testrun_to_job_map:
-                for dep_type, dep in tr.dependencies.items():
-                    if dep_type == "start_post_comp" and dep.test_run.test == completed_job.test_run.test:
-                        task = await self.delayed_submit_test(tr)
-                        if task:
-                            tasks.append(task)
+                tasks.append(self.schedule_delayed_submit_test(tr))
 
         # Handling end_post_comp dependencies
-        for test, dependent_job in self.testrun_to_job_map.items():
-            for dep_type, dep in test.dependencies.items():
-                if dep_type == "end_post_comp" and dep.test_run.test == completed_job.test_run.test:
-                    task = await self.delayed_kill_job(dependent_job)
-                    tasks.append(task)
+        for tr in self.test_scenario.get_dependents("end_post_comp", completed_job.test_run):
+            dependent_job = self.testrun_to_job_map.get(tr)
+            if dependent_job is not None:
+                task = await self.delayed_kill_job(dependent_job)
+                tasks.append(task)
 
         return tasks
 
@@ -372,7 +471,7 @@ class BaseRunner(ABC):
         logging.info(f"Scheduling termination of job {job.id} after {delay} seconds.")
         await asyncio.sleep(delay)
         job.terminated_by_dependency = True
-        self.system.kill(job)
+        await asyncio.to_thread(self.system.kill, job)
 
     def get_cmd_gen_strategy(self, system: System, test_run: TestRun) -> CommandGenStrategy:
         strategy_cls = Registry().get_command_gen_strategy(type(system), type(test_run.test.test_definition))
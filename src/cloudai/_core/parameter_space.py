@@ -0,0 +1,135 @@
+# SPDX-FileCopyrightText: NVIDIA CORPORATION & AFFILIATES
+# Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import itertools
+import math
+from collections.abc import Sequence
+from typing import TYPE_CHECKING, Any, Callable, Iterator, overload
+
+from cloudai.util.lazy_imports import lazy
+
+if TYPE_CHECKING:
+    import numpy as np
+
+
+def _scalar_kind(value: Any) -> str | None:
+    if isinstance(value, bool):
+        return "bool"
+    if isinstance(value, (int, float)):
+        return "number"
+    if isinstance(value, str):
+        return "str"
+    return None
+
+
+def _values_array(values: list[Any]) -> np.ndarray:
+    kinds = {_scalar_kind(value) for value in values}
+    if len(kinds) == 1 and None not in kinds:
+        return lazy.np.asarray(values)
+
+    array = lazy.np.empty(len(values), dtype=object)
+    for idx, value in enumerate(values):
+        array[idx] = value
+    return array
+
+
+class ParameterSpace(Sequence[dict[str, Any]]):
+    """
+    Lazy Cartesian product of parameter values.
+
+    Combinations are never materialized: the size is computed from the number of values per parameter, items are
+    decoded from their index on access and iteration produces one combination at a time. Order matches
+    `itertools.product`, i.e. the last parameter changes fastest.
+
+    Attributes
+        keys (list[str]): Parameter names.
+        values (list[list[Any]]): Possible values for every parameter.
+    """
+
+    def __init__(self, space: dict[str, list[Any]]) -> None:
+        self.keys = list(space.keys())
+        self.values = [list(v) for v in space.values()]
+        self._len = math.prod(len(v) for v in self.values) if self.keys else 0
+
+    def __len__(self) -> int:
+        return self._len
+
+    @overload
+    def __getitem__(self, index: int) -> dict[str, Any]: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[dict[str, Any]]: ...
+
+    def __getitem__(self, index: int | slice) -> dict[str, Any] | list[dict[str, Any]]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._len))]
+
+        if index < 0:
+            index += self._len
+        if not 0 <= index < self._len:
+            raise IndexError(f"Combination index {index} is out of range for space of size {self._len}")
+
+        combination: dict[str, Any] = {}
+        for key, values in zip(reversed(self.keys), reversed(self.values), strict=True):
+            index, value_idx = divmod(index, len(values))
+            combination[key] = values[value_idx]
+        return {key: combination[key] for key in self.keys}
+
+    def __iter__(self) -> Iterator[dict[str, Any]]:
+        if not self.keys:
+            return
+        for combination in itertools.product(*self.values):
+            yield dict(zip(self.keys, combination, strict=True))
+
+    def __repr__(self) -> str:
+        return f"ParameterSpace(keys={self.keys}, size={self._len})"
+
+    def column(self, key: str, missing: Any = None) -> np.ndarray:
+        """
+        Get values of a parameter for all combinations at once, in combination order.
+
+        Only the value indices are computed for every combination, so columns of large spaces are cheap to build and
+        can be combined with NumPy operations to evaluate constraints on the whole space.
+
+        Args:
+            key (str): Parameter name.
+            missing (Any): Value used in place of None values, e.g. to get a numeric column for an optional parameter.
+
+        Returns:
+            np.ndarray: Array of `len(self)` values. Values that are all booleans, all numbers or all strings get a
+                native dtype, any other values (mixed types, lists, None) are kept as they are in an object array.
+        """
+        pos = self.keys.index(key)
+        values = [missing if value is None else value for value in self.values[pos]]
+        stride = math.prod(len(v) for v in self.values[pos + 1 :])
+        codes = (lazy.np.arange(self._len) // stride) % len(values)
+        return _values_array(values)[codes]
+
+    def filtered(self, predicate: Callable[[dict[str, Any]], bool]) -> Iterator[tuple[int, dict[str, Any]]]:
+        """
+        Iterate over combinations that satisfy a predicate.
+
+        Args:
+            predicate (Callable[[dict[str, Any]], bool]): Function that returns True for feasible combinations.
+
+        Yields:
+            tuple[int, dict[str, Any]]: Index of a feasible combination in the full space and the combination itself.
+        """
+        for idx, combination in enumerate(self):
+            if predicate(combination):
+                yield idx, combination
@@ -16,7 +16,24 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Callable, ClassVar, List, Set, Tuple, Type, Union
+import logging
+import threading
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    ClassVar,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
 
 if TYPE_CHECKING:
     from ..configurator.base_agent import BaseAgent
@@ -32,6 +49,117 @@ if TYPE_CHECKING:
     from .system import System
 
 RewardFunction = Callable[[List[float]], float]
+# Reentrant, registration of a plugin may look up entries of other plugins and register them.
+PLUGINS_LOCK = threading.RLock()
+
+K = TypeVar("K")
+V = TypeVar("V")
+
+
+class PluginMap(Dict[K, V]):
+    """
+    Registry map which entries are registered by plugins on first use.
+
+    Plugins declare the names they provide with `Registry.add_plugin()`, the plugin module is imported and registered
+    only when one of its names is looked up. Iterating over the map or taking its size registers all plugins that
+    declared names for it. Declared names are kept in declaration order.
+
+    Attributes
+        declared (dict[K, str]): Plugin module for every declared key.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.declared: dict[K, str] = {}
+
+    def _plugin_for(self, key: Any) -> Optional[str]:
+        return self.declared.get(key)
+
+    def _plugins(self) -> Iterable[str]:
+        return dict.fromkeys(self.declared.values())
+
+    def _load(self, key: Any) -> None:
+        if dict.__contains__(self, key):
+            return
+        plugin = self._plugin_for(key)
+        if plugin is not None:
+            Registry().load_plugin(plugin)
+
+    def _load_all(self) -> None:
+        for plugin in list(self._plugins()):
+            Registry().load_plugin(plugin)
+
+    def sort_declared(self) -> None:
+        """Move declared entries to the front of the map in declaration order."""
+        if not self.declared:
+            return
+        entries = dict(super().items())
+        super().clear()
+        for key in self.declared:
+            if key in entries:
+                super().__setitem__(key, entries.pop(key))
+        super().update(entries)
+
+    def __getitem__(self, key: K) -> V:
+        """Return the entry for a key, registering its plugin first if needed."""
+        self._load(key)
+        return super().__getitem__(key)
+
+    def __contains__(self, key: object) -> bool:
+        """Check if a key is registered, registering its plugin first if needed."""
+        self._load(key)
+        return super().__contains__(key)
+
+    def get(self, key: K, default: Any = None) -> Any:
+        self._load(key)
+        return super().get(key, default)
+
+    def __iter__(self) -> Iterator[K]:
+        """Iterate over keys of all entries, including not yet registered ones."""
+        self._load_all()
+        return super().__iter__()
+
+    def __len__(self) -> int:
+        """Return the number of entries, including not yet registered ones."""
+        self._load_all()
+        return super().__len__()
+
+    def keys(self) -> Any:
+        self._load_all()
+        return super().keys()
+
+    def values(self) -> Any:
+        self._load_all()
+        return super().values()
+
+    def items(self) -> Any:
+        self._load_all()
+        return super().items()
+
+    def copy(self) -> dict[K, V]:
+        self._load_all()
+        return dict(super().items())
+
+    def clear(self) -> None:
+        super().clear()
+        self.declared = {}
+
+
+class TypePluginMap(PluginMap[K, V]):
+    """
+    Registry map keyed by test definition types or tuples ending with one.
+
+    Lookups register the plugin that defines the test definition type, iteration registers all pending plugins.
+    """
+
+    def _plugin_for(self, key: Any) -> Optional[str]:
+        tdef_type = key[-1] if isinstance(key, tuple) and key else key
+        if not isinstance(tdef_type, type):
+            return None
+        return Registry().plugin_for_type(tdef_type)
+
+    def _plugins(self) -> Iterable[str]:
+        return Registry().plugins.keys()
 
 
 class Singleton(type):
@@ -48,9 +176,10 @@ class Singleton(type):
 class Registry(metaclass=Singleton):
     """Registry for implementations mappings."""
 
-    runners_map: ClassVar[dict[str, Type[BaseRunner]]] = {}
+    plugins: ClassVar[dict[str, Callable[[], None]]] = {}
+    runners_map: ClassVar[PluginMap[str, Type[BaseRunner]]] = PluginMap()
     strategies_map: ClassVar[
-        dict[
+        TypePluginMap[
             Tuple[
                 Type[Union[JsonGenStrategy, GradingStrategy]],
                 Type[System],
@@ -58,16 +187,124 @@ class Registry(metaclass=Singleton):
             ],
             Type[Union[JsonGenStrategy, GradingStrategy]],
         ]
-    ] = {}
-    installers_map: ClassVar[dict[str, Type[BaseInstaller]]] = {}
-    systems_map: ClassVar[dict[str, Type[System]]] = {}
-    test_definitions_map: ClassVar[dict[str, Type[TestDefinition]]] = {}
-    agents_map: ClassVar[dict[str, Type[BaseAgent]]] = {}
-    reports_map: ClassVar[dict[Type[TestDefinition], Set[Type[ReportGenerationStrategy]]]] = {}
-    scenario_reports: ClassVar[dict[str, type[Reporter]]] = {}
-    report_configs: ClassVar[dict[str, ReportConfig]] = {}
-    reward_functions_map: ClassVar[dict[str, RewardFunction]] = {}
-    command_gen_strategies_map: ClassVar[dict[tuple[Type[System], Type[TestDefinition]], Type[CommandGenStrategy]]] = {}
+    ] = TypePluginMap()
+    installers_map: ClassVar[PluginMap[str, Type[BaseInstaller]]] = PluginMap()
+    systems_map: ClassVar[PluginMap[str, Type[System]]] = PluginMap()
+    test_definitions_map: ClassVar[PluginMap[str, Type[TestDefinition]]] = PluginMap()
+    agents_map: ClassVar[PluginMap[str, Type[BaseAgent]]] = PluginMap()
+    reports_map: ClassVar[TypePluginMap[Type[TestDefinition], Set[Type[ReportGenerationStrategy]]]] = TypePluginMap()
+    scenario_reports: ClassVar[PluginMap[str, type[Reporter]]] = PluginMap()
+    report_configs: ClassVar[PluginMap[str, ReportConfig]] = PluginMap()
+    reward_functions_map: ClassVar[PluginMap[str, RewardFunction]] = PluginMap()
+    command_gen_strategies_map: ClassVar[
+        TypePluginMap[tuple[Type[System], Type[TestDefinition]], Type[CommandGenStrategy]]
+    ] = TypePluginMap()
+
+    def add_plugin(
+        self,
+        module: str,
+        register: Callable[[], None],
+        *,
+        runners: Iterable[str] = (),
+        installers: Iterable[str] = (),
+        systems: Iterable[str] = (),
+        test_definitions: Iterable[str] = (),
+        agents: Iterable[str] = (),
+        scenario_reports: Iterable[str] = (),
+        reward_functions: Iterable[str] = (),
+    ) -> None:
+        """
+        Declare a plugin without importing it.
+
+        The plugin is registered by calling `register` on first lookup of any of the declared names, or of a test
+        definition type defined in `module` or its submodules.
+
+        Args:
+            module (str): Module (package) that implements the plugin.
+            register (Callable[[], None]): Function that imports the plugin and registers its implementations.
+            runners (Iterable[str]): Runner names provided by the plugin.
+            installers (Iterable[str]): Installer names provided by the plugin.
+            systems (Iterable[str]): System names provided by the plugin.
+            test_definitions (Iterable[str]): Test definition names provided by the plugin.
+            agents (Iterable[str]): Agent names provided by the plugin.
+            scenario_reports (Iterable[str]): Scenario report names provided by the plugin.
+            reward_functions (Iterable[str]): Reward function names provided by the plugin.
+
+        Raises:
+            ValueError: If the plugin is already declared.
+        """
+        if module in self.plugins:
+            raise ValueError(f"Duplicating plugin '{module}'.")
+        self.plugins[module] = register
+
+        declarations: list[tuple[Iterable[str], list[PluginMap]]] = [
+            (runners, [self.runners_map]),
+            (installers, [self.installers_map]),
+            (systems, [self.systems_map]),
+            (test_definitions, [self.test_definitions_map]),
+            (agents, [self.agents_map]),
+            (scenario_reports, [self.scenario_reports, self.report_configs]),
+            (reward_functions, [self.reward_functions_map]),
+        ]
+        for names, maps in declarations:
+            for name in names:
+                for plugin_map in maps:
+                    plugin_map.declared[name] = module
+
+    def load_plugin(self, module: str) -> None:
+        """
+        Register a declared plugin, does nothing if it is already registered.
+
+        Concurrent lookups wait until the plugin is registered. If registration fails, the plugin stays declared and
+        the error is raised again on the next lookup.
+
+        Args:
+            module (str): Module of the plugin.
+        """
+        with PLUGINS_LOCK:
+            register = self.plugins.pop(module, None)
+            if register is None:
+                return
+
+            logging.debug(f"Registering plugin {module}")
+            try:
+                register()
+            except Exception:
+                self.plugins[module] = register
+                raise
+            for plugin_map in self.name_maps():
+                plugin_map.sort_declared()
+
+    def load_all_plugins(self) -> None:
+        for module in list(self.plugins):
+            self.load_plugin(module)
+
+    def plugin_for_type(self, cls: type) -> Optional[str]:
+        """
+        Find a not yet registered plugin that defines a type.
+
+        Args:
+            cls (type): The type, e.g. a test definition.
+
+        Returns:
+            Optional[str]: Module of the plugin or None if the type does not belong to a pending plugin.
+        """
+        for module in self.plugins:
+            if cls.__module__ == module or cls.__module__.startswith(f"{module}."):
+                return module
+        return None
+
+    def name_maps(self) -> list[PluginMap]:
+        return [
+            self.runners_map,
+            self.installers_map,
+            self.systems_map,
+            self.test_definitions_map,
+            self.agents_map,
+            self.scenario_reports,
+            self.report_configs,
+            self.reward_functions_map,
+        ]
 
     def add_runner(self, name: str, value: Type[BaseRunner]) -> None:
         """
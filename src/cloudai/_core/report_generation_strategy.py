@@ -18,7 +18,7 @@ from abc import ABC, abstractmethod
 from typing import ClassVar
 
 from .system import System
-from .test_scenario import TestRun
+from .test_scenario import METRIC_ERROR, TestRun
 
 
 class ReportGenerationStrategy(ABC):
@@ -33,6 +33,17 @@ class ReportGenerationStrategy(ABC):
     def get_metric(self, metric: str) -> float:
         return 0.0
 
+    def get_live_metric(self, metric: str) -> float:
+        """
+        Compute a metric from the output of a job that is still running.
+
+        Used to stop DSE steps early, strategies that can evaluate partial output override it.
+
+        Returns:
+            float: The metric value or METRIC_ERROR if it cannot be computed yet.
+        """
+        return METRIC_ERROR
+
     @abstractmethod
     def can_handle_directory(self) -> bool: ...
 
@@ -137,6 +137,19 @@ class System(ABC):
         logging.error(error_message)
         raise NotImplementedError(error_message)
 
+    def update_jobs_state(self, jobs: list["BaseJob"]) -> None:
+        """
+        Refresh the state of all given jobs with a single query to the underlying scheduler.
+
+        Runners call this once per monitoring tick before checking individual jobs, so systems that support batched
+        status queries can serve subsequent `is_job_running` and `is_job_completed` calls from the fetched state.
+        Default implementation does nothing and every job is checked individually.
+
+        Args:
+            jobs (list[BaseJob]): The jobs that are currently tracked by the runner.
+        """
+        return
+
     @abstractmethod
     def kill(self, job: "BaseJob") -> None:
         """
@@ -16,16 +16,20 @@
 
 from __future__ import annotations
 
-import copy
-import itertools
+import dataclasses
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, List, Optional, Set, Type, Union
+from typing import TYPE_CHECKING, Any, Iterator, List, Optional, Set, Type, Union
 
+from cloudai.util.lazy_imports import lazy
+
+from .parameter_space import ParameterSpace
 from .system import System
 from .test_template_strategy import TestTemplateStrategy
 
 if TYPE_CHECKING:
+    import numpy as np
+
     from .report_generation_strategy import ReportGenerationStrategy
     from .test import Test
 
@@ -107,6 +111,13 @@ class TestRun:
 
         return report(system, self).get_metric(metric)
 
+    def get_live_metric_value(self, system: System, metric: str) -> float:
+        report = self.metric_reporter
+        if report is None:
+            return METRIC_ERROR
+
+        return report(system, self).get_live_metric(metric)
+
     @property
     def is_dse_job(self) -> bool:
         return self.test.test_definition.is_dse_job or isinstance(self.num_nodes, list)
@@ -133,23 +144,62 @@ class TestRun:
         return action_space
 
     @property
-    def all_combinations(self) -> list[dict[str, Any]]:
+    def all_combinations(self) -> ParameterSpace:
         if not self.is_dse_job:
-            return []
+            return ParameterSpace({})
+
+        return ParameterSpace(self.param_space)
+
+    def is_feasible(self, action: dict[str, Any]) -> bool:
+        """Check whether a combination passes the constraint check of the test definition."""
+        tr = self.apply_params_set(action)
+        return tr.test.test_definition.constraint_check(tr)
+
+    def feasible_mask(self) -> np.ndarray:
+        """
+        Evaluate constraints of the test definition for all combinations of the DSE space.
+
+        The vectorized `TestDefinition.feasible_mask` is used when the definition provides one, otherwise every
+        combination is applied and checked with `constraint_check`.
+
+        Returns:
+            np.ndarray: Boolean array, True for combinations that pass the constraints, in `all_combinations` order.
+        """
+        space = self.all_combinations
+        mask = self.test.test_definition.feasible_mask(self, space)
+        if mask is None:
+            mask = lazy.np.fromiter((self.is_feasible(action) for action in space), dtype=bool, count=len(space))
+        return mask
 
-        param_space: dict[str, Any] = self.param_space
-        if not param_space:
-            return []
+    def feasible_combinations(self) -> Iterator[tuple[int, dict[str, Any]]]:
+        """
+        Iterate over combinations of the DSE space that pass the constraints.
+
+        Yields:
+            tuple[int, dict[str, Any]]: Index of a feasible combination in `all_combinations` and the combination.
+        """
+        space = self.all_combinations
+        for idx in lazy.np.flatnonzero(self.feasible_mask()).tolist():
+            yield idx, space[idx]
 
-        parameter_values: list[Any] = []
-        for _, values in param_space.items():
-            parameter_values.append(values)
-        action_combinations = list(itertools.product(*parameter_values))
+    def variant(self, **changes: Any) -> "TestRun":
+        """
+        Create a lightweight copy of the test run with some fields changed.
 
-        keys = list(param_space.keys())
-        all_combinations = [dict(zip(keys, combination, strict=True)) for combination in action_combinations]
+        Unlike `copy.deepcopy`, the copy shares the test (and thus the test template and the system), hooks and
+        dependency targets with this test run. Only the mutable containers (`nodes`, `dependencies`, `reports`) are
+        copied, so they can be modified independently. To change the test definition, pass a new `test`.
 
-        return all_combinations
+        Args:
+            **changes: Field values to set on the copy.
+
+        Returns:
+            TestRun: The new test run.
+        """
+        changes.setdefault("nodes", list(self.nodes))
+        changes.setdefault("dependencies", dict(self.dependencies))
+        changes.setdefault("reports", set(self.reports))
+        return dataclasses.replace(self, **changes)
 
     def apply_params_set(self, action: dict[str, Any]) -> "TestRun":
         tdef = self.test.test_definition.model_copy(deep=True)
@@ -163,11 +213,11 @@ class TestRun:
                     obj = getattr(obj, attr)
                 setattr(obj, attrs[-1], value)
 
-        new_tr = copy.deepcopy(self)
-        if "NUM_NODES" in action:
-            new_tr.num_nodes = action["NUM_NODES"]
-        new_tr.test.test_definition = type(tdef)(**tdef.model_dump())  # re-create the model to enable validation
-        return new_tr
+        test = type(self.test)(
+            test_definition=type(tdef)(**tdef.model_dump()),  # re-create the model to enable validation
+            test_template=self.test.test_template,
+        )
+        return self.variant(test=test, num_nodes=action.get("NUM_NODES", self.num_nodes))
 
 
 class TestScenario:
@@ -177,6 +227,8 @@ class TestScenario:
     Attributes
         name (str): Unique name of the test scenario.
         tests (List[Test]): Tests in the scenario.
+        dependents (dict[str, dict[Test, list[TestRun]]]): Reverse dependency index, maps dependency type and the
+            test of a test run to the test runs that depend on it. Rebuilt on every assignment to `test_runs`.
         job_status_check (bool): Flag indicating whether to check the job status or not.
     """
 
@@ -192,9 +244,35 @@ class TestScenario:
             job_status_check (bool): Flag indicating whether to check the job status or not.
         """
         self.name = name
+        self.dependents: dict[str, dict[Test, list[TestRun]]] = {}
         self.test_runs = test_runs
         self.job_status_check = job_status_check
 
+    @property
+    def test_runs(self) -> List[TestRun]:
+        return self._test_runs
+
+    @test_runs.setter
+    def test_runs(self, value: List[TestRun]) -> None:
+        self._test_runs = value
+        self.dependents = {}
+        for tr in value:
+            for dep_type, dep in tr.dependencies.items():
+                self.dependents.setdefault(dep_type, {}).setdefault(dep.test_run.test, []).append(tr)
+
+    def get_dependents(self, dep_type: str, test_run: TestRun) -> List[TestRun]:
+        """
+        Get test runs that have a dependency of the given type on a test run.
+
+        Args:
+            dep_type (str): Dependency type, e.g. 'start_post_init', 'start_post_comp' or 'end_post_comp'.
+            test_run (TestRun): The test run others depend on.
+
+        Returns:
+            List[TestRun]: Dependent test runs in scenario order.
+        """
+        return self.dependents.get(dep_type, {}).get(test_run.test, [])
+
     def __repr__(self) -> str:
         """
         Return a string representation of the TestScenario instance.
@@ -40,7 +40,7 @@ from cloudai.core import (
     TestScenario,
 )
 from cloudai.models.scenario import ReportConfig
-from cloudai.parser import HOOK_ROOT
+from cloudai.parser import HOOK_ROOT, LazyTomlMapping
 from cloudai.systems.slurm import SingleSbatchRunner, SlurmSystem
 from cloudai.util import prepare_output_dir
 
@@ -132,16 +132,18 @@ def handle_dse_job(runner: Runner, args: argparse.Namespace):
             continue
 
         agent = agent_class(env)
-        for step in range(agent.max_steps):
-            result = agent.select_action()
-            if result is None:
+        parallel_steps = test_run.test.test_definition.agent_parallel_steps
+        steps_left = agent.max_steps
+        while steps_left > 0:
+            actions = agent.select_actions(min(parallel_steps, steps_left))
+            if not actions:
                 break
-            step, action = result
-            env.test_run.step = step
-            observation, reward, done, info = env.step(action)
-            feedback = {"trial_index": step, "value": reward}
-            agent.update_policy(feedback)
-            logging.info(f"Step {step}: Observation: {observation}, Reward: {reward}")
+            steps_left -= len(actions)
+
+            for (step, _), (observation, reward, _, _) in zip(actions, env.step_batch(actions), strict=True):
+                feedback = {"trial_index": step, "value": reward}
+                agent.update_policy(feedback)
+                logging.info(f"Step {step}: Observation: {observation}, Reward: {reward}")
 
     if args.mode == "run":
         runner.runner.test_scenario.test_runs = original_test_runs
@@ -195,6 +197,14 @@ def register_signal_handlers(signal_handler: Callable) -> None:
         signal.signal(sig, signal_handler)
 
 
+def log_dse_spaces(test_scenario: TestScenario) -> None:
+    for tr in test_scenario.test_runs:
+        if not tr.is_dse_job:
+            continue
+        num_feasible = int(tr.feasible_mask().sum())
+        logging.info(f"DSE space of {tr.name}: {len(tr.all_combinations)} combinations, {num_feasible} are feasible.")
+
+
 def handle_dry_run_and_run(args: argparse.Namespace) -> int:
     parser = Parser(args.system_config)
     system, tests, test_scenario = parser.parse(args.tests_dir, args.test_scenario)
@@ -240,6 +250,7 @@ def handle_dry_run_and_run(args: argparse.Namespace) -> int:
     runner = Runner(args.mode, system, test_scenario)
     register_signal_handlers(runner.cancel_on_signal)
 
+    log_dse_spaces(test_scenario)
     has_dse = any(tr.is_dse_job for tr in test_scenario.test_runs)
     if args.single_sbatch or not has_dse:  # in this mode cases are unrolled using grid search
         handle_non_dse_job(runner, args)
@@ -373,9 +384,7 @@ def verify_test_configs(test_tomls: List[Path], strict: bool) -> int:
     for test_toml in test_tomls:
         logging.debug(f"Verifying Test: {test_toml}...")
         try:
-            with test_toml.open() as fh:
-                tp.current_file = test_toml
-                tp.load_test_definition(toml.load(fh), strict)
+            tp.load_test_toml(test_toml, strict)
         except Exception:
             nfailed += 1
 
@@ -399,10 +408,10 @@ def verify_test_scenarios(
     for scenario_file in scenario_tomls:
         logging.debug(f"Verifying Test Scenario: {scenario_file}...")
         try:
-            tests = Parser.parse_tests(test_tomls, system)
-            hook_tests = Parser.parse_tests(hook_test_tomls, system)
-            hooks = Parser.parse_hooks(hook_tomls, system, {t.name: t for t in hook_tests})
-            Parser.parse_test_scenario(scenario_file, system, {t.name: t for t in tests}, hooks, strict)
+            tests = LazyTomlMapping(test_tomls, lambda path: Parser.parse_tests([path], system)[0])
+            hook_tests = LazyTomlMapping(hook_test_tomls, lambda path: Parser.parse_tests([path], system)[0])
+            hooks = Parser.parse_hooks(hook_tomls, system, hook_tests)
+            Parser.parse_test_scenario(scenario_file, system, tests, hooks, strict)
         except Exception:
             nfailed += 1
 
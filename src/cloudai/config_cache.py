@@ -0,0 +1,148 @@
+# SPDX-FileCopyrightText: NVIDIA CORPORATION & AFFILIATES
+# Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import copy
+import functools
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path
+from typing import Any, Callable, Optional, TypeVar
+
+import toml
+from pydantic import BaseModel
+
+T = TypeVar("T", bound=BaseModel)
+
+CACHE_DIR_ENV = "CLOUDAI_CONFIG_CACHE_DIR"
+
+
+@functools.cache
+def code_fingerprint() -> str:
+    """
+    Fingerprint of the installed cloudai version and its sources.
+
+    Sources are included so that editable installs do not reuse results produced by a different revision of the code.
+    Only file sizes and modification times are hashed, this takes a few milliseconds. When cloudai is not installed
+    (e.g. sources are used directly via PYTHONPATH), only the sources are hashed.
+    """
+    try:
+        installed = version("cloudai")
+    except PackageNotFoundError:
+        installed = "unknown"
+
+    digest = hashlib.sha256(installed.encode())
+    for path in sorted(Path(__file__).parent.rglob("*.py")):
+        stat = path.stat()
+        digest.update(f"{path}:{stat.st_size}:{stat.st_mtime_ns}".encode())
+    return digest.hexdigest()
+
+
+def default_cache_dir() -> Optional[Path]:
+    """
+    Directory for the TOML parse cache.
+
+    The cache is disabled by default, it is enabled by setting the CLOUDAI_CONFIG_CACHE_DIR environment variable to a
+    directory.
+    """
+    value = os.environ.get(CACHE_DIR_ENV)
+    return Path(value) if value else None
+
+
+class ConfigCache:
+    """
+    On-disk cache of parsed TOML configuration files.
+
+    Every configuration file has a single entry keyed by the kind of the model and the resolved file path. An entry
+    stores the parsed TOML data as JSON together with the hash of the file content, it is used only when the hash
+    matches, otherwise the file is parsed again and the entry is overwritten. Only parsing is skipped, the data is
+    always validated, so checks that depend on the environment (e.g. existence of mounted paths) are not skipped. Files
+    that fail validation are never cached, so their errors are reported on every run.
+
+    Attributes
+        root (Optional[Path]): Directory where entries are stored, None disables the cache.
+    """
+
+    def __init__(self, root: Optional[Path]) -> None:
+        self.root = root
+
+    def entry_path(self, kind: str, path: Path) -> Path:
+        assert self.root is not None
+        name = hashlib.sha256(f"{kind}:{path.resolve()}".encode()).hexdigest()
+        return self.root / f"{name}.json"
+
+    def load(self, path: Path, kind: str, validate: Callable[[dict[str, Any]], T]) -> T:
+        """
+        Load a validated model for a TOML file, using the cached TOML data if possible.
+
+        Args:
+            path (Path): Path to the TOML file.
+            kind (str): Kind of the model, e.g. "test" or "scenario".
+            validate (Callable[[dict[str, Any]], T]): Function that validates the TOML data and returns the model.
+
+        Returns:
+            T: The validated model.
+        """
+        content = path.read_bytes()
+        if self.root is None:
+            return validate(toml.loads(content.decode()))
+
+        content_hash = hashlib.sha256(content).hexdigest()
+        entry = self.entry_path(kind, path)
+        cached = self._get(entry, content_hash)
+        if cached is not None:
+            logging.debug(f"Using cached {kind} TOML data for {path}")
+            return validate(cached)
+
+        data = toml.loads(content.decode())
+        model = validate(copy.deepcopy(data))
+        self._put(entry, content_hash, data)
+        return model
+
+    def _get(self, entry: Path, content_hash: str) -> Optional[dict[str, Any]]:
+        try:
+            with entry.open("r") as f:
+                cached = json.load(f)
+            cached_hash, data = cached["content_hash"], cached["data"]
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logging.debug(f"Ignoring invalid config cache entry {entry}: {e}")
+            return None
+
+        if cached_hash != content_hash or not isinstance(data, dict):
+            return None
+        return data
+
+    def _put(self, entry: Path, content_hash: str, data: dict[str, Any]) -> None:
+        tmp_path: Optional[Path] = None
+        try:
+            entry.parent.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile("w", dir=entry.parent, suffix=".tmp", delete=False) as f:
+                tmp_path = Path(f.name)
+                json.dump({"content_hash": content_hash, "data": data}, f)
+            os.replace(tmp_path, entry)
+        except Exception as e:
+            logging.debug(f"Failed to write config cache entry {entry}: {e}")
+            if tmp_path is not None:
+                tmp_path.unlink(missing_ok=True)
+
+
+def config_cache() -> ConfigCache:
+    return ConfigCache(default_cache_dir())
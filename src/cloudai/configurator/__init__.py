@@ -16,12 +16,16 @@
 
 from .base_agent import BaseAgent
 from .base_gym import BaseGym
+from .bayesian_optimization import BayesianOptimizationAgent
 from .cloudai_gym import CloudAIGymEnv
+from .dse_cache import DSEResultCache
 from .grid_search import GridSearchAgent
 
 __all__ = [
     "BaseAgent",
     "BaseGym",
+    "BayesianOptimizationAgent",
     "CloudAIGymEnv",
+    "DSEResultCache",
     "GridSearchAgent",
 ]
@@ -15,7 +15,7 @@
 # limitations under the License.
 
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Tuple
+from typing import Any, Dict, List, Tuple
 
 from .base_gym import BaseGym
 
@@ -58,6 +58,27 @@ class BaseAgent(ABC):
         """
         pass
 
+    def select_actions(self, n: int) -> List[Tuple[int, Dict[str, Any]]]:
+        """
+        Select up to `n` actions at once, to be evaluated concurrently.
+
+        Default implementation calls `select_action` repeatedly, agents that need feedback between actions can override
+        it to return fewer actions.
+
+        Args:
+            n (int): Maximum number of actions to select.
+
+        Returns:
+            List[Tuple[int, Dict[str, Any]]]: Selected (step, action) pairs, empty when no more actions are available.
+        """
+        actions = []
+        for _ in range(n):
+            result = self.select_action()
+            if result is None:
+                break
+            actions.append(result)
+        return actions
+
     @abstractmethod
     def update_policy(self, _feedback: Dict[str, Any]) -> None:
         """
@@ -0,0 +1,234 @@
+# SPDX-FileCopyrightText: NVIDIA CORPORATION & AFFILIATES
+# Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import logging
+import math
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+
+from cloudai.core import ParameterSpace
+from cloudai.util.lazy_imports import lazy
+
+from .base_agent import BaseAgent
+from .cloudai_gym import CloudAIGymEnv
+
+if TYPE_CHECKING:
+    import numpy as np
+
+LENGTH_SCALES = (0.1, 0.2, 0.5, 1.0)
+NOISE = 1e-6
+
+
+def norm_pdf(z: np.ndarray) -> np.ndarray:
+    return lazy.np.exp(-0.5 * z**2) / math.sqrt(2 * math.pi)
+
+
+def norm_cdf(z: np.ndarray) -> np.ndarray:
+    # Abramowitz and Stegun 7.1.26 approximation of erf, absolute error below 1.5e-7
+    x = lazy.np.abs(z) / math.sqrt(2)
+    t = 1.0 / (1.0 + 0.3275911 * x)
+    poly = t * (0.254829592 + t * (-0.284496736 + t * (1.421413741 + t * (-1.453152027 + t * 1.061405429))))
+    erf = 1.0 - poly * lazy.np.exp(-(x**2))
+    return 0.5 * (1.0 + lazy.np.sign(z) * erf)
+
+
+def expected_improvement(mean: np.ndarray, std: np.ndarray, best: float, xi: float) -> np.ndarray:
+    improvement = mean - best - xi
+    z = improvement / std
+    return improvement * norm_cdf(z) + std * norm_pdf(z)
+
+
+class GaussianProcess:
+    """
+    Gaussian process regression with an RBF kernel on points in the unit hypercube.
+
+    Targets are standardized, the length scale is selected from `LENGTH_SCALES` by the marginal likelihood.
+    """
+
+    def __init__(self, x: np.ndarray, y: np.ndarray) -> None:
+        self.x = x
+        self.y_mean = float(y.mean())
+        self.y_std = float(y.std()) or 1.0
+        self.y = (y - self.y_mean) / self.y_std
+        self.length_scale = LENGTH_SCALES[0]
+        self.chol = lazy.np.eye(len(x))
+        self.alpha = lazy.np.zeros(len(x))
+
+        best_likelihood = -math.inf
+        for length_scale in LENGTH_SCALES:
+            chol = lazy.np.linalg.cholesky(self.kernel(x, x, length_scale) + NOISE * lazy.np.eye(len(x)))
+            alpha = lazy.np.linalg.solve(chol.T, lazy.np.linalg.solve(chol, self.y))
+            likelihood = -0.5 * float(self.y @ alpha) - float(lazy.np.log(lazy.np.diag(chol)).sum())
+            if likelihood > best_likelihood:
+                best_likelihood = likelihood
+                self.length_scale, self.chol, self.alpha = length_scale, chol, alpha
+
+    @staticmethod
+    def kernel(a: np.ndarray, b: np.ndarray, length_scale: float) -> np.ndarray:
+        sq_dist = ((a[:, None, :] - b[None, :, :]) ** 2).sum(axis=-1)
+        return lazy.np.exp(-0.5 * sq_dist / length_scale**2)
+
+    def predict(self, x: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Predict mean and standard deviation in standardized units."""
+        k = self.kernel(x, self.x, self.length_scale)
+        mean = k @ self.alpha
+        v = lazy.np.linalg.solve(self.chol, k.T)
+        var = lazy.np.clip(1.0 - (v**2).sum(axis=0), 1e-12, None)
+        return mean, lazy.np.sqrt(var)
+
+
+class BayesianOptimizationAgent(BaseAgent):
+    """
+    Agent using Bayesian optimization to find the best parameter combination in few steps.
+
+    Rewards are modelled with a Gaussian process over parameter value indices scaled to [0, 1]. The first steps are
+    random, then every step evaluates the combination with the highest expected improvement. Batches are selected with
+    the constant liar heuristic: selected combinations are added to the model with the worst observed reward until
+    their real reward is known. Constraints of the test definition are evaluated for the whole space up front, so
+    infeasible combinations are never selected.
+
+    The search stops after `agent_steps` steps or when the expected improvement of all candidates is below a
+    tolerance. Options are taken from `agent_config` of the test definition:
+        seed (int): Seed of the random number generator.
+        num_initial (int): Number of random steps, 5 by default. Steps are random until the first reward is observed
+            even when it is 0.
+        max_candidates (int): Number of candidates scored per step, larger spaces are sampled, 2048 by default.
+        tolerance (float): Expected improvement, in standard deviations of observed rewards, below which the search
+            is considered converged, 1e-3 by default.
+        xi (float): Exploration margin of the expected improvement, 0.01 by default.
+    """
+
+    def __init__(self, env: CloudAIGymEnv):
+        self.env = env
+        self.action_space = env.define_action_space()
+        self.space = ParameterSpace(self.action_space)
+        self.sizes = lazy.np.array([len(values) for values in self.space.values], dtype=lazy.np.int64)
+        tdef = env.test_run.test.test_definition
+        self.available = env.feasible_mask().copy()
+        self.max_steps = min(tdef.agent_steps, int(self.available.sum()))
+        self.step = 0
+        self.observed: Dict[int, float] = {}
+        self.pending: Dict[int, int] = {}
+        self.converged = False
+        self.rng = lazy.np.random.default_rng()
+        self.num_initial = 5
+        self.max_candidates = 2048
+        self.tolerance = 1e-3
+        self.xi = 0.01
+        self.configure(tdef.agent_config)
+
+    def configure(self, config: Dict[str, Any]) -> None:
+        """
+        Configure the search, see the class description for available options.
+
+        Args:
+            config (Dict[str, Any]): Agent options.
+        """
+        self.rng = lazy.np.random.default_rng(config.get("seed"))
+        self.num_initial = int(config.get("num_initial", self.num_initial))
+        self.max_candidates = int(config.get("max_candidates", self.max_candidates))
+        self.tolerance = float(config.get("tolerance", self.tolerance))
+        self.xi = float(config.get("xi", self.xi))
+
+    def encode(self, indices: np.ndarray) -> np.ndarray:
+        """Convert combination indices to points in the unit hypercube, one coordinate per parameter."""
+        digits = lazy.np.empty((len(indices), len(self.sizes)), dtype=lazy.np.float64)
+        rest = lazy.np.asarray(indices, dtype=lazy.np.int64)
+        for col in range(len(self.sizes) - 1, -1, -1):
+            rest, digits[:, col] = lazy.np.divmod(rest, self.sizes[col])
+        return digits / lazy.np.maximum(self.sizes - 1, 1)
+
+    def candidates(self) -> np.ndarray:
+        """Return indices of feasible combinations that were not selected yet, sampled for large spaces."""
+        candidates = lazy.np.flatnonzero(self.available)
+        if len(candidates) <= self.max_candidates:
+            return candidates
+        return lazy.np.sort(self.rng.choice(candidates, size=self.max_candidates, replace=False))
+
+    def select_actions(self, n: int) -> List[Tuple[int, Dict[str, Any]]]:
+        """
+        Select up to `n` combinations to evaluate concurrently.
+
+        Args:
+            n (int): Maximum number of actions to select.
+
+        Returns:
+            List[Tuple[int, Dict[str, Any]]]: Selected (step, action) pairs, empty when the search is complete.
+        """
+        actions: List[Tuple[int, Dict[str, Any]]] = []
+        lies: List[int] = []
+        while len(actions) < n and self.step < self.max_steps and not self.converged:
+            idx = self.propose(lies)
+            if idx is None:
+                break
+
+            self.available[idx] = False
+            self.step += 1
+            self.pending[self.step] = idx
+            lies.append(idx)
+            actions.append((self.step, self.space[idx]))
+        return actions
+
+    def propose(self, lies: List[int]) -> Optional[int]:
+        candidates = self.candidates()
+        if len(candidates) == 0:
+            return None
+
+        # the model needs at least one observed reward, e.g. with num_initial = 0 or after limit violations
+        if not self.observed or len(self.observed) < self.num_initial:
+            return int(self.rng.choice(candidates))
+
+        indices = list(self.observed) + lies
+        rewards = list(self.observed.values())
+        y = lazy.np.array(rewards + [min(rewards)] * len(lies))
+        gp = GaussianProcess(self.encode(lazy.np.array(indices)), y)
+        mean, std = gp.predict(self.encode(candidates))
+        ei = expected_improvement(mean, std, float(gp.y.max()), self.xi)
+
+        best = int(lazy.np.argmax(ei))
+        if not lies and ei[best] < self.tolerance:
+            logging.info(f"Bayesian optimization converged after {len(self.observed)} steps")
+            self.converged = True
+            return None
+        return int(candidates[best])
+
+    def select_action(self) -> Tuple[int, Dict[str, Any]]:
+        """
+        Select the next combination to evaluate.
+
+        Returns:
+            Tuple[int, Dict[str, Any]]: The step number and the selected action.
+
+        Raises:
+            IndexError: If the search is complete.
+        """
+        actions = self.select_actions(1)
+        if not actions:
+            raise IndexError("No more actions to select")
+        return actions[0]
+
+    def update_policy(self, _feedback: Dict[str, Any]) -> None:
+        """
+        Record the reward of a selected combination.
+
+        Args:
+            feedback (Dict[str, Any]): Step number as `trial_index` and reward as `value`.
+        """
+        idx = self.pending.pop(_feedback["trial_index"], None)
+        reward = float(_feedback["value"])
+        if idx is not None and math.isfinite(reward):  # combinations that violate objective limits are not modelled
+            self.observed[idx] = reward
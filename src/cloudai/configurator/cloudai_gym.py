@@ -18,12 +18,23 @@ import asyncio
 import copy
 import csv
 import logging
-from typing import Any, Dict, Optional, Tuple
+import math
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
-from cloudai.core import METRIC_ERROR, Registry, Runner, TestRun
+import toml
+
+from cloudai.core import METRIC_ERROR, CommandGenStrategy, Registry, Runner, TestRun
 from cloudai.util.lazy_imports import lazy
 
 from .base_gym import BaseGym
+from .dse_cache import DSEResultCache
+from .pareto import PARETO_FRONT_FILE_NAME, ParetoFront
+from .reward_functions import weighted_reward
+
+if TYPE_CHECKING:
+    import numpy as np
 
 
 class CloudAIGymEnv(BaseGym):
@@ -42,10 +53,23 @@ class CloudAIGymEnv(BaseGym):
             runner (Runner): The runner object to execute jobs.
         """
         self.test_run = test_run
-        self.original_test_run = copy.deepcopy(test_run) 
+        self.original_test_run = copy.deepcopy(test_run)
         self.runner = runner
         self.max_steps = test_run.test.test_definition.agent_steps
         self.reward_function = Registry().get_reward_function(test_run.test.test_definition.agent_reward_function)
+        self.results_cache: Optional[DSEResultCache] = None
+        if runner.runner.mode == "run":
+            self.results_cache = DSEResultCache(runner.runner.system.output_path / "dse_cache")
+        self.best_reward: Optional[float] = None
+        self.live_since: Dict[int, float] = {}
+        self.partial_observations: Dict[int, list] = {}
+        self._feasible_mask: Optional["np.ndarray"] = None
+        tdef = test_run.test.test_definition
+        self.pareto_front: Optional[ParetoFront] = None
+        if tdef.agent_objectives:
+            self.pareto_front = ParetoFront(tdef.agent_metrics, tdef.agent_objectives)
+        if runner.runner.mode == "run" and test_run.test.test_definition.agent_early_stop:
+            runner.runner.early_stop = self.should_stop_early
         super().__init__()
 
     def define_action_space(self) -> Dict[str, Any]:
@@ -98,40 +122,79 @@ class CloudAIGymEnv(BaseGym):
                 - done (bool): Whether the episode is done.
                 - info (dict): Additional info for debugging.
         """
-        self.test_run = self.test_run.apply_params_set(action)
-
-        if not self.test_run.test.test_definition.constraint_check(self.test_run):
-            logging.info("Constraint check failed. Skipping step.")
-            return [-1.0], -1.0, True, {}
-
-        logging.info(f"Running step {self.test_run.step} with action {action}")
-        new_tr = copy.deepcopy(self.test_run)
-        new_tr.output_path = self.runner.runner.get_job_output_path(new_tr)
-        self.runner.runner.test_scenario.test_runs = [new_tr]
-
-        self.runner.runner.shutting_down = False
-        self.runner.runner.jobs.clear()
-        self.runner.runner.testrun_to_job_map.clear()
+        return self.step_batch([(self.test_run.step, action)])[0]
 
-        asyncio.run(self.runner.run())
-        self.test_run = self.runner.runner.test_scenario.test_runs[0]
-
-        if (
-            self.runner.runner.test_scenario.test_runs
-            and self.runner.runner.test_scenario.test_runs[0].output_path.exists()
-        ):
-            self.test_run = self.runner.runner.test_scenario.test_runs[0]
-        else:
-            self.test_run = copy.deepcopy(self.original_test_run)
-            self.test_run.step = new_tr.step
-            self.test_run.output_path = new_tr.output_path
+    def step_batch(self, actions: List[Tuple[int, Any]]) -> List[Tuple[list, float, bool, dict]]:
+        """
+        Execute several steps in the environment concurrently.
 
-        observation = self.get_observation(action)
-        reward = self.compute_reward(observation)
+        All actions that pass the constraint check are submitted to the runner as one scenario, so their jobs run in
+        parallel. Results are returned in the order of actions.
 
-        self.write_trajectory(self.test_run.step, action, reward, observation)
+        Args:
+            actions (List[Tuple[int, Any]]): Pairs of step number and action chosen by the agent.
 
-        return observation, reward, False, {}
+        Returns:
+            List[Tuple]: A (observation, reward, done, info) tuple for every action, see `step`.
+        """
+        results: Dict[int, Tuple[list, float, bool, dict]] = {}
+        to_run: List[Tuple[int, TestRun, Any]] = []
+        for idx, (step, action) in enumerate(actions):
+            self.test_run = self.test_run.apply_params_set(action)
+            self.test_run.step = step
+
+            if not self.test_run.test.test_definition.constraint_check(self.test_run):
+                logging.info(f"Constraint check failed for step {step}. Skipping step.")
+                results[idx] = ([-1.0], -1.0, True, {})
+                continue
+
+            cached = self.results_cache.get(self.runner.runner.system, self.test_run) if self.results_cache else None
+            if cached is not None:
+                logging.info(f"Step {step} with action {action} was already measured, using cached result.")
+                self.store_cached_step()
+                reward = self.compute_reward(cached)
+                self.update_best_reward(cached, reward)
+                self.update_pareto_front(step, action, cached)
+                self.write_trajectory(step, action, reward, cached)
+                results[idx] = (cached, reward, False, {})
+                continue
+
+            logging.info(f"Running step {step} with action {action}")
+            new_tr = self.test_run.variant()
+            new_tr.output_path = self.runner.runner.get_job_output_path(new_tr)
+            to_run.append((idx, new_tr, action))
+
+        if to_run:
+            self.runner.runner.test_scenario.test_runs = [new_tr for _, new_tr, _ in to_run]
+
+            self.runner.runner.shutting_down = False
+            self.runner.runner.jobs.clear()
+            self.runner.runner.testrun_to_job_map.clear()
+            self.runner.runner.pending_submissions.clear()
+
+            asyncio.run(self.runner.run())
+
+        for idx, new_tr, action in to_run:
+            measured = new_tr.output_path.exists()
+            if measured:
+                self.test_run = new_tr
+            else:
+                self.test_run = self.original_test_run.variant(step=new_tr.step, output_path=new_tr.output_path)
+
+            partial_observation = self.partial_observations.pop(new_tr.step, None)
+            stopped_early = partial_observation is not None
+            observation = partial_observation if partial_observation is not None else self.get_observation(action)
+            reward = self.compute_reward(observation)
+            if not stopped_early:
+                self.update_best_reward(observation, reward)
+                self.update_pareto_front(self.test_run.step, action, observation)
+                if measured and self.results_cache:
+                    self.results_cache.put(self.runner.runner.system, self.test_run, observation)
+
+            self.write_trajectory(self.test_run.step, action, reward, observation)
+            results[idx] = (observation, reward, False, {"stopped_early": True} if stopped_early else {})
+
+        return [results[idx] for idx in range(len(actions))]
 
     def render(self, mode: str = "human"):
         """
@@ -156,14 +219,67 @@ class CloudAIGymEnv(BaseGym):
         """
         Compute a reward based on the TestRun result.
 
+        When the test definition has `agent_objectives`, the reward is their weighted sum, see `weighted_reward`.
+
         Args:
             observation (list): The observation list containing the average value.
 
         Returns:
             float: Reward value.
         """
+        tdef = self.test_run.test.test_definition
+        if tdef.agent_objectives:
+            return weighted_reward(observation, tdef.agent_metrics, tdef.agent_objectives)
         return self.reward_function(observation)
 
+    def feasible_mask(self) -> "np.ndarray":
+        """Evaluate constraints for all combinations of the action space once, see `TestRun.feasible_mask`."""
+        if self._feasible_mask is None:
+            self._feasible_mask = self.original_test_run.feasible_mask()
+        return self._feasible_mask
+
+    def update_best_reward(self, observation: list, reward: float) -> None:
+        if any(v == METRIC_ERROR for v in observation) or not math.isfinite(reward):
+            return
+        if self.best_reward is None or reward > self.best_reward:
+            self.best_reward = reward
+
+    def should_stop_early(self, tr: TestRun) -> bool:
+        """
+        Check whether a running step is dominated by the best step observed so far.
+
+        Called by the runner on every monitoring tick. The observation that triggered the stop is kept as the partial
+        observation of the step.
+
+        Args:
+            tr (TestRun): The running step.
+
+        Returns:
+            bool: True if the step should be stopped.
+        """
+        config = tr.test.test_definition.agent_early_stop
+        if config is None or self.best_reward is None:
+            return False
+
+        started = self.live_since.setdefault(tr.step, time.monotonic())
+        if time.monotonic() - started < config.min_runtime:
+            return False
+
+        observation = [
+            tr.get_live_metric_value(self.runner.runner.system, metric)
+            for metric in tr.test.test_definition.agent_metrics
+        ]
+        if any(v == METRIC_ERROR for v in observation):
+            return False
+
+        reward = self.compute_reward(observation)
+        if not config.is_dominated(reward, self.best_reward):
+            return False
+
+        logging.info(f"Step {tr.step} is dominated: live reward {reward} vs best reward {self.best_reward}")
+        self.partial_observations[tr.step] = observation
+        return True
+
     def get_observation(self, action: Any) -> list:
         """
         Get the observation from the TestRun object.
@@ -186,6 +302,33 @@ class CloudAIGymEnv(BaseGym):
             observation.append(v)
         return observation
 
+    def store_cached_step(self) -> None:
+        """
+        Dump the current step to its output directory without running it.
+
+        Reports read the test definition of a step from its dump, e.g. to write the best or Pareto-optimal configs, so
+        cached steps get one as well. No commands are generated for them.
+        """
+        from cloudai.models.scenario import TestRunDetails  # cloudai.models depends on cloudai.core
+
+        self.test_run.output_path = self.runner.runner.get_job_output_path(self.test_run)
+        trd = TestRunDetails.from_test_run(self.test_run, test_cmd="", full_cmd="")
+        with (self.test_run.output_path / CommandGenStrategy.TEST_RUN_DUMP_FILE_NAME).open("w") as f:
+            toml.dump(trd.model_dump(), f)
+
+    @property
+    def iteration_dir(self) -> Path:
+        return self.runner.runner.scenario_root / self.test_run.name / f"{self.test_run.current_iteration}"
+
+    def update_pareto_front(self, step: int, action: Any, observation: list) -> None:
+        """Add a measured step to the Pareto front and rewrite the front file if the step is not dominated."""
+        if self.pareto_front is None or not self.pareto_front.add(step, action, observation):
+            return
+
+        logging.info(f"Step {step} is on the Pareto front ({len(self.pareto_front.points)} steps)")
+        self.iteration_dir.mkdir(parents=True, exist_ok=True)
+        self.pareto_front.dump(self.iteration_dir / PARETO_FRONT_FILE_NAME)
+
     def write_trajectory(self, step: int, action: Any, reward: float, observation: list):
         """
         Write the trajectory to a CSV file.
@@ -196,13 +339,9 @@ class CloudAIGymEnv(BaseGym):
             reward (float): The reward received for the action.
             observation (list): The observation after taking the action.
         """
-        trajectory_file_path = (
-            self.runner.runner.scenario_root
-            / self.test_run.name
-            / f"{self.test_run.current_iteration}"
-            / "trajectory.csv"
-        )
+        trajectory_file_path = self.iteration_dir / "trajectory.csv"
 
+        trajectory_file_path.parent.mkdir(parents=True, exist_ok=True)
         file_exists = trajectory_file_path.exists()
         logging.debug(f"Writing trajectory into {trajectory_file_path} (exists: {file_exists})")
 
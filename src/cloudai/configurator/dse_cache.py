@@ -0,0 +1,119 @@
+# SPDX-FileCopyrightText: NVIDIA CORPORATION & AFFILIATES
+# Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import hashlib
+import json
+import logging
+from pathlib import Path
+from typing import Optional
+
+import toml
+
+from cloudai.core import System, TestRun
+
+# Agent settings control how the space is explored, they do not affect the result of a single step.
+NON_RESULT_FIELDS = {
+    "agent",
+    "agent_steps",
+    "agent_parallel_steps",
+    "agent_reward_function",
+    "agent_early_stop",
+    "agent_config",
+    "agent_objectives",
+}
+
+
+class DSEResultCache:
+    """
+    On-disk cache of DSE step observations.
+
+    Entries are keyed by a hash of the fully resolved test definition (after applying the step parameters), number of
+    nodes and the system, so re-running a DSE scenario skips combinations that were already measured.
+
+    Attributes
+        root (Path): Directory where cache entries are stored, one TOML file per entry.
+    """
+
+    def __init__(self, root: Path) -> None:
+        self.root = root
+
+    @staticmethod
+    def key(system: System, tr: TestRun) -> str:
+        tdef = tr.test.test_definition.model_dump(exclude=NON_RESULT_FIELDS)
+        payload = {
+            "system": system.name,
+            "scheduler": system.scheduler,
+            "test_definition": tdef,
+            "num_nodes": tr.num_nodes,
+            "nodes": tr.nodes,
+        }
+        return hashlib.sha256(json.dumps(payload, sort_keys=True, default=str).encode()).hexdigest()
+
+    def entry_path(self, system: System, tr: TestRun) -> Path:
+        return self.root / f"{self.key(system, tr)}.toml"
+
+    def get(self, system: System, tr: TestRun) -> Optional[list[float]]:
+        """
+        Get a cached observation for a test run.
+
+        Args:
+            system (System): The system the test run is executed on.
+            tr (TestRun): The test run with step parameters applied.
+
+        Returns:
+            Optional[list[float]]: The cached observation or None if there is no valid entry.
+        """
+        path = self.entry_path(system, tr)
+        if not path.is_file():
+            return None
+
+        try:
+            data = toml.load(path)
+            observation = [float(v) for v in data["observation"]]
+        except (toml.TomlDecodeError, KeyError, TypeError, ValueError) as e:
+            logging.warning(f"Ignoring invalid DSE cache entry {path}: {e}")
+            return None
+
+        logging.debug(f"DSE cache hit for {tr.name} step {tr.step}: {path} (measured in {data.get('output_path')})")
+        return observation
+
+    def put(self, system: System, tr: TestRun, observation: list[float]) -> None:
+        """
+        Store an observation for a test run.
+
+        Failed measurements (any value is -1.0) are not stored, so that they are retried on the next run.
+
+        Args:
+            system (System): The system the test run was executed on.
+            tr (TestRun): The test run with step parameters applied.
+            observation (list[float]): The observation to store.
+        """
+        if not observation or any(v == -1.0 for v in observation):
+            return
+
+        self.root.mkdir(parents=True, exist_ok=True)
+        path = self.entry_path(system, tr)
+        with path.open("w") as f:
+            toml.dump(
+                {
+                    "test_run": tr.name,
+                    "step": tr.step,
+                    "output_path": str(tr.output_path.absolute()),
+                    "metrics": tr.test.test_definition.agent_metrics,
+                    "observation": observation,
+                },
+                f,
+            )
@@ -14,9 +14,11 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import itertools
 from typing import Any, Dict, List, Tuple
 
+from cloudai.core import ParameterSpace
+from cloudai.util.lazy_imports import lazy
+
 from .base_agent import BaseAgent
 from .cloudai_gym import CloudAIGymEnv
 
@@ -25,7 +27,7 @@ class GridSearchAgent(BaseAgent):
     """
     Agent implementing a grid search over the action space.
 
-    Iterates through all possible parameter combinations.
+    Iterates through all parameter combinations that pass the constraints of the test definition.
     """
 
     def __init__(self, env: CloudAIGymEnv):
@@ -37,33 +39,32 @@ class GridSearchAgent(BaseAgent):
         """
         self.action_space = env.define_action_space()
         self.env = env
-        self.action_combinations = []
+        self.action_combinations = ParameterSpace({})
+        self.feasible_indices: List[int] = []
         self.index = 0
         self.configure(self.action_space)
 
     def configure(self, config: Dict[str, Any]) -> None:
         """
-        Configure the grid search by precomputing all parameter combinations.
+        Configure the grid search over all feasible parameter combinations, combinations are produced lazily.
+
+        Constraints are evaluated for the whole space up front, so no step is spent on an infeasible combination.
 
         Args:
             config (Dict[str, Any]): The action space to configure.
         """
-        parameter_values = []
-        for _, values in config.items():
-            parameter_values.append(values)
-
-        self.action_combinations = list(itertools.product(*parameter_values))
-        self.max_steps = len(self.action_combinations)
+        self.action_combinations = ParameterSpace(config)
+        self.feasible_indices = lazy.np.flatnonzero(self.env.feasible_mask()).tolist()
+        self.max_steps = len(self.feasible_indices)
 
     def get_all_combinations(self) -> List[Dict[str, Any]]:
         """
-        Get all possible combinations of the action space parameters.
+        Get all feasible combinations of the action space parameters.
 
         Returns:
             List[Dict[str, Any]]: A list of dictionaries, each representing a unique combination of parameters.
         """
-        keys = list(self.action_space.keys())
-        return [dict(zip(keys, combination, strict=True)) for combination in self.action_combinations]
+        return [self.action_combinations[idx] for idx in self.feasible_indices]
 
     def select_action(self) -> Tuple[int, Dict[str, Any]]:
         """
@@ -73,7 +74,7 @@ class GridSearchAgent(BaseAgent):
             Tuple[int, Dict[str, Any]]: The current step and a dictionary mapping action keys to selected
             values.
         """
-        action = dict(zip(self.action_space.keys(), self.action_combinations[self.index], strict=True))
+        action = self.action_combinations[self.feasible_indices[self.index]]
         self.index += 1
         step = self.index
         return step, action
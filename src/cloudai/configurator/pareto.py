@@ -0,0 +1,94 @@
+# SPDX-FileCopyrightText: NVIDIA CORPORATION & AFFILIATES
+# Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import csv
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, List, Tuple
+
+if TYPE_CHECKING:
+    from cloudai.core import DSEObjective
+
+from .reward_functions import objective_scores
+
+PARETO_FRONT_FILE_NAME = "pareto_front.csv"
+
+
+def dominates(a: Tuple[float, ...], b: Tuple[float, ...]) -> bool:
+    """Check whether scores `a` are at least as good as `b` for all objectives and better for at least one."""
+    return all(x >= y for x, y in zip(a, b, strict=True)) and a != b
+
+
+@dataclass
+class ParetoPoint:
+    """DSE step on the Pareto front."""
+
+    step: int
+    action: Dict[str, Any]
+    observation: List[float]
+    scores: Tuple[float, ...]
+
+
+class ParetoFront:
+    """
+    Non-dominated DSE steps, maintained incrementally as observations arrive.
+
+    Observations are compared on the oriented values of the objectives (higher is better), steps with failed metrics or
+    violated objective limits are never added. A step with the same scores as a step already on the front is not
+    added either.
+
+    Attributes
+        metrics (List[str]): Names of the observed metrics, in observation order.
+        objectives (List[DSEObjective]): Objectives the steps are compared on.
+        points (List[ParetoPoint]): Steps on the front, in the order they were added.
+    """
+
+    def __init__(self, metrics: List[str], objectives: List[DSEObjective]) -> None:
+        self.metrics = metrics
+        self.objectives = objectives
+        self.points: List[ParetoPoint] = []
+
+    def add(self, step: int, action: Dict[str, Any], observation: List[float]) -> bool:
+        """
+        Add a step unless it is dominated, dropping the steps it dominates.
+
+        Args:
+            step (int): Step number.
+            action (Dict[str, Any]): Parameters of the step.
+            observation (List[float]): Observed metric values.
+
+        Returns:
+            bool: True if the step is on the front after the update.
+        """
+        scores = objective_scores(observation, self.metrics, self.objectives)
+        if scores is None:
+            return False
+        if any(p.scores == scores or dominates(p.scores, scores) for p in self.points):
+            return False
+
+        self.points = [p for p in self.points if not dominates(scores, p.scores)]
+        self.points.append(ParetoPoint(step, action, observation, scores))
+        return True
+
+    def dump(self, path: Path) -> None:
+        """Write the front to a CSV file with the same columns as the trajectory file, without rewards."""
+        with path.open("w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(["step", "action", "observation"])
+            for p in self.points:
+                writer.writerow([p.step, p.action, p.observation])
@@ -14,7 +14,15 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import List
+from __future__ import annotations
+
+import math
+from typing import TYPE_CHECKING, List, Optional, Tuple
+
+from cloudai.core import METRIC_ERROR
+
+if TYPE_CHECKING:
+    from cloudai.core import DSEObjective
 
 
 def inverse_reward(observation: List[float]) -> float:
@@ -33,3 +41,36 @@ def identity_reward(observation: List[float]) -> float:
     if observation:
         return observation[0]
     return 0.0
+
+
+def objective_scores(
+    observation: List[float], metrics: List[str], objectives: List[DSEObjective]
+) -> Optional[Tuple[float, ...]]:
+    """
+    Get oriented objective values of a multi-metric observation, higher is better for every objective.
+
+    Args:
+        observation (List[float]): Metric values in the order of `metrics`.
+        metrics (List[str]): Names of the observed metrics.
+        objectives (List[DSEObjective]): Objectives defined on the metrics.
+
+    Returns:
+        Optional[Tuple[float, ...]]: One score per objective, None if a metric is missing or an objective limit is
+        violated.
+    """
+    values = dict(zip(metrics, observation, strict=False))
+    scores: List[float] = []
+    for objective in objectives:
+        value = values.get(objective.metric, METRIC_ERROR)
+        if value == METRIC_ERROR or not objective.is_satisfied(value):
+            return None
+        scores.append(objective.score(value))
+    return tuple(scores)
+
+
+def weighted_reward(observation: List[float], metrics: List[str], objectives: List[DSEObjective]) -> float:
+    """Combine a multi-metric observation into the weighted sum of its objective scores, see `objective_scores`."""
+    scores = objective_scores(observation, metrics, objectives)
+    if scores is None:
+        return -math.inf
+    return sum(o.weight * score for o, score in zip(objectives, scores, strict=True))
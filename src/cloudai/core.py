@@ -34,6 +34,7 @@ from ._core.grading_strategy import GradingStrategy
 from ._core.installables import DockerImage, File, GitRepo, Installable, PythonExecutable
 from ._core.job_status_result import JobStatusResult
 from ._core.json_gen_strategy import JsonGenStrategy
+from ._core.parameter_space import ParameterSpace
 from ._core.registry import Registry
 from ._core.report_generation_strategy import ReportGenerationStrategy
 from ._core.runner import Runner
@@ -45,7 +46,7 @@ from ._core.test_template_strategy import TestTemplateStrategy
 from .configurator.base_agent import BaseAgent
 from .configurator.cloudai_gym import CloudAIGymEnv
 from .configurator.grid_search import GridSearchAgent
-from .models.workload import CmdArgs, NsysConfiguration, PredictorConfig, TestDefinition
+from .models.workload import CmdArgs, DSEObjective, EarlyStopConfig, NsysConfiguration, PredictorConfig, TestDefinition
 from .parser import Parser
 from .reporter import PerTestReporter, StatusReporter, TarballReporter
 from .test_parser import TestParser
@@ -61,7 +62,9 @@ __all__ = [
     "CloudAIGymEnv",
     "CmdArgs",
     "CommandGenStrategy",
+    "DSEObjective",
     "DockerImage",
+    "EarlyStopConfig",
     "File",
     "GitRepo",
     "Grader",
@@ -73,6 +76,7 @@ __all__ = [
     "JobStatusResult",
     "JsonGenStrategy",
     "NsysConfiguration",
+    "ParameterSpace",
     "Parser",
     "PerTestReporter",
     "PredictorConfig",
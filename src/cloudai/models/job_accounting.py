@@ -0,0 +1,56 @@
+# SPDX-FileCopyrightText: NVIDIA CORPORATION & AFFILIATES
+# Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from typing import Optional
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class JobAccounting(BaseModel):
+    """
+    Resource usage of a job or a job step as reported by the system accounting.
+
+    All fields are optional, systems fill in what they can measure: Slurm reports them from 'sacct', standalone jobs
+    from the rusage of the reaped process.
+
+    Attributes
+        submit_time (str): Submission time in ISO 8601 format.
+        queue_wait_sec (Optional[float]): Time between submission and start.
+        run_time_sec (Optional[float]): Time between start and end.
+        total_cpu_sec (Optional[float]): User and system CPU time of all tasks.
+        ave_cpu_sec (Optional[float]): Average CPU time of all tasks.
+        max_rss_bytes (Optional[int]): Maximum resident set size of all tasks.
+        consumed_energy_joules (Optional[int]): Energy consumed by the job.
+        alloc_tres (dict[str, str]): Allocated trackable resources, e.g. `{"cpu": "8", "gres/gpu": "8"}`.
+        tres_usage (dict[str, str]): Total usage of trackable resources, e.g. `{"gres/gpuutil": "95"}`.
+    """
+
+    model_config = ConfigDict(extra="forbid")
+
+    submit_time: str = ""
+    queue_wait_sec: Optional[float] = None
+    run_time_sec: Optional[float] = None
+    total_cpu_sec: Optional[float] = None
+    ave_cpu_sec: Optional[float] = None
+    max_rss_bytes: Optional[int] = None
+    consumed_energy_joules: Optional[int] = None
+    alloc_tres: dict[str, str] = Field(default_factory=dict)
+    tres_usage: dict[str, str] = Field(default_factory=dict)
+
+    @property
+    def gpus(self) -> Optional[int]:
+        value = self.alloc_tres.get("gres/gpu")
+        return int(value) if value and value.isdigit() else None
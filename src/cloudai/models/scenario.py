@@ -21,7 +21,7 @@ from typing import Any, Literal, Optional
 
 from pydantic import BaseModel, ConfigDict, Field, ValidationError, field_serializer, field_validator, model_validator
 
-from cloudai.core import CmdArgs, GitRepo, NsysConfiguration, Registry, Reporter, TestRun
+from cloudai.core import CmdArgs, DSEObjective, EarlyStopConfig, GitRepo, NsysConfiguration, Registry, Reporter, TestRun
 from cloudai.models.workload import TestDefinition
 
 
@@ -90,7 +90,11 @@ class TestRunModel(BaseModel):
     nsys: Optional[NsysConfiguration] = None
     agent: Optional[str] = None
     agent_steps: Optional[int] = None
-    agent_metrics: list[str] = Field(default=["default"])
+    agent_parallel_steps: Optional[int] = None
+    agent_metrics: Optional[list[str]] = None
+    agent_early_stop: Optional[EarlyStopConfig] = None
+    agent_config: Optional[dict[str, Any]] = None
+    agent_objectives: Optional[list[DSEObjective]] = None
 
     def tdef_model_dump(self) -> dict:
         """Return a dictionary with non-None values that correspond to the test definition fields."""
@@ -100,7 +104,11 @@ class TestRunModel(BaseModel):
             "test_template_name": self.test_template_name,
             "agent": self.agent,
             "agent_steps": self.agent_steps,
+            "agent_parallel_steps": self.agent_parallel_steps,
             "agent_metrics": self.agent_metrics,
+            "agent_early_stop": self.agent_early_stop.model_dump() if self.agent_early_stop else None,
+            "agent_config": self.agent_config,
+            "agent_objectives": [o.model_dump() for o in self.agent_objectives] if self.agent_objectives else None,
             "extra_container_mounts": self.extra_container_mounts,
             "extra_env_vars": self.extra_env_vars if self.extra_env_vars else None,
             "cmd_args": self.cmd_args.model_dump() if self.cmd_args else None,
@@ -16,11 +16,15 @@
 
 from abc import ABC
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Literal, Optional, Union
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, model_validator
 
-from cloudai.core import GitRepo, Installable, JobStatusResult, PythonExecutable, TestRun
+from cloudai.core import GitRepo, Installable, JobStatusResult, ParameterSpace, PythonExecutable, TestRun
+from cloudai.util.lazy_imports import lazy
+
+if TYPE_CHECKING:
+    import numpy as np
 
 
 class CmdArgs(BaseModel):
@@ -71,6 +75,49 @@ class NsysConfiguration(BaseModel):
         return parts
 
 
+class EarlyStopConfig(BaseModel):
+    """
+    Rule for stopping DSE steps early.
+
+    A running step is stopped once its reward computed from live metrics is worse than the best reward observed so far
+    by more than `margin` (relative to the best reward). Steps are not checked during the first `min_runtime` seconds.
+    """
+
+    model_config = ConfigDict(extra="forbid")
+
+    min_runtime: int = Field(default=60, ge=0)
+    margin: float = Field(default=0.2, ge=0.0)
+
+    def is_dominated(self, reward: float, best_reward: float) -> bool:
+        return reward < best_reward - self.margin * abs(best_reward)
+
+
+class DSEObjective(BaseModel):
+    """
+    Objective of a multi-objective DSE, defined on one of the agent metrics.
+
+    The reward of a step is the weighted sum of its objective values, negated for minimized objectives. A `limit` turns
+    the objective into a constraint as well: steps with a value above it (below it for maximized objectives) get a
+    reward of -inf and are never part of the Pareto front.
+    """
+
+    model_config = ConfigDict(extra="forbid")
+
+    metric: str
+    goal: Literal["minimize", "maximize"] = "minimize"
+    weight: float = Field(default=1.0, ge=0.0)
+    limit: Optional[float] = None
+
+    def score(self, value: float) -> float:
+        """Orient a metric value so that higher is better."""
+        return -value if self.goal == "minimize" else value
+
+    def is_satisfied(self, value: float) -> bool:
+        if self.limit is None:
+            return True
+        return self.score(value) >= self.score(self.limit)
+
+
 @dataclass
 class PredictorConfig(PythonExecutable):
     """Predictor configuration."""
@@ -105,8 +152,19 @@ class TestDefinition(BaseModel, ABC):
     predictor: Optional[PredictorConfig] = None
     agent: str = "grid_search"
     agent_steps: int = 1
+    agent_parallel_steps: int = Field(default=1, ge=1)
     agent_metrics: list[str] = Field(default=["default"])
     agent_reward_function: str = "inverse"
+    agent_early_stop: Optional[EarlyStopConfig] = None
+    agent_config: dict[str, Any] = {}
+    agent_objectives: list[DSEObjective] = []
+
+    @model_validator(mode="after")
+    def check_objectives_use_agent_metrics(self):
+        unknown = [o.metric for o in self.agent_objectives if o.metric not in self.agent_metrics]
+        if unknown:
+            raise ValueError(f"'agent_objectives' use metrics {unknown} that are not listed in 'agent_metrics'.")
+        return self
 
     @property
     def cmd_args_dict(self) -> Dict[str, Union[str, List[str]]]:
@@ -126,6 +184,25 @@ class TestDefinition(BaseModel, ABC):
     def constraint_check(self, tr: TestRun) -> bool:
         return True
 
+    def feasible_mask(self, tr: TestRun, space: ParameterSpace) -> Optional["np.ndarray"]:
+        """
+        Evaluate `constraint_check` for all combinations of a DSE space at once.
+
+        Definitions that override `constraint_check` should override this method too, computing the same constraints
+        on `ParameterSpace.column` arrays. Returning None makes callers check combinations one by one.
+
+        Args:
+            tr (TestRun): The test run the space belongs to, its values are used for parameters outside of the space.
+            space (ParameterSpace): The DSE space of the test run.
+
+        Returns:
+            Optional[np.ndarray]: Boolean array of `len(space)` values, True for feasible combinations, or None if
+            constraints can't be vectorized.
+        """
+        if type(self).constraint_check is not TestDefinition.constraint_check:
+            return None
+        return lazy.np.ones(len(space), dtype=bool)
+
     @property
     def is_dse_job(self) -> bool:
         def check_dict(d: dict) -> bool:
@@ -15,8 +15,9 @@
 # limitations under the License.
 
 import logging
+import re
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Dict, Iterable, Iterator, List, Mapping, Optional, Tuple, TypeVar
 
 import toml
 from pydantic import ValidationError
@@ -37,6 +38,82 @@ from .test_scenario_parser import TestScenarioParser
 HOOK_ROOT = Path("conf/hook")
 HOOK_TEST_ROOT = HOOK_ROOT / "test"
 
+TOML_NAME_RE = re.compile(r"""^name\s*=\s*(?:"([^"\\]*)"|'([^']*)')\s*(?:#.*)?$""")
+
+T = TypeVar("T")
+
+
+def read_toml_name(path: Path) -> Optional[str]:
+    """
+    Read the top-level `name` of a TOML file without parsing the whole file.
+
+    Only lines before the first table header are scanned. If `name` is not a plain string there, the file is parsed.
+
+    Args:
+        path (Path): Path to the TOML file.
+
+    Returns:
+        Optional[str]: The name, None if it is not defined or the file is not valid TOML.
+    """
+    with path.open() as f:
+        for line in f:
+            stripped = line.strip()
+            if stripped.startswith("["):
+                break
+            if match := TOML_NAME_RE.match(stripped):
+                return match.group(1) if match.group(1) is not None else match.group(2)
+
+    try:
+        name = toml.load(path).get("name")
+    except toml.TomlDecodeError as e:
+        logging.warning(f"Failed to read name from {path}: {e}")
+        return None
+    return name if isinstance(name, str) else None
+
+
+class LazyTomlMapping(Mapping[str, T]):
+    """
+    Mapping of names to objects defined in TOML files, each file is loaded on first access.
+
+    Files are indexed by their top-level `name` using `read_toml_name`, so building the mapping does not parse or
+    validate the files. If several files define the same name, the last one wins.
+
+    Attributes
+        paths (dict[str, Path]): TOML file for every name.
+        loaded (dict[str, T]): Objects loaded so far.
+    """
+
+    def __init__(self, tomls: Iterable[Path], load: Callable[[Path], T]) -> None:
+        self.paths: dict[str, Path] = {}
+        for path in tomls:
+            name = read_toml_name(path)
+            if name is None:
+                logging.warning(f"Skipping {path}: no top-level 'name' found.")
+                continue
+            self.paths[name] = path
+        self.load = load
+        self.loaded: dict[str, T] = {}
+
+    def __getitem__(self, name: str) -> T:
+        """Return the object for a name, loading its TOML file on first access."""
+        if name not in self.loaded:
+            path = self.paths[name]
+            logging.debug(f"Loading '{name}' from {path}")
+            self.loaded[name] = self.load(path)
+        return self.loaded[name]
+
+    def __contains__(self, name: object) -> bool:
+        """Check if a name is defined, without loading its TOML file."""
+        return name in self.paths
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over defined names."""
+        return iter(self.paths)
+
+    def __len__(self) -> int:
+        """Return the number of defined names."""
+        return len(self.paths)
+
 
 class Parser:
     """Main parser for parsing all types of configurations."""
@@ -80,60 +157,54 @@ class Parser:
             Tuple[System, List[Test], Optional[TestScenario]]: A tuple containing the system object, a list of filtered
                 test template objects, and the main test scenario object if provided.
         """
-        tests: list[Test] = []
+        tests: Mapping[str, Test] = {}
         if test_path:
             if not test_path.exists():
                 raise FileNotFoundError(f"Test path '{test_path}' not found.")
-
-            try:
-                tests = self.parse_tests(list(test_path.glob("*.toml")), self.system)
-            except TestConfigParsingError:
-                exit(1)  # exit right away to keep error message readable for users
+            tests = LazyTomlMapping(test_path.glob("*.toml"), self._load_test)
 
         if not HOOK_ROOT.exists():
             logging.debug(f"HOOK_ROOT path '{HOOK_ROOT}' does not exist.")
 
-        try:
-            hook_tests = (
-                self.parse_tests(list(HOOK_TEST_ROOT.glob("*.toml")), self.system) if HOOK_TEST_ROOT.exists() else []
-            )
-        except TestConfigParsingError:
-            exit(1)  # exit right away to keep error message readable for users
+        hook_tests: Mapping[str, Test] = {}
+        if HOOK_TEST_ROOT.exists():
+            hook_tests = LazyTomlMapping(HOOK_TEST_ROOT.glob("*.toml"), self._load_test)
 
         if not test_scenario_path:
-            all_tests = list({test.name: test for test in tests + hook_tests}.values())
-            return self.system, all_tests, None
-
-        test_mapping = {t.name: t for t in tests}
-        hook_test_scenario_mapping = {}
-        if HOOK_ROOT.exists() and list(HOOK_ROOT.glob("*.toml")):
             try:
-                hook_test_scenario_mapping = self.parse_hooks(
-                    list(HOOK_ROOT.glob("*.toml")), self.system, {t.name: t for t in hook_tests}
-                )
-            except TestScenarioParsingError:
+                all_tests = list({test.name: test for test in [*tests.values(), *hook_tests.values()]}.values())
+            except TestConfigParsingError:
                 exit(1)  # exit right away to keep error message readable for users
+            return self.system, all_tests, None
 
-        try:
-            test_scenario = self.parse_test_scenario(
-                test_scenario_path, self.system, test_mapping, hook_test_scenario_mapping
+        hook_test_scenario_mapping: Mapping[str, TestScenario] = {}
+        if HOOK_ROOT.exists():
+            hook_test_scenario_mapping = LazyTomlMapping(
+                HOOK_ROOT.glob("*.toml"), lambda path: self.parse_test_scenario(path, self.system, hook_tests)
             )
-        except TestScenarioParsingError:
-            exit(1)  # exit right away to keep error message readable for users
 
-        scenario_tests = {tr.test.name for tr in test_scenario.test_runs}
-        hook_scenario_tests = {
-            tr.test.name for hook_scenario in hook_test_scenario_mapping.values() for tr in hook_scenario.test_runs
-        }
+        try:
+            test_scenario = self.parse_test_scenario(test_scenario_path, self.system, tests, hook_test_scenario_mapping)
+        except (TestScenarioParsingError, TestConfigParsingError):
+            exit(1)  # exit right away to keep error message readable for users
 
-        relevant_test_names = scenario_tests.union(hook_scenario_tests)
-        filtered_tests = [t for t in tests if t.name in relevant_test_names] + hook_tests
+        # only tests referenced by the scenario and its hooks were loaded
+        filtered_tests = [*self._loaded(tests), *self._loaded(hook_tests)]
         filtered_tests = list({test.name: test for test in filtered_tests}.values())
 
         return self.system, filtered_tests, test_scenario
 
+    def _load_test(self, test_toml: Path) -> Test:
+        return self.parse_tests([test_toml], self.system)[0]
+
+    @staticmethod
+    def _loaded(mapping: Mapping[str, T]) -> list[T]:
+        return list(mapping.loaded.values()) if isinstance(mapping, LazyTomlMapping) else []
+
     @staticmethod
-    def parse_hooks(hook_tomls: List[Path], system: System, test_mapping: Dict[str, Test]) -> Dict[str, TestScenario]:
+    def parse_hooks(
+        hook_tomls: List[Path], system: System, test_mapping: Mapping[str, Test]
+    ) -> Dict[str, TestScenario]:
         hook_mapping = {}
         for hook_test_scenario_path in hook_tomls:
             hook_scenario = Parser.parse_test_scenario(hook_test_scenario_path, system, test_mapping)
@@ -144,8 +215,8 @@ class Parser:
     def parse_test_scenario(
         test_scenario_path: Path,
         system: System,
-        test_mapping: Dict[str, Test],
-        hook_mapping: Optional[Dict[str, TestScenario]] = None,
+        test_mapping: Mapping[str, Test],
+        hook_mapping: Optional[Mapping[str, TestScenario]] = None,
         strict: bool = False,
     ) -> TestScenario:
         if hook_mapping is None:
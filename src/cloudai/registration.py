@@ -14,52 +14,108 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import importlib
+from typing import Any, Callable, Mapping, Optional
 
-def register_all():
-    """Register all workloads, systems, runners, installers, and strategies."""
-    from cloudai.configurator.grid_search import GridSearchAgent
-    from cloudai.configurator.reward_functions import (
-        identity_reward,
-        inverse_reward,
-        negative_reward,
-    )
-    from cloudai.core import GradingStrategy, JsonGenStrategy, Registry
-    from cloudai.models.scenario import ReportConfig
-    from cloudai.reporter import PerTestReporter, StatusReporter, TarballReporter
-
-    # Import systems
-    from cloudai.systems.kubernetes import KubernetesInstaller, KubernetesRunner, KubernetesSystem
-    from cloudai.systems.lsf import LSFInstaller, LSFRunner, LSFSystem
-    from cloudai.systems.runai import RunAIInstaller, RunAIRunner, RunAISystem
-    from cloudai.systems.slurm import SlurmInstaller, SlurmRunner, SlurmSystem
-    from cloudai.systems.standalone import StandaloneInstaller, StandaloneRunner, StandaloneSystem
-    from cloudai.workloads.ai_dynamo import (
-        AIDynamoReportGenerationStrategy,
-        AIDynamoSlurmCommandGenStrategy,
-        AIDynamoTestDefinition,
-    )
+from cloudai.core import Registry
 
-    # Import all workloads and their strategies
-    from cloudai.workloads.bash_cmd.bash_cmd import BashCmdCommandGenStrategy, BashCmdTestDefinition
-    from cloudai.workloads.chakra_replay import (
-        ChakraReplayGradingStrategy,
-        ChakraReplayReportGenerationStrategy,
-        ChakraReplaySlurmCommandGenStrategy,
-        ChakraReplayTestDefinition,
-    )
-    from cloudai.workloads.jax_toolbox import (
-        GPTTestDefinition,
-        GrokTestDefinition,
-        JaxToolboxGradingStrategy,
-        JaxToolboxReportGenerationStrategy,
-        JaxToolboxSlurmCommandGenStrategy,
-        NemotronTestDefinition,
+
+def _resolve(module: str, path: str) -> Any:
+    """Return the attribute `path` of `module`, dotted paths point into its submodules."""
+    owner, _, name = f"{module}.{path}".rpartition(".")
+    return getattr(importlib.import_module(owner), name)
+
+
+def add_plugin(
+    module: str,
+    register: Optional[Callable[[], None]] = None,
+    *,
+    runners: Mapping[str, str] = {},
+    installers: Mapping[str, str] = {},
+    systems: Mapping[str, str] = {},
+    test_definitions: Mapping[str, str] = {},
+    agents: Mapping[str, str] = {},
+    reward_functions: Mapping[str, str] = {},
+    scenario_reports: Mapping[str, tuple[str, str]] = {},
+) -> None:
+    """
+    Declare a plugin whose named implementations are attributes of `module`.
+
+    Every mapping goes from a name to the attribute path relative to `module`, scenario reports map to the reporter
+    and the config type, the config is enabled by default. The names are declared with `Registry.add_plugin()` and
+    registered from the same mappings on first lookup.
+
+    Args:
+        module (str): Module (package) that implements the plugin.
+        register (Optional[Callable[[], None]]): Registers implementations that are not looked up by name, e.g.
+            strategies and reports.
+        runners (Mapping[str, str]): Runners provided by the plugin.
+        installers (Mapping[str, str]): Installers provided by the plugin.
+        systems (Mapping[str, str]): Systems provided by the plugin.
+        test_definitions (Mapping[str, str]): Test definitions provided by the plugin.
+        agents (Mapping[str, str]): Agents provided by the plugin.
+        reward_functions (Mapping[str, str]): Reward functions provided by the plugin.
+        scenario_reports (Mapping[str, tuple[str, str]]): Scenario reports provided by the plugin.
+    """
+    registry = Registry()
+    named: list[tuple[Mapping[str, str], Callable[[str, Any], None]]] = [
+        (runners, registry.add_runner),
+        (installers, registry.add_installer),
+        (systems, registry.add_system),
+        (test_definitions, registry.add_test_definition),
+        (agents, registry.add_agent),
+        (reward_functions, registry.add_reward_function),
+    ]
+
+    def register_plugin() -> None:
+        for entries, add in named:
+            for name, path in entries.items():
+                add(name, _resolve(module, path))
+        for name, (report, config) in scenario_reports.items():
+            registry.add_scenario_report(name, _resolve(module, report), _resolve(module, config)(enable=True))
+        if register is not None:
+            register()
+
+    registry.add_plugin(
+        module,
+        register_plugin,
+        runners=runners,
+        installers=installers,
+        systems=systems,
+        test_definitions=test_definitions,
+        agents=agents,
+        reward_functions=reward_functions,
+        scenario_reports=scenario_reports,
     )
-    from cloudai.workloads.megatron_run import (
-        CheckpointTimingReportGenerationStrategy,
-        MegatronRunSlurmCommandGenStrategy,
-        MegatronRunTestDefinition,
+
+
+def register_sleep() -> None:
+    from cloudai.core import GradingStrategy, JsonGenStrategy
+    from cloudai.systems.kubernetes import KubernetesSystem
+    from cloudai.systems.lsf import LSFSystem
+    from cloudai.systems.slurm import SlurmSystem
+    from cloudai.systems.standalone import StandaloneSystem
+    from cloudai.workloads.sleep import (
+        SleepGradingStrategy,
+        SleepKubernetesJsonGenStrategy,
+        SleepLSFCommandGenStrategy,
+        SleepSlurmCommandGenStrategy,
+        SleepStandaloneCommandGenStrategy,
+        SleepTestDefinition,
     )
+
+    Registry().add_command_gen_strategy(StandaloneSystem, SleepTestDefinition, SleepStandaloneCommandGenStrategy)
+    Registry().add_command_gen_strategy(LSFSystem, SleepTestDefinition, SleepLSFCommandGenStrategy)
+    Registry().add_command_gen_strategy(SlurmSystem, SleepTestDefinition, SleepSlurmCommandGenStrategy)
+    Registry().add_strategy(JsonGenStrategy, [KubernetesSystem], [SleepTestDefinition], SleepKubernetesJsonGenStrategy)
+    Registry().add_strategy(GradingStrategy, [SlurmSystem], [SleepTestDefinition], SleepGradingStrategy)
+
+
+def register_nccl_test() -> None:
+    from cloudai.core import GradingStrategy, JsonGenStrategy
+    from cloudai.systems.kubernetes import KubernetesSystem
+    from cloudai.systems.runai import RunAISystem
+    from cloudai.systems.slurm import SlurmSystem
     from cloudai.workloads.nccl_test import (
         NCCLTestDefinition,
         NcclTestGradingStrategy,
@@ -68,150 +124,275 @@ def register_all():
         NcclTestRunAIJsonGenStrategy,
         NcclTestSlurmCommandGenStrategy,
     )
+
+    Registry().add_strategy(
+        JsonGenStrategy, [KubernetesSystem], [NCCLTestDefinition], NcclTestKubernetesJsonGenStrategy
+    )
+    Registry().add_strategy(JsonGenStrategy, [RunAISystem], [NCCLTestDefinition], NcclTestRunAIJsonGenStrategy)
+    Registry().add_strategy(GradingStrategy, [SlurmSystem], [NCCLTestDefinition], NcclTestGradingStrategy)
+    Registry().add_command_gen_strategy(SlurmSystem, NCCLTestDefinition, NcclTestSlurmCommandGenStrategy)
+    Registry().add_report(NCCLTestDefinition, NcclTestPerformanceReportGenerationStrategy)
+
+
+def register_megatron_run() -> None:
+    from cloudai.systems.slurm import SlurmSystem
+    from cloudai.workloads.megatron_run import (
+        CheckpointTimingReportGenerationStrategy,
+        MegatronRunSlurmCommandGenStrategy,
+        MegatronRunTestDefinition,
+    )
+
+    Registry().add_command_gen_strategy(SlurmSystem, MegatronRunTestDefinition, MegatronRunSlurmCommandGenStrategy)
+    Registry().add_report(MegatronRunTestDefinition, CheckpointTimingReportGenerationStrategy)
+
+
+def register_nemo_launcher() -> None:
+    from cloudai.core import GradingStrategy
+    from cloudai.systems.slurm import SlurmSystem
     from cloudai.workloads.nemo_launcher import (
         NeMoLauncherGradingStrategy,
         NeMoLauncherReportGenerationStrategy,
         NeMoLauncherSlurmCommandGenStrategy,
         NeMoLauncherTestDefinition,
     )
+
+    Registry().add_command_gen_strategy(SlurmSystem, NeMoLauncherTestDefinition, NeMoLauncherSlurmCommandGenStrategy)
+    Registry().add_strategy(GradingStrategy, [SlurmSystem], [NeMoLauncherTestDefinition], NeMoLauncherGradingStrategy)
+    Registry().add_report(NeMoLauncherTestDefinition, NeMoLauncherReportGenerationStrategy)
+
+
+def register_nemo_run() -> None:
+    from cloudai.systems.slurm import SlurmSystem
     from cloudai.workloads.nemo_run import (
         NeMoRunDataStoreReportGenerationStrategy,
         NeMoRunReportGenerationStrategy,
         NeMoRunSlurmCommandGenStrategy,
         NeMoRunTestDefinition,
     )
+
+    Registry().add_command_gen_strategy(SlurmSystem, NeMoRunTestDefinition, NeMoRunSlurmCommandGenStrategy)
+    Registry().add_report(NeMoRunTestDefinition, NeMoRunReportGenerationStrategy)
+    Registry().add_report(NeMoRunTestDefinition, NeMoRunDataStoreReportGenerationStrategy)
+
+
+def register_nixl_bench() -> None:
+    from cloudai.systems.slurm import SlurmSystem
     from cloudai.workloads.nixl_bench import (
         NIXLBenchReportGenerationStrategy,
         NIXLBenchSlurmCommandGenStrategy,
-        NIXLBenchSummaryReport,
         NIXLBenchTestDefinition,
     )
-    from cloudai.workloads.nixl_perftest import NixlPerftestSlurmCommandGenStrategy, NixlPerftestTestDefinition
-    from cloudai.workloads.sleep import (
-        SleepGradingStrategy,
-        SleepKubernetesJsonGenStrategy,
-        SleepLSFCommandGenStrategy,
-        SleepSlurmCommandGenStrategy,
-        SleepStandaloneCommandGenStrategy,
-        SleepTestDefinition,
-    )
-    from cloudai.workloads.slurm_container import (
-        SlurmContainerCommandGenStrategy,
-        SlurmContainerReportGenerationStrategy,
-        SlurmContainerTestDefinition,
-    )
-    from cloudai.workloads.triton_inference import (
-        TritonInferenceReportGenerationStrategy,
-        TritonInferenceSlurmCommandGenStrategy,
-        TritonInferenceTestDefinition,
-    )
-    from cloudai.workloads.ucc_test import (
-        UCCTestDefinition,
-        UCCTestGradingStrategy,
-        UCCTestReportGenerationStrategy,
-        UCCTestSlurmCommandGenStrategy,
-    )
-
-    Registry().add_runner("slurm", SlurmRunner)
-    Registry().add_runner("kubernetes", KubernetesRunner)
-    Registry().add_runner("standalone", StandaloneRunner)
-    Registry().add_runner("lsf", LSFRunner)
-    Registry().add_runner("runai", RunAIRunner)
 
-    Registry().add_command_gen_strategy(StandaloneSystem, SleepTestDefinition, SleepStandaloneCommandGenStrategy)
-    Registry().add_command_gen_strategy(LSFSystem, SleepTestDefinition, SleepLSFCommandGenStrategy)
-    Registry().add_command_gen_strategy(SlurmSystem, SleepTestDefinition, SleepSlurmCommandGenStrategy)
-    Registry().add_strategy(JsonGenStrategy, [KubernetesSystem], [SleepTestDefinition], SleepKubernetesJsonGenStrategy)
-    Registry().add_strategy(
-        JsonGenStrategy, [KubernetesSystem], [NCCLTestDefinition], NcclTestKubernetesJsonGenStrategy
-    )
-    Registry().add_strategy(JsonGenStrategy, [RunAISystem], [NCCLTestDefinition], NcclTestRunAIJsonGenStrategy)
-    Registry().add_strategy(GradingStrategy, [SlurmSystem], [NCCLTestDefinition], NcclTestGradingStrategy)
+    Registry().add_command_gen_strategy(SlurmSystem, NIXLBenchTestDefinition, NIXLBenchSlurmCommandGenStrategy)
+    Registry().add_report(NIXLBenchTestDefinition, NIXLBenchReportGenerationStrategy)
 
-    Registry().add_command_gen_strategy(SlurmSystem, MegatronRunTestDefinition, MegatronRunSlurmCommandGenStrategy)
-    Registry().add_command_gen_strategy(SlurmSystem, NCCLTestDefinition, NcclTestSlurmCommandGenStrategy)
-    Registry().add_strategy(GradingStrategy, [SlurmSystem], [SleepTestDefinition], SleepGradingStrategy)
 
-    Registry().add_command_gen_strategy(SlurmSystem, NeMoLauncherTestDefinition, NeMoLauncherSlurmCommandGenStrategy)
-    Registry().add_command_gen_strategy(SlurmSystem, NeMoRunTestDefinition, NeMoRunSlurmCommandGenStrategy)
-    Registry().add_command_gen_strategy(SlurmSystem, NIXLBenchTestDefinition, NIXLBenchSlurmCommandGenStrategy)
+def register_jax_toolbox() -> None:
+    from cloudai.core import GradingStrategy
+    from cloudai.systems.slurm import SlurmSystem
+    from cloudai.workloads.jax_toolbox import (
+        GPTTestDefinition,
+        GrokTestDefinition,
+        JaxToolboxGradingStrategy,
+        JaxToolboxReportGenerationStrategy,
+        JaxToolboxSlurmCommandGenStrategy,
+        NemotronTestDefinition,
+    )
 
-    Registry().add_strategy(GradingStrategy, [SlurmSystem], [NeMoLauncherTestDefinition], NeMoLauncherGradingStrategy)
     Registry().add_strategy(
         GradingStrategy,
         [SlurmSystem],
         [GPTTestDefinition, GrokTestDefinition, NemotronTestDefinition],
         JaxToolboxGradingStrategy,
     )
-    Registry().add_strategy(GradingStrategy, [SlurmSystem], [UCCTestDefinition], UCCTestGradingStrategy)
     Registry().add_command_gen_strategy(SlurmSystem, GPTTestDefinition, JaxToolboxSlurmCommandGenStrategy)
     Registry().add_command_gen_strategy(SlurmSystem, GrokTestDefinition, JaxToolboxSlurmCommandGenStrategy)
     Registry().add_command_gen_strategy(SlurmSystem, NemotronTestDefinition, JaxToolboxSlurmCommandGenStrategy)
+    Registry().add_report(GPTTestDefinition, JaxToolboxReportGenerationStrategy)
+    Registry().add_report(GrokTestDefinition, JaxToolboxReportGenerationStrategy)
+    Registry().add_report(NemotronTestDefinition, JaxToolboxReportGenerationStrategy)
 
+
+def register_ucc_test() -> None:
+    from cloudai.core import GradingStrategy
+    from cloudai.systems.slurm import SlurmSystem
+    from cloudai.workloads.ucc_test import (
+        UCCTestDefinition,
+        UCCTestGradingStrategy,
+        UCCTestReportGenerationStrategy,
+        UCCTestSlurmCommandGenStrategy,
+    )
+
+    Registry().add_strategy(GradingStrategy, [SlurmSystem], [UCCTestDefinition], UCCTestGradingStrategy)
     Registry().add_command_gen_strategy(SlurmSystem, UCCTestDefinition, UCCTestSlurmCommandGenStrategy)
+    Registry().add_report(UCCTestDefinition, UCCTestReportGenerationStrategy)
+
+
+def register_chakra_replay() -> None:
+    from cloudai.core import GradingStrategy
+    from cloudai.systems.slurm import SlurmSystem
+    from cloudai.workloads.chakra_replay import (
+        ChakraReplayGradingStrategy,
+        ChakraReplayReportGenerationStrategy,
+        ChakraReplaySlurmCommandGenStrategy,
+        ChakraReplayTestDefinition,
+    )
 
     Registry().add_strategy(GradingStrategy, [SlurmSystem], [ChakraReplayTestDefinition], ChakraReplayGradingStrategy)
     Registry().add_command_gen_strategy(SlurmSystem, ChakraReplayTestDefinition, ChakraReplaySlurmCommandGenStrategy)
+    Registry().add_report(ChakraReplayTestDefinition, ChakraReplayReportGenerationStrategy)
+
+
+def register_slurm_container() -> None:
+    from cloudai.systems.slurm import SlurmSystem
+    from cloudai.workloads.slurm_container import (
+        SlurmContainerCommandGenStrategy,
+        SlurmContainerReportGenerationStrategy,
+        SlurmContainerTestDefinition,
+    )
+
     Registry().add_command_gen_strategy(SlurmSystem, SlurmContainerTestDefinition, SlurmContainerCommandGenStrategy)
+    Registry().add_report(SlurmContainerTestDefinition, SlurmContainerReportGenerationStrategy)
+
+
+def register_triton_inference() -> None:
+    from cloudai.systems.slurm import SlurmSystem
+    from cloudai.workloads.triton_inference import (
+        TritonInferenceReportGenerationStrategy,
+        TritonInferenceSlurmCommandGenStrategy,
+        TritonInferenceTestDefinition,
+    )
+
     Registry().add_command_gen_strategy(
         SlurmSystem, TritonInferenceTestDefinition, TritonInferenceSlurmCommandGenStrategy
     )
+    Registry().add_report(TritonInferenceTestDefinition, TritonInferenceReportGenerationStrategy)
+
+
+def register_nixl_perftest() -> None:
+    from cloudai.systems.slurm import SlurmSystem
+    from cloudai.workloads.nixl_perftest import NixlPerftestSlurmCommandGenStrategy, NixlPerftestTestDefinition
+
     Registry().add_command_gen_strategy(SlurmSystem, NixlPerftestTestDefinition, NixlPerftestSlurmCommandGenStrategy)
 
+
+def register_ai_dynamo() -> None:
+    from cloudai.systems.slurm import SlurmSystem
+    from cloudai.workloads.ai_dynamo import (
+        AIDynamoReportGenerationStrategy,
+        AIDynamoSlurmCommandGenStrategy,
+        AIDynamoTestDefinition,
+    )
+
     Registry().add_command_gen_strategy(SlurmSystem, AIDynamoTestDefinition, AIDynamoSlurmCommandGenStrategy)
+    Registry().add_report(AIDynamoTestDefinition, AIDynamoReportGenerationStrategy)
+
+
+def register_bash_cmd() -> None:
+    from cloudai.systems.slurm import SlurmSystem
+    from cloudai.workloads.bash_cmd.bash_cmd import BashCmdCommandGenStrategy, BashCmdTestDefinition
+
     Registry().add_command_gen_strategy(SlurmSystem, BashCmdTestDefinition, BashCmdCommandGenStrategy)
 
-    Registry().add_installer("slurm", SlurmInstaller)
-    Registry().add_installer("standalone", StandaloneInstaller)
-    Registry().add_installer("kubernetes", KubernetesInstaller)
-    Registry().add_installer("lsf", LSFInstaller)
-    Registry().add_installer("runai", RunAIInstaller)
-
-    Registry().add_system("slurm", SlurmSystem)
-    Registry().add_system("standalone", StandaloneSystem)
-    Registry().add_system("kubernetes", KubernetesSystem)
-    Registry().add_system("lsf", LSFSystem)
-    Registry().add_system("runai", RunAISystem)
-
-    Registry().add_test_definition("UCCTest", UCCTestDefinition)
-    Registry().add_test_definition("NcclTest", NCCLTestDefinition)
-    Registry().add_test_definition("ChakraReplay", ChakraReplayTestDefinition)
-    Registry().add_test_definition("Sleep", SleepTestDefinition)
-    Registry().add_test_definition("NeMoLauncher", NeMoLauncherTestDefinition)
-    Registry().add_test_definition("NeMoRun", NeMoRunTestDefinition)
-    Registry().add_test_definition("JaxToolboxGPT", GPTTestDefinition)
-    Registry().add_test_definition("JaxToolboxGrok", GrokTestDefinition)
-    Registry().add_test_definition("JaxToolboxNemotron", NemotronTestDefinition)
-    Registry().add_test_definition("SlurmContainer", SlurmContainerTestDefinition)
-    Registry().add_test_definition("MegatronRun", MegatronRunTestDefinition)
-    Registry().add_test_definition("TritonInference", TritonInferenceTestDefinition)
-    Registry().add_test_definition("NIXLBench", NIXLBenchTestDefinition)
-    Registry().add_test_definition("AIDynamo", AIDynamoTestDefinition)
-    Registry().add_test_definition("BashCmd", BashCmdTestDefinition)
-    Registry().add_test_definition("NixlPerftest", NixlPerftestTestDefinition)
-
-    Registry().add_agent("grid_search", GridSearchAgent)
 
-    Registry().add_report(ChakraReplayTestDefinition, ChakraReplayReportGenerationStrategy)
-    Registry().add_report(GPTTestDefinition, JaxToolboxReportGenerationStrategy)
-    Registry().add_report(GrokTestDefinition, JaxToolboxReportGenerationStrategy)
-    Registry().add_report(MegatronRunTestDefinition, CheckpointTimingReportGenerationStrategy)
-    Registry().add_report(NCCLTestDefinition, NcclTestPerformanceReportGenerationStrategy)
-    Registry().add_report(NeMoLauncherTestDefinition, NeMoLauncherReportGenerationStrategy)
-    Registry().add_report(NeMoRunTestDefinition, NeMoRunReportGenerationStrategy)
-    Registry().add_report(NeMoRunTestDefinition, NeMoRunDataStoreReportGenerationStrategy)
-    Registry().add_report(NemotronTestDefinition, JaxToolboxReportGenerationStrategy)
-    Registry().add_report(SlurmContainerTestDefinition, SlurmContainerReportGenerationStrategy)
-    Registry().add_report(UCCTestDefinition, UCCTestReportGenerationStrategy)
-    Registry().add_report(TritonInferenceTestDefinition, TritonInferenceReportGenerationStrategy)
-    Registry().add_report(NIXLBenchTestDefinition, NIXLBenchReportGenerationStrategy)
-    Registry().add_report(AIDynamoTestDefinition, AIDynamoReportGenerationStrategy)
+def register_all():
+    """
+    Declare all workloads, systems, runners, installers, and strategies.
 
-    Registry().add_scenario_report("per_test", PerTestReporter, ReportConfig(enable=True))
-    Registry().add_scenario_report("status", StatusReporter, ReportConfig(enable=True))
-    Registry().add_scenario_report("tarball", TarballReporter, ReportConfig(enable=True))
-    Registry().add_scenario_report("nixl_bench_summary", NIXLBenchSummaryReport, ReportConfig(enable=True))
+    Nothing is imported here: every plugin is registered on first lookup of one of its names through `Registry`, see
+    `Registry.add_plugin()`.
+    """
+    # Systems
+    for name, prefix in [
+        ("slurm", "Slurm"),
+        ("standalone", "Standalone"),
+        ("kubernetes", "Kubernetes"),
+        ("lsf", "LSF"),
+        ("runai", "RunAI"),
+    ]:
+        add_plugin(
+            f"cloudai.systems.{name}",
+            runners={name: f"{prefix}Runner"},
+            installers={name: f"{prefix}Installer"},
+            systems={name: f"{prefix}System"},
+        )
 
-    Registry().add_reward_function("inverse", inverse_reward)
-    Registry().add_reward_function("negative", negative_reward)
-    Registry().add_reward_function("identity", identity_reward)
+    # Scenario reports, agents and reward functions
+    add_plugin(
+        "cloudai.reporter",
+        scenario_reports={
+            "per_test": ("PerTestReporter", "PerTestReportConfig"),
+            "status": ("StatusReporter", "ReportConfig"),
+            "job_accounting": ("JobAccountingReporter", "ReportConfig"),
+            "tarball": ("TarballReporter", "ReportConfig"),
+        },
+    )
+    add_plugin(
+        "cloudai.configurator",
+        agents={
+            "grid_search": "grid_search.GridSearchAgent",
+            "bayesian_optimization": "bayesian_optimization.BayesianOptimizationAgent",
+        },
+        reward_functions={
+            "inverse": "reward_functions.inverse_reward",
+            "negative": "reward_functions.negative_reward",
+            "identity": "reward_functions.identity_reward",
+        },
+    )
+
+    # Workloads
+    add_plugin("cloudai.workloads.ucc_test", register_ucc_test, test_definitions={"UCCTest": "UCCTestDefinition"})
+    add_plugin("cloudai.workloads.nccl_test", register_nccl_test, test_definitions={"NcclTest": "NCCLTestDefinition"})
+    add_plugin(
+        "cloudai.workloads.chakra_replay",
+        register_chakra_replay,
+        test_definitions={"ChakraReplay": "ChakraReplayTestDefinition"},
+    )
+    add_plugin("cloudai.workloads.sleep", register_sleep, test_definitions={"Sleep": "SleepTestDefinition"})
+    add_plugin(
+        "cloudai.workloads.nemo_launcher",
+        register_nemo_launcher,
+        test_definitions={"NeMoLauncher": "NeMoLauncherTestDefinition"},
+    )
+    add_plugin("cloudai.workloads.nemo_run", register_nemo_run, test_definitions={"NeMoRun": "NeMoRunTestDefinition"})
+    add_plugin(
+        "cloudai.workloads.jax_toolbox",
+        register_jax_toolbox,
+        test_definitions={
+            "JaxToolboxGPT": "GPTTestDefinition",
+            "JaxToolboxGrok": "GrokTestDefinition",
+            "JaxToolboxNemotron": "NemotronTestDefinition",
+        },
+    )
+    add_plugin(
+        "cloudai.workloads.slurm_container",
+        register_slurm_container,
+        test_definitions={"SlurmContainer": "SlurmContainerTestDefinition"},
+    )
+    add_plugin(
+        "cloudai.workloads.megatron_run",
+        register_megatron_run,
+        test_definitions={"MegatronRun": "MegatronRunTestDefinition"},
+    )
+    add_plugin(
+        "cloudai.workloads.triton_inference",
+        register_triton_inference,
+        test_definitions={"TritonInference": "TritonInferenceTestDefinition"},
+    )
+    add_plugin(
+        "cloudai.workloads.nixl_bench",
+        register_nixl_bench,
+        test_definitions={"NIXLBench": "NIXLBenchTestDefinition"},
+        scenario_reports={"nixl_bench_summary": ("NIXLBenchSummaryReport", "nixl_summary_report.ReportConfig")},
+    )
+    add_plugin(
+        "cloudai.workloads.ai_dynamo", register_ai_dynamo, test_definitions={"AIDynamo": "AIDynamoTestDefinition"}
+    )
+    add_plugin(
+        "cloudai.workloads.bash_cmd", register_bash_cmd, test_definitions={"BashCmd": "bash_cmd.BashCmdTestDefinition"}
+    )
+    add_plugin(
+        "cloudai.workloads.nixl_perftest",
+        register_nixl_perftest,
+        test_definitions={"NixlPerftest": "NixlPerftestTestDefinition"},
+    )
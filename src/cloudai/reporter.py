@@ -14,19 +14,31 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import csv
+import hashlib
+import json
 import logging
+import multiprocessing
+import os
 import tarfile
-from dataclasses import dataclass
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
 
 import jinja2
-import pandas as pd
 import toml
+from pydantic import Field
 
-from .core import CommandGenStrategy, Reporter, TestRun, case_name
-from .models.scenario import TestRunDetails
-from .systems.slurm import SlurmSystem, SlurmSystemMetadata
+from .config_cache import code_fingerprint
+from .configurator.pareto import PARETO_FRONT_FILE_NAME
+from .core import CommandGenStrategy, Reporter, ReportGenerationStrategy, System, TestRun, case_name
+from .models.job_accounting import JobAccounting
+from .models.scenario import ReportConfig, TestRunDetails
+from .systems.slurm import SlurmJobMetadata, SlurmSystem, SlurmSystemMetadata
+from .systems.standalone import StandaloneJobMetadata
+from .util.lazy_imports import lazy
 
 
 @dataclass
@@ -90,26 +102,164 @@ class SlurmReportItem:
         return report_items
 
 
+PER_TEST_REPORT_STATE_FILE = ".per-test-report.json"
+
+
+class PerTestReportConfig(ReportConfig):
+    """
+    Configuration of per-test reports.
+
+    Attributes
+        workers (Optional[int]): Number of worker processes, defaults to the number of CPUs. With 1 worker reports are
+            generated in the main process.
+        incremental (bool): Skip test runs whose output directory has not changed since their reports were generated.
+    """
+
+    workers: Optional[int] = Field(default=None, ge=1)
+    incremental: bool = True
+
+
+def strategy_name(strategy: type[ReportGenerationStrategy]) -> str:
+    return f"{strategy.__module__}.{strategy.__qualname__}"
+
+
+def output_fingerprint(output_path: Path, strategies: list[type[ReportGenerationStrategy]]) -> str:
+    """
+    Fingerprint of a test run output directory and the report strategies applied to it.
+
+    Only names, sizes and modification times of the files are hashed, together with the code fingerprint, so that
+    reports are regenerated when either the outputs or CloudAI itself change.
+    """
+    digest = hashlib.sha256(code_fingerprint().encode())
+    digest.update(",".join(sorted(strategy_name(s) for s in strategies)).encode())
+    for path in sorted(output_path.rglob("*")):
+        if path.is_file() and path.name != PER_TEST_REPORT_STATE_FILE:
+            stat = path.stat()
+            digest.update(f"{path.relative_to(output_path)}:{stat.st_size}:{stat.st_mtime_ns}".encode())
+    return digest.hexdigest()
+
+
+@dataclass
+class StrategyResult:
+    """Outcome of a single report generation strategy for a single test run."""
+
+    strategy: str
+    status: str
+    elapsed: float
+    error: str = ""
+
+
+def generate_test_run_reports(
+    system: System, tr: TestRun, strategies: list[type[ReportGenerationStrategy]]
+) -> list[StrategyResult]:
+    """Run report generation strategies for a test run, this is the unit of work for worker processes."""
+    results: list[StrategyResult] = []
+    for strategy in strategies:
+        start = time.perf_counter()
+        rgs = strategy(system, tr)
+        if not rgs.can_handle_directory():
+            results.append(StrategyResult(strategy.__name__, "unsupported", time.perf_counter() - start))
+            continue
+        try:
+            rgs.generate_report()
+            results.append(StrategyResult(strategy.__name__, "generated", time.perf_counter() - start))
+        except Exception as e:
+            results.append(StrategyResult(strategy.__name__, "failed", time.perf_counter() - start, str(e)))
+    return results
+
+
+@dataclass
+class StrategyStats:
+    """Aggregated outcomes of a report generation strategy over all test runs."""
+
+    counts: dict[str, int] = field(default_factory=dict)
+    elapsed: float = 0.0
+
+    def add(self, result: StrategyResult) -> None:
+        self.counts[result.status] = self.counts.get(result.status, 0) + 1
+        self.elapsed += result.elapsed
+
+    def __str__(self) -> str:
+        """Return a one line summary."""
+        counts = ", ".join(f"{status} {count}" for status, count in sorted(self.counts.items()))
+        return f"{counts}, {self.elapsed:.2f}s total"
+
+
 class PerTestReporter(Reporter):
-    """Generates reports per test using test-specific reporting strategies."""
+    """
+    Generates reports per test using test-specific reporting strategies.
+
+    Test runs are processed in parallel worker processes. In incremental mode a fingerprint of every output directory
+    is stored after its reports were generated successfully, test runs with unchanged fingerprints are skipped.
+    """
 
     def generate(self) -> None:
         self.load_test_runs()
+        config = self.config if isinstance(self.config, PerTestReportConfig) else PerTestReportConfig()
+
+        pending = [tr for tr in self.trs if not (config.incremental and self.is_up_to_date(tr))]
+        if len(pending) < len(self.trs):
+            logging.info(f"Per-test reports are up to date for {len(self.trs) - len(pending)} of {len(self.trs)} runs")
+
+        stats: dict[str, StrategyStats] = {}
+        progress_step = max(1, len(pending) // 10)
+        for done, (tr, results) in enumerate(self.generate_all(pending, config.workers), start=1):
+            for result in results:
+                stats.setdefault(result.strategy, StrategyStats()).add(result)
+                if result.status == "unsupported":
+                    logging.warning(f"Skipping '{tr.output_path}', can't handle with strategy={result.strategy}.")
+                elif result.status == "failed":
+                    logging.warning(
+                        f"Error generating report for '{tr.output_path}' with strategy={result.strategy}: "
+                        f"{result.error}"
+                    )
 
-        for tr in self.trs:
-            logging.debug(f"Available reports: {[r.__name__ for r in tr.reports]} for directory: {tr.output_path}")
-            for reporter in tr.reports:
-                rgs = reporter(self.system, tr)
-
-                if not rgs.can_handle_directory():
-                    logging.warning(f"Skipping '{tr.output_path}', can't handle with strategy={reporter.__name__}.")
-                    continue
+            if config.incremental and all(result.status != "failed" for result in results):
+                self.store_fingerprint(tr)
+            if len(pending) > 1 and (done % progress_step == 0 or done == len(pending)):
+                logging.info(f"Generated per-test reports for {done} of {len(pending)} runs")
+
+        for name, strategy_stats in stats.items():
+            logging.info(f"Per-test report {name}: {strategy_stats}")
+
+    def generate_all(
+        self, trs: list[TestRun], workers: Optional[int]
+    ) -> Iterator[tuple[TestRun, list[StrategyResult]]]:
+        workers = min(workers or os.cpu_count() or 1, len(trs))
+        if workers <= 1:
+            for tr in trs:
+                yield tr, generate_test_run_reports(self.system, tr, list(tr.reports))
+            return
+
+        # Workers are spawned, forking a process with running threads (e.g. Kubernetes informers) is unsafe
+        with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn")) as executor:
+            futures = {executor.submit(generate_test_run_reports, self.system, tr, list(tr.reports)): tr for tr in trs}
+            for future in as_completed(futures):
+                tr = futures[future]
                 try:
-                    rgs.generate_report()
+                    results = future.result()
                 except Exception as e:
+                    # e.g. objects that can't be pickled, fall back to the main process
                     logging.warning(
-                        f"Error generating report for '{tr.output_path}' with strategy={reporter.__name__}: {e}"
+                        f"Worker failed to generate reports for '{tr.output_path}', generating them in the main "
+                        f"process: {e}"
                     )
+                    results = generate_test_run_reports(self.system, tr, list(tr.reports))
+                yield tr, results
+
+    def is_up_to_date(self, tr: TestRun) -> bool:
+        state_file = tr.output_path / PER_TEST_REPORT_STATE_FILE
+        try:
+            state = json.loads(state_file.read_text())
+        except (OSError, ValueError):
+            return False
+        return state.get("fingerprint") == output_fingerprint(tr.output_path, list(tr.reports))
+
+    def store_fingerprint(self, tr: TestRun) -> None:
+        if not tr.output_path.is_dir():
+            return
+        fingerprint = output_fingerprint(tr.output_path, list(tr.reports))
+        (tr.output_path / PER_TEST_REPORT_STATE_FILE).write_text(json.dumps({"fingerprint": fingerprint}))
 
 
 class StatusReporter(Reporter):
@@ -128,10 +278,14 @@ class StatusReporter(Reporter):
     def best_dse_config_file_name(self, tr: TestRun) -> str:
         return f"{tr.name}.toml"
 
+    def pareto_dse_config_file_name(self, tr: TestRun, step: int) -> str:
+        return f"{tr.name}-pareto-{step}.toml"
+
     def generate(self) -> None:
         self.load_test_runs()
         self.generate_scenario_report()
         self.report_best_dse_config()
+        self.report_pareto_dse_configs()
 
     def generate_scenario_report(self) -> None:
         template = jinja2.Environment(loader=jinja2.FileSystemLoader(self.template_file_path)).get_template(
@@ -161,16 +315,45 @@ class StatusReporter(Reporter):
                 logging.warning(f"No trajectory file found for {tr.name} at {trajectory_file}")
                 continue
 
-            df = pd.read_csv(trajectory_file)
-            best_step = df.loc[df["reward"].idxmax()]["step"]
-            best_step_details = tr_root / f"{best_step}" / CommandGenStrategy.TEST_RUN_DUMP_FILE_NAME
-            with best_step_details.open() as f:
-                trd = TestRunDetails.model_validate(toml.load(f))
+            df = lazy.pd.read_csv(trajectory_file)
+            df = df[lazy.np.isfinite(df["reward"])]
+            if df.empty:
+                logging.warning(f"No step of {tr.name} has a valid reward, not writing the best config")
+                continue
 
+            best_step = df.loc[df["reward"].idxmax()]["step"]
             best_config_path = tr_root / self.best_dse_config_file_name(tr)
             logging.info(f"Writing best config for {tr.name} to {best_config_path}")
-            with best_config_path.open("w") as f:
-                toml.dump(trd.test_definition.model_dump(), f)
+            self.dump_step_config(tr_root / f"{best_step}", best_config_path)
+
+    def report_pareto_dse_configs(self) -> None:
+        """Write a ready-to-run test TOML for every step on the Pareto front of multi-objective DSE runs."""
+        for tr in self.test_scenario.test_runs:
+            if not tr.test.test_definition.is_dse_job or not tr.test.test_definition.agent_objectives:
+                continue
+
+            tr_root = self.results_root / tr.name / f"{tr.current_iteration}"
+            front_file = tr_root / PARETO_FRONT_FILE_NAME
+            if not front_file.exists():
+                logging.warning(f"No Pareto front file found for {tr.name} at {front_file}")
+                continue
+
+            steps = lazy.pd.read_csv(front_file)["step"].tolist()
+            logging.info(f"Writing {len(steps)} Pareto-optimal configs for {tr.name} to {tr_root}")
+            for step in steps:
+                self.dump_step_config(tr_root / f"{step}", tr_root / self.pareto_dse_config_file_name(tr, step))
+
+    def dump_step_config(self, step_dir: Path, path: Path) -> None:
+        dump = step_dir / CommandGenStrategy.TEST_RUN_DUMP_FILE_NAME
+        if not dump.is_file():
+            logging.warning(f"No test run dump found at {dump}, not writing {path}")
+            return
+
+        with dump.open() as f:
+            trd = TestRunDetails.model_validate(toml.load(f))
+
+        with path.open("w") as f:
+            toml.dump(trd.test_definition.model_dump(), f)
 
 
 class TarballReporter(Reporter):
@@ -190,3 +373,109 @@ class TarballReporter(Reporter):
         with tarfile.open(tarball_path, "w:gz") as tar:
             tar.add(directory, arcname=directory.name)
         logging.info(f"Created tarball at {tarball_path}")
+
+
+JOB_ACCOUNTING_COLUMNS = [
+    "test_run",
+    "job_id",
+    "state",
+    "submit_time",
+    "queue_wait_sec",
+    "run_time_sec",
+    "total_cpu_sec",
+    "ave_cpu_sec",
+    "max_rss_bytes",
+    "consumed_energy_joules",
+    "gpus",
+    "gpu_tres_usage",
+]
+
+
+@dataclass
+class JobAccountingItem:
+    """Accounting of a single test run."""
+
+    name: str
+    job_id: int
+    state: str
+    accounting: JobAccounting
+
+    @classmethod
+    def from_run_dir(cls, name: str, run_dir: Path) -> Optional["JobAccountingItem"]:
+        try:
+            if (run_dir / "slurm-job.toml").exists():
+                slurm_job = SlurmJobMetadata.model_validate(toml.load(run_dir / "slurm-job.toml"))
+                if slurm_job.accounting is not None:
+                    return cls(name, slurm_job.job_id, slurm_job.state, slurm_job.accounting)
+            elif (run_dir / "standalone-job.toml").exists():
+                job = StandaloneJobMetadata.model_validate(toml.load(run_dir / "standalone-job.toml"))
+                return cls(name, job.job_id, "COMPLETED" if job.exit_code == 0 else "FAILED", job.accounting)
+        except Exception as e:
+            logging.debug(f"Error loading job accounting from {run_dir}: {e}")
+        return None
+
+    def row(self) -> list:
+        acc = self.accounting
+        gpu_usage = ";".join(f"{k}={v}" for k, v in sorted(acc.tres_usage.items()) if k.startswith("gres/gpu"))
+        return [
+            self.name,
+            self.job_id,
+            self.state,
+            acc.submit_time,
+            acc.queue_wait_sec,
+            acc.run_time_sec,
+            acc.total_cpu_sec,
+            acc.ave_cpu_sec,
+            acc.max_rss_bytes,
+            acc.consumed_energy_joules,
+            acc.gpus,
+            gpu_usage,
+        ]
+
+
+class JobAccountingReporter(Reporter):
+    """
+    Aggregates queue wait time, run time and resource usage of all test runs into `job-accounting.csv`.
+
+    Accounting is collected by runners at job completion: from 'sacct' into `slurm-job.toml` for Slurm and from the
+    process rusage into `standalone-job.toml` for standalone systems. Test runs without accounting are skipped. The
+    last row sums times and energy and takes the maximum RSS over all test runs.
+    """
+
+    def generate(self) -> None:
+        self.load_test_runs()
+
+        items = [item for tr in self.trs if (item := JobAccountingItem.from_run_dir(case_name(tr), tr.output_path))]
+        if not items:
+            logging.debug(f"No job accounting found in {self.results_root}")
+            return
+
+        report_path = self.results_root / "job-accounting.csv"
+        with report_path.open("w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(JOB_ACCOUNTING_COLUMNS)
+            writer.writerows(item.row() for item in items)
+            writer.writerow(self.total_row([item.accounting for item in items]))
+
+        logging.info(f"Generated job accounting report at {report_path}")
+
+    def total_row(self, accountings: list[JobAccounting]) -> list:
+        def total(values: list[Optional[float]]) -> Optional[float]:
+            known = [v for v in values if v is not None]
+            return sum(known) if known else None
+
+        rss = [acc.max_rss_bytes for acc in accountings if acc.max_rss_bytes is not None]
+        return [
+            "total",
+            "",
+            "",
+            "",
+            total([acc.queue_wait_sec for acc in accountings]),
+            total([acc.run_time_sec for acc in accountings]),
+            total([acc.total_cpu_sec for acc in accountings]),
+            "",
+            max(rss) if rss else None,
+            total([acc.consumed_energy_joules for acc in accountings]),
+            "",
+            "",
+        ]
@@ -0,0 +1,252 @@
+# SPDX-FileCopyrightText: NVIDIA CORPORATION & AFFILIATES
+# Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Iterator, Optional
+
+import toml
+
+from cloudai.core import CommandGenStrategy, TestRun
+from cloudai.util.lazy_imports import lazy
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+RESULTS_STORE_DIR = "results-store"
+ROW_GROUP_SUFFIX = ".npz"
+HEADER_KEY = "__header__"
+LABEL_TYPES = (str, int, float, bool)
+PARAMS_PREFIX = "cmd_args."
+
+
+def scenario_root(tr: TestRun) -> Optional[Path]:
+    """
+    Results directory of the scenario a test run belongs to.
+
+    Returns:
+        Optional[Path]: The directory or None if the output path of the test run does not follow the layout of
+            `BaseRunner.get_job_output_path`.
+    """
+    parts = [tr.name, str(tr.current_iteration)] + ([str(tr.step)] if tr.step > 0 else [])
+    if list(tr.output_path.parts[-len(parts) :]) != parts:
+        return None
+    return tr.output_path.parents[len(parts) - 1]
+
+
+def flatten_params(data: dict[str, Any], prefix: str = "") -> dict[str, Any]:
+    """Flatten nested test definition arguments into dotted keys, keeping only scalar values."""
+    params: dict[str, Any] = {}
+    for key, value in data.items():
+        if isinstance(value, dict):
+            params.update(flatten_params(value, f"{prefix}{key}."))
+        elif isinstance(value, LABEL_TYPES):
+            params[f"{prefix}{key}"] = value
+    return params
+
+
+def test_run_labels(tr: TestRun) -> dict[str, Any]:
+    """
+    Labels identifying a test run and its parameters.
+
+    Parameters are taken from the test run dump in the output directory, it has DSE parameters applied. The test
+    definition of the test run is used when there is no dump. Parameter labels are prefixed with `cmd_args.`, e.g.
+    `cmd_args.op_type`, so they can't clash with the test run labels.
+    """
+    labels: dict[str, Any] = {"test_run": tr.name, "iteration": tr.current_iteration, "step": tr.step}
+    dump = tr.output_path / CommandGenStrategy.TEST_RUN_DUMP_FILE_NAME
+    if dump.is_file():
+        tdef = toml.load(dump).get("test_definition", {})
+        labels["test_template_name"] = tdef.get("test_template_name", tr.test.test_definition.test_template_name)
+        cmd_args = tdef.get("cmd_args", {})
+    else:
+        labels["test_template_name"] = tr.test.test_definition.test_template_name
+        cmd_args = tr.test.test_definition.cmd_args_dict
+    return {**labels, **flatten_params(cmd_args, PARAMS_PREFIX)}
+
+
+def matches(labels: dict[str, Any], where: dict[str, Any]) -> bool:
+    """Check labels against a filter, list, tuple and set values in the filter match any of their items."""
+    for key, expected in where.items():
+        value = labels.get(key)
+        if isinstance(expected, (list, tuple, set, frozenset)):
+            if value not in expected:
+                return False
+        elif value != expected:
+            return False
+    return True
+
+
+@dataclass
+class RowGroup:
+    """
+    Header of a row group, the results of a single test run.
+
+    Attributes
+        path (Path): File of the row group.
+        labels (dict[str, Any]): Test run name, iteration, step and test definition parameters.
+        columns (list[str]): Names of the result columns.
+        json_columns (list[str]): Names of the result columns stored JSON-encoded.
+        num_rows (int): Number of result rows.
+    """
+
+    path: Path
+    labels: dict[str, Any]
+    columns: list[str]
+    json_columns: list[str]
+    num_rows: int
+
+    def load(self, columns: Optional[list[str]] = None) -> dict[str, Any]:
+        """Load result columns of the row group, all columns by default. Unknown columns are ignored."""
+        selected = [name for name in (columns if columns is not None else self.columns) if name in self.columns]
+        data: dict[str, Any] = {}
+        with lazy.np.load(self.path, allow_pickle=False) as archive:
+            for name in selected:
+                values = archive[name]
+                data[name] = json.loads(str(values)) if name in self.json_columns else values
+        return data
+
+
+class ResultsStore:
+    """
+    Append-only columnar store of test run results of a scenario.
+
+    Results are organized in tables, e.g. one table per workload. Every test run adds one row group to a table: a NumPy
+    `.npz` archive with a small JSON header (labels of the test run and the column names) and one array per result
+    column. Numeric columns are stored as they are, other columns (strings, mixed values) are stored JSON-encoded.
+    Archives are loaded without pickle support, so a row group can only contain data. Queries filter row groups by
+    their labels before loading any column, so reports over many test runs only read the results they need.
+    Re-generating the results of a test run replaces its row group.
+
+    Attributes
+        root (Path): Directory of the store.
+    """
+
+    def __init__(self, root: Path) -> None:
+        self.root = root
+
+    @classmethod
+    def for_scenario(cls, results_root: Path) -> ResultsStore:
+        return cls(results_root / RESULTS_STORE_DIR)
+
+    def row_group_path(self, table: str, tr: TestRun) -> Path:
+        return self.root / table / f"{tr.name}.{tr.current_iteration}.{tr.step}{ROW_GROUP_SUFFIX}"
+
+    def append(self, table: str, tr: TestRun, df: pd.DataFrame) -> None:
+        """
+        Store the results of a test run as a row group of a table.
+
+        Args:
+            table (str): Name of the table.
+            tr (TestRun): The test run the results belong to.
+            df (pd.DataFrame): The results.
+        """
+        path = self.row_group_path(table, tr)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        arrays: dict[str, Any] = {}
+        json_columns: list[str] = []
+        for name in df.columns:
+            values = df[name].to_numpy()
+            if values.dtype.kind in "biuf":
+                arrays[str(name)] = values
+            else:
+                arrays[str(name)] = lazy.np.array(json.dumps(values.tolist(), default=str))
+                json_columns.append(str(name))
+
+        header = {
+            "labels": test_run_labels(tr),
+            "columns": [str(c) for c in df.columns],
+            "json_columns": json_columns,
+            "num_rows": len(df),
+        }
+        arrays[HEADER_KEY] = lazy.np.array(json.dumps(header))
+
+        tmp_path: Optional[Path] = None
+        try:
+            with tempfile.NamedTemporaryFile("wb", dir=path.parent, suffix=".tmp", delete=False) as f:
+                tmp_path = Path(f.name)
+                lazy.np.savez(f, **arrays)
+            os.replace(tmp_path, path)
+        finally:
+            if tmp_path is not None:
+                tmp_path.unlink(missing_ok=True)
+
+    def row_groups(self, table: str, where: Optional[dict[str, Any]] = None) -> Iterator[RowGroup]:
+        """
+        Iterate over row groups of a table, reading only their headers.
+
+        Args:
+            table (str): Name of the table.
+            where (Optional[dict[str, Any]]): Filter on labels, see `matches`.
+
+        Yields:
+            RowGroup: Matching row groups ordered by test run name, iteration and step.
+        """
+        groups: list[RowGroup] = []
+        for path in (self.root / table).glob(f"*{ROW_GROUP_SUFFIX}"):
+            try:
+                with lazy.np.load(path, allow_pickle=False) as archive:
+                    header = json.loads(str(archive[HEADER_KEY]))
+            except Exception as e:
+                logging.debug(f"Ignoring invalid row group {path}: {e}")
+                continue
+            if matches(header["labels"], where or {}):
+                groups.append(
+                    RowGroup(path, header["labels"], header["columns"], header["json_columns"], header["num_rows"])
+                )
+
+        groups.sort(key=lambda g: (g.labels["test_run"], g.labels["iteration"], g.labels["step"]))
+        yield from groups
+
+    def scan(
+        self, table: str, where: Optional[dict[str, Any]] = None, columns: Optional[list[str]] = None
+    ) -> pd.DataFrame:
+        """
+        Load results of a table.
+
+        Args:
+            table (str): Name of the table.
+            where (Optional[dict[str, Any]]): Filter on labels, row groups that do not match are not loaded.
+            columns (Optional[list[str]]): Result columns to load, all columns by default.
+
+        Returns:
+            pd.DataFrame: Results of all matching row groups, with a column for every label.
+        """
+        frames: list[pd.DataFrame] = []
+        for group in self.row_groups(table, where):
+            frame = lazy.pd.DataFrame(group.load(columns))
+            for key, value in group.labels.items():
+                frame[key] = value
+            frames.append(frame)
+
+        if not frames:
+            return lazy.pd.DataFrame(columns=columns or [])
+        return lazy.pd.concat(frames, ignore_index=True)
+
+
+def store_results(table: str, tr: TestRun, df: pd.DataFrame) -> None:
+    """Add results of a test run to the results store of its scenario, if the scenario directory can be found."""
+    root = scenario_root(tr)
+    if root is None:
+        logging.debug(f"Not storing {table} results of {tr.name}: {tr.output_path} is not in a scenario directory")
+        return
+    ResultsStore.for_scenario(root).append(table, tr, df)
@@ -0,0 +1,182 @@
+# SPDX-FileCopyrightText: NVIDIA CORPORATION & AFFILIATES
+# Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import json
+import logging
+import threading
+from typing import Any, Callable, Optional
+
+from cloudai.util.lazy_imports import lazy
+
+FINISHED_CONDITIONS = {"Complete", "Succeeded", "Failed"}
+
+
+def is_job_object_running(job: Optional[dict[str, Any]]) -> bool:
+    """
+    Check if a job is running based on its raw API object.
+
+    Works for both batch Jobs and MPIJobs. A job without conditions is considered running, a job with a true
+    Complete, Succeeded or Failed condition is finished, otherwise it is running once it has a true Created condition.
+
+    Args:
+        job (Optional[dict[str, Any]]): Raw job object as returned by the API server, None if the job does not exist.
+
+    Returns:
+        bool: True if the job is running, False otherwise.
+    """
+    if job is None or job.get("status") is None:
+        return False
+
+    conditions = job["status"].get("conditions") or []
+    if not conditions:
+        return True
+
+    for condition in conditions:
+        if condition.get("type") in FINISHED_CONDITIONS and condition.get("status") == "True":
+            return False
+
+    return any(condition.get("type") == "Created" and condition.get("status") == "True" for condition in conditions)
+
+
+class KubernetesJobInformer:
+    """
+    In-memory cache of the jobs of one kind in a namespace, kept up to date with a single list+watch loop.
+
+    The loop runs in a daemon thread: it lists all objects once, then watches for changes starting from the listed
+    resource version, and re-lists when the watch expires. Queries are answered from the cache without contacting the
+    API server.
+
+    Attributes
+        resource (str): Name of the watched resource, used for logging.
+        list_func (Callable[..., Any]): API function that lists the objects, e.g. `BatchV1Api.list_namespaced_job`.
+        namespace (str): Namespace to watch.
+        list_kwargs (dict[str, Any]): Extra arguments for `list_func`, e.g. group and plural for custom objects.
+        watch_timeout (int): Server-side timeout of a single watch request, in seconds.
+        jobs (dict[str, dict[str, Any]]): Raw objects by name.
+        resource_version (Optional[str]): Resource version of the latest observed change.
+        synced (bool): Whether the initial list has completed.
+        failed (bool): Whether the informer was given up on because it could not sync, see `mark_failed`.
+    """
+
+    def __init__(
+        self, resource: str, list_func: Callable[..., Any], namespace: str, watch_timeout: int = 300, **list_kwargs: Any
+    ) -> None:
+        self.resource = resource
+        self.list_func = list_func
+        self.namespace = namespace
+        self.list_kwargs = list_kwargs
+        self.watch_timeout = watch_timeout
+        self.jobs: dict[str, dict[str, Any]] = {}
+        self.resource_version: Optional[str] = None
+        self.synced = False
+        self.failed = False
+        self.retry_interval = 1.0
+        self._condition = threading.Condition()
+        self._stop = threading.Event()
+        self._watch: Optional[Any] = None
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(
+            target=self._run, name=f"informer-{self.namespace}-{self.resource}", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the watch loop, it exits once the current watch request returns."""
+        self._stop.set()
+        if self._watch is not None:
+            self._watch.stop()
+
+    def mark_failed(self) -> None:
+        """Stop the informer for good after it could not sync, its users should query the API server instead."""
+        logging.warning(f"Informer for {self.resource} could not sync, falling back to direct API requests.")
+        self.failed = True
+        self.stop()
+
+    def wait_for_sync(self, timeout: float) -> bool:
+        with self._condition:
+            return self._condition.wait_for(lambda: self.synced, timeout)
+
+    def wait_for(self, name: str, timeout: float) -> bool:
+        """
+        Wait until an object with the given name is observed.
+
+        Args:
+            name (str): Name of the object.
+            timeout (float): Maximum time to wait, in seconds.
+
+        Returns:
+            bool: True if the object was observed within the timeout, False otherwise.
+        """
+        with self._condition:
+            return self._condition.wait_for(lambda: self.synced and name in self.jobs, timeout)
+
+    def get(self, name: str) -> Optional[dict[str, Any]]:
+        with self._condition:
+            return self.jobs.get(name)
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                if not self.synced:
+                    self._list()
+                self._watch_changes()
+            except lazy.k8s.client.ApiException as e:
+                if e.status != 410:
+                    logging.warning(f"Watch for {self.resource} failed: {e.reason}")
+                    self._stop.wait(self.retry_interval)
+                self.synced = False
+            except Exception as e:
+                logging.warning(f"Watch for {self.resource} failed: {e}")
+                self.synced = False
+                self._stop.wait(self.retry_interval)
+
+    def _list(self) -> None:
+        response = self.list_func(namespace=self.namespace, _preload_content=False, **self.list_kwargs)
+        data = json.loads(response.data)
+        with self._condition:
+            self.jobs = {item["metadata"]["name"]: item for item in data.get("items", [])}
+            self.resource_version = data.get("metadata", {}).get("resourceVersion")
+            self.synced = True
+            self._condition.notify_all()
+
+    def _watch_changes(self) -> None:
+        self._watch = lazy.k8s.watch.Watch()
+        for event in self._watch.stream(
+            self.list_func,
+            namespace=self.namespace,
+            resource_version=self.resource_version,
+            timeout_seconds=self.watch_timeout,
+            **self.list_kwargs,
+        ):
+            self._apply(event["type"], event["raw_object"])
+            if self._stop.is_set():
+                break
+
+    def _apply(self, event_type: str, obj: dict[str, Any]) -> None:
+        metadata = obj.get("metadata", {})
+        with self._condition:
+            if event_type in {"ADDED", "MODIFIED"}:
+                self.jobs[metadata["name"]] = obj
+            elif event_type == "DELETED":
+                self.jobs.pop(metadata["name"], None)
+            self.resource_version = metadata.get("resourceVersion", self.resource_version)
+            self._condition.notify_all()
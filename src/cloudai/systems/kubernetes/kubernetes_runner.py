@@ -26,6 +26,16 @@ from .kubernetes_system import KubernetesSystem
 class KubernetesRunner(BaseRunner):
     """Implementation of the Runner for a system using Kubernetes."""
 
+    async def run(self):
+        try:
+            await super().run()
+        finally:
+            cast(KubernetesSystem, self.system).stop_job_informers()
+
+    async def shutdown(self):
+        await super().shutdown()
+        cast(KubernetesSystem, self.system).stop_job_informers()
+
     def _submit_test(self, tr: TestRun) -> KubernetesJob:
         logging.info(f"Running test: {tr.name}")
         tr.output_path = self.get_job_output_path(tr)
@@ -16,21 +16,28 @@
 
 from __future__ import annotations
 
+import json
 import logging
-import time
+import shutil
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Dict, List, Optional, cast
 
 if TYPE_CHECKING:
     import kubernetes as k8s
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
 
 from cloudai.core import BaseJob, System
 from cloudai.util.lazy_imports import lazy
 
+from .kubernetes_informer import KubernetesJobInformer, is_job_object_running
 from .kubernetes_job import KubernetesJob
 
+INFORMER_SYNC_TIMEOUT = 10.0
+LOG_CHUNK_SIZE = 1024 * 1024
+
 
 class KubernetesSystem(BaseModel, System):
     """
@@ -45,9 +52,12 @@ class KubernetesSystem(BaseModel, System):
         scheduler (str): The scheduler type, default is "kubernetes".
         global_env_vars (Dict[str, Any]): Global environment variables to be passed to jobs.
         monitor_interval (int): Time interval to monitor jobs, in seconds.
+        log_download_concurrency (int): Maximum number of pod logs downloaded at the same time.
         _core_v1 (client.CoreV1Api): Kubernetes Core V1 API client instance.
         _batch_v1 (client.BatchV1Api): Kubernetes Batch V1 API client instance.
         _custom_objects_api (CustomObjectsApi): Kubernetes Custom Objects API client instance.
+        _job_informers (Dict[str, KubernetesJobInformer]): Watch caches of jobs, one per job kind.
+        _informers_lock (threading.Lock): Guards `_job_informers`.
     """
 
     model_config = ConfigDict(extra="forbid", arbitrary_types_allowed=True)
@@ -60,13 +70,18 @@ class KubernetesSystem(BaseModel, System):
     scheduler: str = "kubernetes"
     global_env_vars: Dict[str, Any] = {}
     monitor_interval: int = 1
+    log_download_concurrency: int = Field(default=16, ge=1)
     _core_v1: Optional[k8s.client.CoreV1Api] = None
     _batch_v1: Optional[k8s.client.BatchV1Api] = None
     _custom_objects_api: Optional[k8s.client.CustomObjectsApi] = None
+    _job_informers: Dict[str, KubernetesJobInformer] = {}
+    _informers_lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
 
     def __getstate__(self) -> dict[str, Any]:
         """Return the state for pickling, excluding non-picklable Kubernetes client objects."""
-        state = self.model_dump(exclude={"_core_v1", "_batch_v1", "_custom_objects_api"})
+        state = self.model_dump(
+            exclude={"_core_v1", "_batch_v1", "_custom_objects_api", "_job_informers", "_informers_lock"}
+        )
         return state
 
     def __deepcopy__(self, memo: dict[int, Any] | None = None) -> "KubernetesSystem":  # noqa: Vulture
@@ -108,6 +123,7 @@ class KubernetesSystem(BaseModel, System):
         self._core_v1 = lazy.k8s.client.CoreV1Api()
         self._batch_v1 = lazy.k8s.client.BatchV1Api()
         self._custom_objects_api = lazy.k8s.client.CustomObjectsApi()
+        self._job_informers = {}
 
         logging.debug(f"{self.__class__.__name__} initialized")
 
@@ -189,111 +205,111 @@ class KubernetesSystem(BaseModel, System):
             bool: True if the job is running, False if the job has completed or is not found.
         """
         logging.debug(f"Checking for job '{job_name}' of kind '{job_kind}' to determine if it is running.")
+        return is_job_object_running(self._get_job_object(job_name, job_kind))
 
+    def _job_kind_key(self, job_kind: str) -> str:
         if "mpijob" in job_kind.lower():
-            return self._is_mpijob_running(job_name)
+            return "mpijob"
         elif "job" in job_kind.lower():
-            return self._is_batch_job_running(job_name)
-        else:
-            error_message = (
-                f"Unsupported job kind: '{job_kind}'. Supported kinds are 'MPIJob' for MPI workloads and 'Job' for "
-                f"batch jobs. Please verify that the 'job_kind' field is correctly set in the job specification."
-            )
-            logging.error(error_message)
-            raise ValueError(error_message)
-
-    def _is_mpijob_running(self, job_name: str) -> bool:
-        """
-        Check if an MPIJob is currently running.
+            return "job"
 
-        Args:
-            job_name (str): The name of the MPIJob.
+        error_message = (
+            f"Unsupported job kind: '{job_kind}'. Supported kinds are 'MPIJob' for MPI workloads and 'Job' for "
+            f"batch jobs. Please verify that the 'job_kind' field is correctly set in the job specification."
+        )
+        logging.error(error_message)
+        raise ValueError(error_message)
 
-        Returns:
-            bool: True if the MPIJob is running, False if the MPIJob has completed or is not found.
+    def job_informer(self, job_kind: str) -> KubernetesJobInformer:
         """
-        try:
-            mpijob = self.custom_objects_api.get_namespaced_custom_object(
-                group="kubeflow.org",
-                version="v2beta1",
-                namespace=self.default_namespace,
-                plural="mpijobs",
-                name=job_name,
-            )
+        Return the informer that caches jobs of the given kind, starting it on first use.
 
-            assert isinstance(mpijob, dict)
-            status: dict = cast(dict, mpijob.get("status", {}))
-            conditions = status.get("conditions", [])
+        One informer per kind is shared by all jobs, so job status checks do not contact the API server.
 
-            # Consider an empty conditions list as running
-            if not conditions:
-                return True
-
-            for condition in conditions:
-                if condition["type"] == "Succeeded" and condition["status"] == "True":
-                    return False
-                if condition["type"] == "Failed" and condition["status"] == "True":
-                    return False
-
-            # If the job has been created but is neither succeeded nor failed, it is considered running
-            return any(condition["type"] == "Created" and condition["status"] == "True" for condition in conditions)
-
-        except lazy.k8s.client.ApiException as e:
-            if e.status == 404:
-                logging.debug(f"MPIJob '{job_name}' not found. It may have completed and been removed from the system.")
-                return False
-            else:
-                error_message = (
-                    f"Error occurred while retrieving status for MPIJob '{job_name}' "
-                    f"Error code: {e.status}. Message: {e.reason}. Please check the job name, namespace, and "
-                    "Kubernetes API server."
-                )
-                logging.error(error_message)
-                raise
+        Args:
+            job_kind (str): The kind of the job ('MPIJob' or 'Job').
 
-    def _is_batch_job_running(self, job_name: str) -> bool:
-        """
-        Check if a batch job is currently running.
+        Returns:
+            KubernetesJobInformer: The informer for the job kind.
+        """
+        key = self._job_kind_key(job_kind)
+        with self._informers_lock:
+            informer = self._job_informers.get(key)
+            if informer is None:
+                if key == "mpijob":
+                    informer = KubernetesJobInformer(
+                        "mpijobs",
+                        self.custom_objects_api.list_namespaced_custom_object,
+                        self.default_namespace,
+                        group="kubeflow.org",
+                        version="v2beta1",
+                        plural="mpijobs",
+                    )
+                else:
+                    informer = KubernetesJobInformer("jobs", self.batch_v1.list_namespaced_job, self.default_namespace)
+                informer.start()
+                self._job_informers[key] = informer
+        return informer
+
+    def stop_job_informers(self) -> None:
+        """Stop all job informers, they are started again on the next job status check."""
+        with self._informers_lock:
+            for informer in self._job_informers.values():
+                informer.stop()
+            self._job_informers.clear()
+
+    def _get_job_object(self, job_name: str, job_kind: str) -> Optional[dict[str, Any]]:
+        """
+        Get the raw job object from the informer cache.
+
+        Falls back to reading the job from the API server if the informer could not sync. The informer is given up
+        on after the first failed sync, so that following calls do not wait for it again.
 
         Args:
-            job_name (str): The name of the batch job.
+            job_name (str): The name of the job.
+            job_kind (str): The kind of the job ('MPIJob' or 'Job').
 
         Returns:
-            bool: True if the batch job is running, False if the job has completed or is not found.
+            Optional[dict[str, Any]]: The raw job object, None if the job is not found.
         """
-        try:
-            k8s_job: Any = self.batch_v1.read_namespaced_job_status(name=job_name, namespace=self.default_namespace)
-
-            if not (hasattr(k8s_job, "status") and hasattr(k8s_job.status, "conditions")):
-                logging.debug(f"Job '{job_name}' does not have expected status attributes.")
-                return False
+        informer = self.job_informer(job_kind)
+        if not informer.failed:
+            if informer.wait_for_sync(INFORMER_SYNC_TIMEOUT):
+                return informer.get(job_name)
+            informer.mark_failed()
 
-            conditions = k8s_job.status.conditions or []
+        logging.debug(f"Informer for '{job_kind}' is not synced, reading job '{job_name}' from the API server.")
+        return self._read_job_object(job_name, job_kind)
 
-            # Consider an empty conditions list as running
-            if not conditions:
-                return True
-
-            for condition in conditions:
-                if condition.type == "Complete" and condition.status == "True":
-                    return False
-                if condition.type == "Failed" and condition.status == "True":
-                    return False
-
-            return any(condition.type == "Created" and condition.status == "True" for condition in conditions)
+    def _read_job_object(self, job_name: str, job_kind: str) -> Optional[dict[str, Any]]:
+        try:
+            if self._job_kind_key(job_kind) == "mpijob":
+                return cast(
+                    dict,
+                    self.custom_objects_api.get_namespaced_custom_object(
+                        group="kubeflow.org",
+                        version="v2beta1",
+                        namespace=self.default_namespace,
+                        plural="mpijobs",
+                        name=job_name,
+                    ),
+                )
 
+            response = self.batch_v1.read_namespaced_job_status(
+                name=job_name, namespace=self.default_namespace, _preload_content=False
+            )
+            return json.loads(cast(Any, response).data)
         except lazy.k8s.client.ApiException as e:
             if e.status == 404:
-                logging.debug(
-                    f"Batch job '{job_name}' not found.It may have completed and been removed from the system."
-                )
-                return False
-            else:
-                logging.error(
-                    f"Error occurred while retrieving status for batch job '{job_name}'."
-                    f"Error code: {e.status}. Message: {e.reason}. Please check the job name and Kubernetes API server."
-                )
-                raise
+                logging.debug(f"Job '{job_name}' not found. It may have completed and been removed from the system.")
+                return None
+
+            logging.error(
+                f"Error occurred while retrieving status for job '{job_name}' of kind '{job_kind}'. "
+                f"Error code: {e.status}. Message: {e.reason}. Please check the job name, namespace, and "
+                "Kubernetes API server."
+            )
+            raise
 
     def kill(self, job: BaseJob) -> None:
         """
@@ -371,14 +387,13 @@ class KubernetesSystem(BaseModel, System):
 
         logging.debug(f"Batch job '{job_name}' deleted with status: {api_response.status}")
 
-    def create_job(self, job_spec: Dict[Any, Any], timeout: int = 60, interval: int = 1) -> str:
+    def create_job(self, job_spec: Dict[Any, Any], timeout: int = 60) -> str:
         """
         Create a job in the Kubernetes system in a blocking manner.
 
         Args:
             job_spec (Dict[Any, Any]): The job specification.
             timeout (int): The maximum time to wait for the job to be created and observable.
-            interval (int): The time to wait between checks, in seconds.
 
         Returns:
             str: The job name.
@@ -389,15 +404,15 @@ class KubernetesSystem(BaseModel, System):
         """
         logging.debug(f"Creating job with spec: {job_spec}")
         job_name = self._create_job(job_spec)
+        job_kind = job_spec.get("kind", "")
 
         # Wait for the job to be observable by Kubernetes
-        start_time = time.time()
-        while time.time() - start_time < timeout:
-            if self._is_job_observable(job_name, job_spec.get("kind", "")):
-                logging.debug(f"Job '{job_name}' is now observable.")
-                return job_name
-            logging.debug(f"Waiting for job '{job_name}' to become observable...")
-            time.sleep(interval)
+        logging.debug(f"Waiting for job '{job_name}' to become observable...")
+        informer = self.job_informer(job_kind)
+        observed = not informer.failed and informer.wait_for(job_name, timeout)
+        if observed or self._is_job_observable(job_name, job_kind):
+            logging.debug(f"Job '{job_name}' is now observable.")
+            return job_name
 
         raise TimeoutError(f"Job '{job_name}' was not observable within {timeout} seconds.")
 
@@ -484,75 +499,7 @@ class KubernetesSystem(BaseModel, System):
             bool: True if the job is observable, False otherwise.
         """
         logging.debug(f"Checking if job '{job_name}' of kind '{job_kind}' is observable.")
-
-        if "mpijob" in job_kind.lower():
-            return self._is_mpijob_observable(job_name)
-        elif "job" in job_kind.lower():
-            return self._is_batch_job_observable(job_name)
-        else:
-            logging.error(f"Unsupported job kind: '{job_kind}'")
-            return False
-
-    def _is_mpijob_observable(self, job_name: str) -> bool:
-        """
-        Check if an MPIJob is observable by the Kubernetes client.
-
-        Args:
-            job_name (str): The name of the MPIJob.
-
-        Returns:
-            bool: True if the MPIJob is observable, False otherwise.
-        """
-        logging.debug(f"Attempting to observe MPIJob '{job_name}'.")
-        try:
-            api_instance = self.custom_objects_api
-            mpijob = api_instance.get_namespaced_custom_object(
-                group="kubeflow.org",
-                version="v2beta1",
-                namespace=self.default_namespace,
-                plural="mpijobs",
-                name=job_name,
-            )
-            if mpijob:
-                logging.debug(f"MPIJob '{job_name}' found with details: {mpijob}.")
-                return True
-            else:
-                logging.debug(f"MPIJob '{job_name}' is not yet observable.")
-                return False
-        except lazy.k8s.client.ApiException as e:
-            if e.status == 404:
-                logging.debug(f"MPIJob '{job_name}' not found.")
-                return False
-            else:
-                logging.error(
-                    f"An error occurred while checking if MPIJob '{job_name}' is observable: {e.reason}. "
-                    f"Please check the job name, namespace, and Kubernetes API server."
-                )
-                raise
-
-    def _is_batch_job_observable(self, job_name: str) -> bool:
-        """
-        Check if a batch job is observable by the Kubernetes client.
-
-        Args:
-            job_name (str): The name of the batch job.
-
-        Returns:
-            bool: True if the batch job is observable, False otherwise.
-        """
-        logging.debug(f"Attempting to observe batch job '{job_name}'.")
-        try:
-            return self.batch_v1.read_namespaced_job_status(name=job_name, namespace=self.default_namespace) is not None
-        except lazy.k8s.client.ApiException as e:
-            if e.status == 404:
-                logging.debug(f"Batch job '{job_name}' not found.")
-                return False
-            else:
-                logging.error(
-                    f"An error occurred while checking if batch job '{job_name}' is observable: {e.reason}. "
-                    f"Please check the job name, namespace, and Kubernetes API server."
-                )
-                raise
+        return self._get_job_object(job_name, job_kind) is not None
 
     def list_jobs(self) -> List[Any]:
         """
@@ -582,6 +529,9 @@ class KubernetesSystem(BaseModel, System):
         """
         Retrieve and store logs for all pods associated with a given job.
 
+        Pod logs are streamed straight to per-pod files, up to `log_download_concurrency` pods at a time. `stdout.txt`
+        is then assembled from the per-pod files.
+
         Args:
             job_name (str): The name of the job.
             output_dir (Path): The directory where logs will be saved.
@@ -593,24 +543,48 @@ class KubernetesSystem(BaseModel, System):
 
         output_dir.mkdir(parents=True, exist_ok=True)
 
+        with ThreadPoolExecutor(max_workers=min(self.log_download_concurrency, len(pod_names))) as executor:
+            stored = list(executor.map(lambda pod_name: self._store_pod_log(pod_name, output_dir), pod_names))
+
         stdout_file_path = output_dir / "stdout.txt"
+        with stdout_file_path.open("wb") as stdout_file:
+            for pod_name, ok in zip(pod_names, stored, strict=True):
+                if not ok:
+                    continue
+                with (output_dir / f"{pod_name}.txt").open("rb") as log_file:
+                    shutil.copyfileobj(log_file, stdout_file)
+                stdout_file.write(b"\n")
 
-        with stdout_file_path.open("w") as stdout_file:
-            for pod_name in pod_names:
-                try:
-                    logs = self.core_v1.read_namespaced_pod_log(name=pod_name, namespace=self.default_namespace)
+        logging.info(f"All logs concatenated and saved to '{stdout_file_path}'")
 
-                    log_file_path = output_dir / f"{pod_name}.txt"
-                    with log_file_path.open("w") as log_file:
-                        log_file.write(logs)
-                    logging.info(f"Logs for pod '{pod_name}' saved to '{log_file_path}'")
+    def _store_pod_log(self, pod_name: str, output_dir: Path) -> bool:
+        """
+        Stream the log of a pod to a file.
 
-                    stdout_file.write(logs + "\n")
+        Args:
+            pod_name (str): The name of the pod.
+            output_dir (Path): The directory where the log will be saved.
 
-                except lazy.k8s.client.ApiException as e:
-                    logging.error(f"Error retrieving logs for pod '{pod_name}': {e}")
+        Returns:
+            bool: True if the log was stored, False otherwise.
+        """
+        log_file_path = output_dir / f"{pod_name}.txt"
+        try:
+            response = self.core_v1.read_namespaced_pod_log(
+                name=pod_name, namespace=self.default_namespace, _preload_content=False
+            )
+            try:
+                with log_file_path.open("wb") as log_file:
+                    for chunk in response.stream(LOG_CHUNK_SIZE):
+                        log_file.write(chunk)
+            finally:
+                response.release_conn()
+        except lazy.k8s.client.ApiException as e:
+            logging.error(f"Error retrieving logs for pod '{pod_name}': {e}")
+            return False
 
-        logging.info(f"All logs concatenated and saved to '{stdout_file_path}'")
+        logging.info(f"Logs for pod '{pod_name}' saved to '{log_file_path}'")
+        return True
 
     def get_pod_names_for_job(self, job_name: str) -> List[str]:
         """
@@ -624,10 +598,10 @@ class KubernetesSystem(BaseModel, System):
         """
         pod_names = []
         try:
-            pods = self.core_v1.list_namespaced_pod(namespace=self.default_namespace)
-            for pod in pods.items:
-                if pod.metadata.labels and pod.metadata.labels.get("training.kubeflow.org/job-name") == job_name:
-                    pod_names.append(pod.metadata.name)
+            pods = self.core_v1.list_namespaced_pod(
+                namespace=self.default_namespace, label_selector=f"training.kubeflow.org/job-name={job_name}"
+            )
+            pod_names = [pod.metadata.name for pod in pods.items]
         except lazy.k8s.client.ApiException as e:
             logging.error(f"Error retrieving pods for job '{job_name}': {e}")
         return pod_names
@@ -16,40 +16,76 @@
 
 import logging
 import ssl
+import time
 from pathlib import Path
 from typing import Any, Dict, Optional
 
 import requests
 import websockets
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 
 class RunAIRestClient:
     """
     Client to interact with the RunAI REST API endpoints.
 
+    All requests go through one `requests.Session` with a connection pool, so connections are kept alive and reused
+    between calls. Idempotent requests are retried with exponential backoff on 429 and 5xx responses, and the access
+    token is refreshed when it expires or the server rejects it.
+
     REST API documentation can be found at https://api-docs.run.ai/latest/
     """
 
-    def __init__(self, base_url: str, app_id: str, app_secret: str) -> None:
+    RETRY_STATUSES = (429, 500, 502, 503, 504)
+    TOKEN_EXPIRY_MARGIN = 60.0
+
+    def __init__(
+        self,
+        base_url: str,
+        app_id: str,
+        app_secret: str,
+        pool_size: int = 10,
+        timeout: float = 30.0,
+        max_retries: int = 3,
+        backoff_factor: float = 0.5,
+    ) -> None:
         """
         Initialize the client and automatically retrieve the access token.
 
         To generate `app_id` and `app_secret`, create a new application in the target RunAI cluster with a unique name.
         Upon creation, the Client ID and Client secret will be returned, which correspond to `app_id` and
         `app_secret` respectively.
+
+        Args:
+            base_url (str): The base URL for the RunAI API.
+            app_id (str): The application ID for authentication.
+            app_secret (str): The application secret for authentication.
+            pool_size (int): Maximum number of connections kept alive to the API server.
+            timeout (float): Timeout in seconds for connecting to and reading from the API server.
+            max_retries (int): Number of retries for failed idempotent requests and connection errors.
+            backoff_factor (float): Base delay in seconds for exponential backoff between retries.
         """
         self.app_id = app_id
         self.app_secret = app_secret
         self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
         self.session = requests.Session()
-        self.access_token = self._get_access_token()
+        retry = Retry(
+            total=max_retries,
+            backoff_factor=backoff_factor,
+            status_forcelist=self.RETRY_STATUSES,
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
         self.session.headers.update(
-            {
-                "Accept": "application/json",
-                "Content-Type": "application/json",
-                "Authorization": f"Bearer {self.access_token}",
-            }
+            {"Accept": "application/json", "Content-Type": "application/json", "Connection": "keep-alive"}
         )
+        self.token_expires_at: Optional[float] = None
+        self.access_token = ""
+        self._refresh_access_token()
 
     # --- Private utility method ---
     def _request(
@@ -62,7 +98,13 @@ class RunAIRestClient:
         """Make an HTTP request and return JSON."""
         url: str = f"{self.base_url}{path}"
         try:
-            response = requests.request(method, url, headers=self.session.headers, params=params, json=data)
+            self._ensure_access_token()
+            response = self.session.request(method, url, params=params, json=data, timeout=self.timeout)
+            if response.status_code == 401:
+                logging.debug("Access token was rejected, refreshing it.")
+                self._refresh_access_token()
+                response = self.session.request(method, url, params=params, json=data, timeout=self.timeout)
+
             response.raise_for_status()
             return response.json() if response.text else None
         except requests.exceptions.HTTPError as http_err:
@@ -74,18 +116,36 @@ class RunAIRestClient:
             logging.error(f"An error occurred: {err}")
             raise
 
+    def _ensure_access_token(self) -> None:
+        if self.token_expires_at is not None and time.monotonic() >= self.token_expires_at:
+            self._refresh_access_token()
+
+    def _authorization_header(self) -> str:
+        """Return the current Authorization header value, the token is refreshed first if it has expired."""
+        self._ensure_access_token()
+        return str(self.session.headers["Authorization"])
+
+    def _refresh_access_token(self) -> None:
+        self.access_token = self._get_access_token()
+        self.session.headers["Authorization"] = f"Bearer {self.access_token}"
+
     def _get_access_token(self) -> str:
         """Retrieve an access token using AppId and AppSecret."""
         url = f"{self.base_url}/api/v1/token"
         payload = {"grantType": "app_token", "AppId": self.app_id, "AppSecret": self.app_secret}
 
         try:
-            response = self.session.post(url, json=payload)
+            response = self.session.post(url, json=payload, timeout=self.timeout)
             response.raise_for_status()
             data = response.json()
             token = data.get("accessToken")
             if not token:
                 raise ValueError("access_token not found in response")
+
+            expires_in = data.get("expiresIn")
+            self.token_expires_at = None
+            if isinstance(expires_in, (int, float)):
+                self.token_expires_at = time.monotonic() + max(float(expires_in) - self.TOKEN_EXPIRY_MARGIN, 0.0)
             return token
         except requests.exceptions.HTTPError as http_err:
             logging.error(f"HTTP error occurred while retrieving access token: {http_err}")
@@ -487,13 +547,18 @@ class RunAIRestClient:
     # ============================ Cluster API ============================
     def is_cluster_api_available(self, cluster_domain: str) -> bool:
         url = f"{cluster_domain}/cluster-api/status"
+        self._ensure_access_token()
+        # Authorization comes from the session headers, so it is always the current token
         headers = {
-            "Authorization": f"Bearer {self.access_token}",
             "User-Agent": "runai-cli/2.21.3-saas.4 sdk/2.74.5 go/go1.23.7 darwin/arm64",
             "Accept-Encoding": "gzip",
             "Content-Length": "0",
         }
-        response = requests.get(url, headers=headers)
+        response = self.session.get(url, headers=headers, timeout=self.timeout)
+        if response.status_code == 401:
+            logging.debug("Access token was rejected, refreshing it.")
+            self._refresh_access_token()
+            response = self.session.get(url, headers=headers, timeout=self.timeout)
         return "OK" in response.text
 
     async def fetch_training_logs(
@@ -506,7 +571,7 @@ class RunAIRestClient:
         cluster_domain = cluster_domain.replace("https://", "wss://")
         url = f"{cluster_domain}/cluster-api/api/v1/{project_name}/workloads/training/runai/{training_task_name}/logs"
         headers = {
-            "Authorization": f"Bearer {self.access_token}",
+            "Authorization": self._authorization_header(),
             "User-Agent": "Go-http-client/1.1",
             "Accept-Encoding": "gzip",
         }
@@ -38,6 +38,7 @@ class SingleSbatchRunner(SlurmRunner):
         self.cmd_shell = CommandShell()
         self.system = cast(SlurmSystem, system)
         self.job_name = "cloudai-single-sbatch"
+        self._unrolled_trs: Optional[tuple[list[TestRun], list[TestRun]]] = None
 
     def get_sbatch_directives(self) -> list[str]:
         max_nodes, node_list = self.extract_sbatch_nodes_spec()
@@ -124,13 +125,11 @@ class SingleSbatchRunner(SlurmRunner):
         return srun_cmd
 
     def unroll_dse(self, tr: TestRun) -> Generator[TestRun, None, None]:
-        for idx, combination in enumerate(tr.all_combinations):
+        for idx, combination in tr.feasible_combinations():
             next_tr = tr.apply_params_set(combination)
             next_tr.step = idx + 1
             next_tr.output_path = self.get_job_output_path(next_tr)
-
-            if next_tr.test.test_definition.constraint_check(next_tr):
-                yield next_tr
+            yield next_tr
 
     def get_global_env_vars(self) -> str:
         vars: list[str] = []
@@ -169,15 +168,30 @@ class SingleSbatchRunner(SlurmRunner):
         content.append("")
         return "\n".join(content)
 
+    @staticmethod
+    def _same_test_runs(left: list[TestRun], right: list[TestRun]) -> bool:
+        return len(left) == len(right) and all(a is b for a, b in zip(left, right, strict=True))
+
     @property
     def all_trs(self) -> Generator[TestRun, None, None]:
-        for tr in self.test_scenario.test_runs:
-            if tr.is_dse_job:
-                for _tr in self.unroll_dse(tr):
-                    yield _tr
-            else:
-                tr.output_path = self.get_job_output_path(tr)
-                yield tr
+        """
+        Iterate over all test runs of the scenario with DSE jobs unrolled.
+
+        Unrolling is done once per set of scenario test runs, later iterations reuse the result. The memo holds the
+        scenario test runs it was built from and is reused only if they are the same objects.
+        """
+        scenario_trs = list(self.test_scenario.test_runs)
+        if self._unrolled_trs is None or not self._same_test_runs(self._unrolled_trs[0], scenario_trs):
+            trs: list[TestRun] = []
+            for tr in self.test_scenario.test_runs:
+                if tr.is_dse_job:
+                    trs.extend(self.unroll_dse(tr))
+                else:
+                    tr.output_path = self.get_job_output_path(tr)
+                    trs.append(tr)
+            self._unrolled_trs = (scenario_trs, trs)
+
+        yield from self._unrolled_trs[1]
 
     async def run(self):
         if self.shutting_down:
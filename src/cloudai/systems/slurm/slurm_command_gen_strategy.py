@@ -141,9 +141,16 @@ class SlurmCommandGenStrategy(CommandGenStrategy):
         strategy = cast(SlurmCommandGenStrategy, strategy_cls(self.system, tr))
         return strategy
 
-    def _set_hook_output_path(self, tr: TestRun, base_output_path: Path) -> None:
-        tr.output_path = base_output_path / tr.test.name
-        tr.output_path.mkdir(parents=True, exist_ok=True)
+    def _hook_test_run(self, tr: TestRun, base_output_path: Path) -> TestRun:
+        """
+        Create a copy of a hook test run with its output_path set under the given base output path.
+
+        Hook test runs are shared by all test runs of the scenario, and commands are generated concurrently, so the
+        shared instance must not be modified.
+        """
+        hook_tr = tr.variant(output_path=base_output_path / tr.test.name)
+        hook_tr.output_path.mkdir(parents=True, exist_ok=True)
+        return hook_tr
 
     def pre_test_srun_extra_args(self, tr: TestRun) -> list[str]:
         """
@@ -168,9 +175,9 @@ class SlurmCommandGenStrategy(CommandGenStrategy):
         pre_test_commands = []
         success_vars = []
 
-        for idx, tr in enumerate(pre_test.test_runs):
+        for idx, hook_tr in enumerate(pre_test.test_runs):
+            tr = self._hook_test_run(hook_tr, base_output_path / "pre_test")
             strategy = self._get_cmd_gen_strategy(tr)
-            strategy._set_hook_output_path(tr, base_output_path / "pre_test")
             srun_command = strategy.gen_srun_command()
             srun_command_with_output = srun_command.replace(
                 "srun ", f"srun --output={tr.output_path / 'stdout.txt'} --error={tr.output_path / 'stderr.txt'} "
@@ -199,9 +206,9 @@ class SlurmCommandGenStrategy(CommandGenStrategy):
             str: A string with all the Slurm srun commands generated for the post-test.
         """
         post_test_commands = []
-        for tr in post_test.test_runs:
+        for hook_tr in post_test.test_runs:
+            tr = self._hook_test_run(hook_tr, base_output_path / "post_test")
             strategy = self._get_cmd_gen_strategy(tr)
-            strategy._set_hook_output_path(tr, base_output_path / "post_test")
             srun_command = strategy.gen_srun_command()
             srun_command_with_output = srun_command.replace(
                 "srun ", f"srun --output={tr.output_path / 'stdout.txt'} --error={tr.output_path / 'stderr.txt'} "
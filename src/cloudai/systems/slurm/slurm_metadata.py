@@ -16,10 +16,111 @@
 
 from __future__ import annotations
 
+import re
+from datetime import datetime
 from pathlib import Path
+from typing import Optional
 
 from pydantic import BaseModel, ConfigDict, field_serializer
 
+from cloudai.models.job_accounting import JobAccounting
+
+SACCT_ACCOUNTING_FIELDS = [
+    "JobID",
+    "Submit",
+    "Start",
+    "ElapsedRAW",
+    "TotalCPU",
+    "AveCPU",
+    "MaxRSS",
+    "ConsumedEnergyRaw",
+    "AllocTRES",
+    "TRESUsageInTot",
+]
+
+SACCT_SIZE_UNITS = {"K": 1024, "M": 1024**2, "G": 1024**3, "T": 1024**4, "P": 1024**5}
+
+
+def parse_sacct_duration(value: str) -> Optional[float]:
+    """Convert a 'sacct' duration in `[DD-[HH:]]MM:SS[.sss]` format to seconds."""
+    days, _, clock = value.rpartition("-")
+    try:
+        seconds = sum(float(part) * 60**i for i, part in enumerate(reversed(clock.split(":"))))
+        return int(days or 0) * 86400 + seconds
+    except ValueError:
+        return None
+
+
+def parse_sacct_size(value: str) -> Optional[int]:
+    """Convert a 'sacct' size like `1234K` or `1.5G` to bytes, plain numbers are bytes."""
+    multiplier = SACCT_SIZE_UNITS.get(value[-1:].upper())
+    try:
+        return int(float(value[:-1] if multiplier else value) * (multiplier or 1))
+    except ValueError:
+        return None
+
+
+def parse_sacct_time(value: str) -> Optional[datetime]:
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        return None
+
+
+def parse_tres(value: str) -> dict[str, str]:
+    """Split a TRES string like `cpu=8,mem=64G,gres/gpu=8` into a dictionary."""
+    return dict(item.split("=", 1) for item in value.split(",") if "=" in item)
+
+
+def accounting_from_sacct_output(
+    output: str, delimiter: str, format_fields: Optional[list[str]] = None
+) -> dict[str, JobAccounting]:
+    """
+    Parse 'sacct' output with SACCT_ACCOUNTING_FIELDS columns.
+
+    Maximum RSS is reported by 'sacct' only for job steps, the job itself gets the maximum over its steps.
+
+    Args:
+        output (str): Output of 'sacct -p --noheader' with the SACCT_ACCOUNTING_FIELDS format.
+        delimiter (str): Field delimiter.
+        format_fields (Optional[list[str]]): Columns of the output if they differ from SACCT_ACCOUNTING_FIELDS, they
+            must include all of SACCT_ACCOUNTING_FIELDS, other columns are ignored.
+
+    Returns:
+        dict[str, JobAccounting]: Accounting by full job or step ID, e.g. `123`, `123.batch` or `123.0`.
+    """
+    format_fields = format_fields or SACCT_ACCOUNTING_FIELDS
+    accounting: dict[str, JobAccounting] = {}
+    for line in output.splitlines():
+        data = line.split(delimiter)
+        if len(data) < len(format_fields) or not data[0]:
+            continue
+
+        fields = dict(zip(format_fields, data, strict=False))
+        submit, start = parse_sacct_time(fields["Submit"]), parse_sacct_time(fields["Start"])
+        accounting[fields["JobID"]] = JobAccounting(
+            submit_time=fields["Submit"] if submit else "",
+            queue_wait_sec=(start - submit).total_seconds() if submit and start else None,
+            run_time_sec=float(fields["ElapsedRAW"]) if fields["ElapsedRAW"].isdigit() else None,
+            total_cpu_sec=parse_sacct_duration(fields["TotalCPU"]),
+            ave_cpu_sec=parse_sacct_duration(fields["AveCPU"]),
+            max_rss_bytes=parse_sacct_size(fields["MaxRSS"]),
+            consumed_energy_joules=int(fields["ConsumedEnergyRaw"]) if fields["ConsumedEnergyRaw"].isdigit() else None,
+            alloc_tres=parse_tres(fields["AllocTRES"]),
+            tres_usage=parse_tres(fields["TRESUsageInTot"]),
+        )
+
+    for job_id, job_accounting in accounting.items():
+        steps_rss = [
+            step.max_rss_bytes
+            for step_id, step in accounting.items()
+            if re.split(r"[.+]", step_id, maxsplit=1)[0] == job_id and step.max_rss_bytes is not None
+        ]
+        if job_accounting.max_rss_bytes is None and steps_rss:
+            job_accounting.max_rss_bytes = max(steps_rss)
+
+    return accounting
+
 
 class _SlurmStepMetadataBase(BaseModel):
     """Represents the metadata of a Slurm job step."""
@@ -33,6 +134,7 @@ class _SlurmStepMetadataBase(BaseModel):
     end_time: str
     elapsed_time_sec: int
     exit_code: str
+    accounting: Optional[JobAccounting] = None
 
 
 class SlurmStepMetadata(_SlurmStepMetadataBase):
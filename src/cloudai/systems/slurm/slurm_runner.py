@@ -116,7 +116,12 @@ class SlurmRunner(BaseRunner):
     def store_job_metadata(self, job: SlurmJob):
         system = cast(SlurmSystem, self.system)
         steps_metadata = [self._mock_job_metadata()] if self.mode == "dry-run" else system.get_job_status(job)
+        if self.mode == "run":
+            accounting = system.get_job_accounting(job)
+            for step in steps_metadata:
+                step.accounting = accounting.get(f"{step.job_id}.{step.step_id}" if step.step_id else str(step.job_id))
         slurm_job_file, job_meta = self._get_job_metadata(job, steps_metadata)
+        job_meta.accounting = steps_metadata[0].accounting
 
         logging.debug(f"Storing job metadata for job {job.id} to {slurm_job_file}")
         with slurm_job_file.open("w") as job_file:
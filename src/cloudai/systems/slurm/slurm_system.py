@@ -18,20 +18,25 @@ from __future__ import annotations
 
 import logging
 import re
+import threading
 from copy import copy
 from pathlib import Path
 from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
 
-from pydantic import BaseModel, ConfigDict, Field, field_serializer, field_validator
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, field_serializer, field_validator
 
 from cloudai.core import BaseJob, File, Installable, System
+from cloudai.models.job_accounting import JobAccounting
 from cloudai.models.scenario import ReportConfig, parse_reports_spec
 from cloudai.util import CommandShell
 
 from .slurm_job import SlurmJob
-from .slurm_metadata import SlurmStepMetadata
+from .slurm_metadata import SACCT_ACCOUNTING_FIELDS, SlurmStepMetadata, accounting_from_sacct_output
 from .slurm_node import SlurmNode, SlurmNodeState
 
+# Jobs state query of a monitoring tick also fetches accounting, so finished jobs do not need another query.
+JOBS_STATE_FIELDS = ["JobID", "State", *SACCT_ACCOUNTING_FIELDS[1:]]
+
 
 class DataRepositoryConfig(BaseModel):
     """Configuration for a data repository."""
@@ -140,6 +145,28 @@ class SlurmSystem(BaseModel, System):
     reports: Optional[dict[str, ReportConfig]] = None
 
     group_allocated: set[SlurmNode] = Field(default_factory=set, exclude=True)
+    jobs_state_cache: dict[str, list[str]] = Field(default_factory=dict, exclude=True)
+    jobs_accounting_cache: dict[str, JobAccounting] = Field(default_factory=dict, exclude=True)
+    # Test submissions may run in worker threads, node allocation must not interleave between them.
+    _nodes_allocation_lock: threading.RLock = PrivateAttr(default_factory=threading.RLock)
+
+    def __getstate__(self) -> dict[Any, Any]:
+        """Return the state for pickling, without the node allocation lock."""
+        state = super().__getstate__()
+        private = state.get("__pydantic_private__") or {}
+        state["__pydantic_private__"] = {k: v for k, v in private.items() if k != "_nodes_allocation_lock"}
+        return state
+
+    def __setstate__(self, state: dict[Any, Any]) -> None:
+        """Restore the state after unpickling with a new node allocation lock."""
+        super().__setstate__(state)
+        self._nodes_allocation_lock = threading.RLock()
+
+    def __deepcopy__(self, memo: dict[int, Any] | None = None) -> "SlurmSystem":  # noqa: Vulture
+        """Create a deep copy of the SlurmSystem instance with its own node allocation lock."""
+        memo = {} if memo is None else memo
+        memo[id(self._nodes_allocation_lock)] = threading.RLock()
+        return super().__deepcopy__(memo)
 
     @field_validator("reports", mode="before")
     @classmethod
@@ -255,6 +282,78 @@ class SlurmSystem(BaseModel, System):
                 if not found and insert_new:
                     part.slurm_nodes.append(node)
 
+    def update_jobs_state(self, jobs: list[BaseJob], retry_threshold: int = 3) -> None:
+        """
+        Query states and accounting of all given jobs with a single 'sacct' call and cache them for the current tick.
+
+        Cached states are used by `is_job_running` and `is_job_completed`, cached accounting by `get_job_accounting`
+        for jobs that finish in this tick. Jobs that are missing from the 'sacct' output (e.g. not yet recorded by
+        slurmdbd) are not cached and are checked individually. If the query fails, the caches are left empty so that
+        all checks fall back to per-job queries.
+
+        Args:
+            jobs (list[BaseJob]): The jobs to query.
+            retry_threshold (int): Maximum number of retries for transient errors.
+        """
+        self.jobs_state_cache, self.jobs_accounting_cache = {}, {}
+        job_ids = sorted({str(job.id) for job in jobs})
+        if not job_ids:
+            return
+
+        command = f"sacct -j {','.join(job_ids)} --format={','.join(JOBS_STATE_FIELDS)} --noheader -p"
+        for retry_count in range(1, retry_threshold + 1):
+            stdout, stderr = self.cmd_shell.execute(command).communicate()
+            logging.debug(f"Jobs state: {command=} {stdout=} {stderr=}")
+
+            if "Socket timed out" in stderr or "slurm_load_jobs error" in stderr:
+                logging.warning(f"Retrying jobs state query (attempt {retry_count}/{retry_threshold})")
+                continue
+
+            if stderr:
+                logging.warning(f"Failed to query jobs state, falling back to per-job checks: {stderr}")
+                return
+
+            self.jobs_state_cache = self.parse_sacct_states(stdout, job_ids)
+            self.jobs_accounting_cache = accounting_from_sacct_output(stdout, "|", JOBS_STATE_FIELDS)
+            return
+
+        logging.warning(f"Failed to query jobs state after {retry_threshold} attempts, falling back to per-job checks.")
+
+    @staticmethod
+    def parse_sacct_states(stdout: str, job_ids: list[str]) -> dict[str, list[str]]:
+        """
+        Group states reported by 'sacct -p' for a list of jobs by parent job ID.
+
+        Job steps (e.g. '123.batch', '123.0') and heterogeneous job components ('123+0') are accounted to their parent
+        job.
+
+        Args:
+            stdout (str): Output of 'sacct --format=JobID,State,... --noheader -p'.
+            job_ids (list[str]): IDs of the queried jobs, only these are included into the result.
+
+        Returns:
+            dict[str, list[str]]: Mapping of job ID to the list of states of the job and all its steps.
+        """
+        states: dict[str, list[str]] = {}
+        for line in stdout.splitlines():
+            parts = line.strip().split("|")
+            if len(parts) < 2 or not parts[0]:
+                continue
+            job_id = re.split(r"[.+]", parts[0], maxsplit=1)[0]
+            if job_id in job_ids:
+                states.setdefault(job_id, []).extend(parts[1].split())
+        return states
+
+    @staticmethod
+    def _is_running_state(job_states: list[str]) -> bool:
+        return "RUNNING" in job_states
+
+    @staticmethod
+    def _is_completed_state(job_states: list[str]) -> bool:
+        if "RUNNING" in job_states:
+            return False
+        return any(state in ["COMPLETED", "FAILED", "CANCELLED", "TIMEOUT", "CANCELLED+"] for state in job_states)
+
     def is_job_running(self, job: BaseJob, retry_threshold: int = 3) -> bool:
         """
         Determine if a specified Slurm job is currently running by checking its presence and state in the job queue.
@@ -273,6 +372,9 @@ class SlurmSystem(BaseModel, System):
             RuntimeError: If an error occurs that prevents determination of the job's running status, or if the status
                         cannot be determined after the specified number of retries.
         """
+        if str(job.id) in self.jobs_state_cache:
+            return self._is_running_state(self.jobs_state_cache[str(job.id)])
+
         retry_count = 0
         command = f"sacct -j {job.id} --format=State --noheader"
 
@@ -292,8 +394,7 @@ class SlurmSystem(BaseModel, System):
                 logging.error(error_message)
                 raise RuntimeError(error_message)
 
-            job_states = stdout.strip().split()
-            if "RUNNING" in job_states:
+            if self._is_running_state(stdout.strip().split()):
                 return True
 
             break
@@ -321,6 +422,9 @@ class SlurmSystem(BaseModel, System):
         Raises:
             RuntimeError: If unable to determine job status after retries, or if a non-retryable error is encountered.
         """
+        if str(job.id) in self.jobs_state_cache:
+            return self._is_completed_state(self.jobs_state_cache[str(job.id)])
+
         retry_count = 0
         command = f"sacct -j {job.id} --format=State --noheader"
 
@@ -339,10 +443,10 @@ class SlurmSystem(BaseModel, System):
                 raise RuntimeError(error_message)
 
             job_states = stdout.strip().split()
-            if "RUNNING" in job_states:
+            if self._is_running_state(job_states):
                 return False
 
-            if any(state in ["COMPLETED", "FAILED", "CANCELLED", "TIMEOUT", "CANCELLED+"] for state in job_states):
+            if self._is_completed_state(job_states):
                 return True
 
             break
@@ -379,6 +483,47 @@ class SlurmSystem(BaseModel, System):
 
         return []
 
+    def get_job_accounting(self, job: BaseJob, retry_threshold: int = 3) -> dict[str, JobAccounting]:
+        """
+        Query resource usage of a job and its steps from 'sacct'.
+
+        Accounting fetched by `update_jobs_state` in the current monitoring tick is used when available, so jobs
+        finishing in the same tick do not issue a query each. Accounting is informational, so errors are logged and an
+        empty result is returned instead of raising.
+
+        Args:
+            job (BaseJob): The job to query.
+            retry_threshold (int): Maximum number of retries for transient errors.
+
+        Returns:
+            dict[str, JobAccounting]: Accounting by full job or step ID, e.g. `123`, `123.batch` or `123.0`.
+        """
+        cached = {
+            step_id: accounting
+            for step_id, accounting in self.jobs_accounting_cache.items()
+            if re.split(r"[.+]", step_id, maxsplit=1)[0] == str(job.id)
+        }
+        if cached:
+            return cached
+
+        command = f"sacct -j {job.id} --format={','.join(SACCT_ACCOUNTING_FIELDS)} --delimiter='|' -p --noheader"
+        for retry_count in range(1, retry_threshold + 1):
+            stdout, stderr = self.cmd_shell.execute(command).communicate()
+            logging.debug(f"Job accounting: {command=} {stdout=} {stderr=}")
+
+            if "Socket timed out" in stderr or "slurm_load_jobs error" in stderr:
+                logging.warning(f"Retrying job accounting query (attempt {retry_count}/{retry_threshold})")
+                continue
+
+            if stderr:
+                logging.warning(f"Failed to query accounting for job {job.id}: {stderr}")
+                return {}
+
+            return accounting_from_sacct_output(stdout, delimiter="|")
+
+        logging.warning(f"Failed to query accounting for job {job.id} after {retry_threshold} attempts.")
+        return {}
+
     def kill(self, job: BaseJob) -> None:
         """
         Terminate a Slurm job.
@@ -388,6 +533,23 @@ class SlurmSystem(BaseModel, System):
         """
         assert isinstance(job.id, int)
         self.scancel(job.id)
+        self.forget_job_state(job, with_accounting=True)
+
+    def forget_job_state(self, job: BaseJob, with_accounting: bool = False) -> None:
+        """
+        Drop the state of a job cached by `update_jobs_state`, so that the next check queries it again.
+
+        Args:
+            job (BaseJob): The job whose state has changed since the last query.
+            with_accounting (bool): Whether to drop the cached accounting of the job and its steps as well.
+        """
+        self.jobs_state_cache.pop(str(job.id), None)
+        if with_accounting:
+            self.jobs_accounting_cache = {
+                step_id: accounting
+                for step_id, accounting in self.jobs_accounting_cache.items()
+                if re.split(r"[.+]", step_id, maxsplit=1)[0] != str(job.id)
+            }
 
     @classmethod
     def format_node_list(cls, node_names: List[str]) -> str:
@@ -488,29 +650,31 @@ class SlurmSystem(BaseModel, System):
             ValueError: If the partition or group is not found, or if the requested number of nodes exceeds the
                 available nodes.
         """
-        self.update()
+        with self._nodes_allocation_lock:
+            self.update()
 
-        self.validate_partition_and_group(partition_name, group_name)
+            self.validate_partition_and_group(partition_name, group_name)
 
-        grouped_nodes = self.group_nodes_by_state(partition_name, group_name)
+            grouped_nodes = self.group_nodes_by_state(partition_name, group_name)
 
-        try:
-            allocated_nodes = self.allocate_nodes(grouped_nodes, number_of_nodes, group_name)
+            try:
+                allocated_nodes = self.allocate_nodes(grouped_nodes, number_of_nodes, group_name)
 
-            logging.info(
-                f"Allocated nodes from group '{group_name}' in partition '{partition_name}': "
-                f"{[node.name for node in allocated_nodes]}"
-            )
+                logging.info(
+                    f"Allocated nodes from group '{group_name}' in partition '{partition_name}': "
+                    f"{[node.name for node in allocated_nodes]}"
+                )
 
-            return allocated_nodes
+                return allocated_nodes
 
-        except ValueError as e:
-            logging.error(
-                f"Error occurred while allocating nodes from group '{group_name}' in partition '{partition_name}': {e}",
-                exc_info=True,
-            )
+            except ValueError as e:
+                logging.error(
+                    f"Error occurred while allocating nodes from group '{group_name}' in partition "
+                    f"'{partition_name}': {e}",
+                    exc_info=True,
+                )
 
-            return []
+                return []
 
     def validate_partition_and_group(self, partition_name: str, group_name: str) -> None:
         """
@@ -760,8 +924,10 @@ class SlurmSystem(BaseModel, System):
         return [File(Path(__file__).parent.absolute() / "slurm-metadata.sh")]
 
     def complete_job(self, job: SlurmJob) -> None:
+        self.forget_job_state(job)
         out, _ = self.fetch_command_output(f"sacct -j {job.id} -p --noheader -X --format=NodeList")
         spec = out.splitlines()[0] if out.splitlines() else out
         nodelist = set(parse_node_list(spec.strip().replace("|", "")))
-        to_unlock = [node for node in self.group_allocated if node.name in nodelist]
-        self.group_allocated.difference_update(to_unlock)
+        with self._nodes_allocation_lock:
+            to_unlock = [node for node in self.group_allocated if node.name in nodelist]
+            self.group_allocated.difference_update(to_unlock)
@@ -17,12 +17,14 @@
 
 from .standalone_installer import StandaloneInstaller
 from .standalone_job import StandaloneJob
+from .standalone_metadata import StandaloneJobMetadata
 from .standalone_runner import StandaloneRunner
 from .standalone_system import StandaloneSystem
 
 __all__ = [
     "StandaloneInstaller",
     "StandaloneJob",
+    "StandaloneJobMetadata",
     "StandaloneRunner",
     "StandaloneSystem",
 ]
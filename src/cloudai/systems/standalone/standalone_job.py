@@ -14,13 +14,42 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from dataclasses import dataclass
+import resource
+import subprocess
+from dataclasses import dataclass, field
+from typing import Optional
 
 from cloudai.core import BaseJob
 
 
 @dataclass
 class StandaloneJob(BaseJob):
-    """A job class for standalone execution."""
+    """
+    A job class for standalone execution.
 
-    pass
+    Attributes
+        process (Optional[subprocess.Popen]): Handle of the launched process, None in dry-run mode.
+        exec_cmd (Optional[str]): Command executed by the job.
+        returncode (Optional[int]): Exit code of the process once it was reaped, negative if it was killed by a signal.
+        rusage (Optional[resource.struct_rusage]): Resource usage of the process and its reaped children.
+        submit_time (Optional[float]): Time when the test was submitted, before waiting for a job slot.
+        start_time (Optional[float]): Time when the process was started.
+        end_time (Optional[float]): Time when the process was reaped.
+    """
+
+    process: Optional[subprocess.Popen] = field(default=None, repr=False, compare=False)
+    exec_cmd: Optional[str] = None
+    returncode: Optional[int] = None
+    rusage: Optional[resource.struct_rusage] = field(default=None, repr=False, compare=False)
+    submit_time: Optional[float] = None
+    start_time: Optional[float] = None
+    end_time: Optional[float] = None
+
+    def resource_usage_summary(self) -> str:
+        if self.rusage is None:
+            return "resource usage is not available"
+        # ru_maxrss is reported in kilobytes on Linux
+        return (
+            f"user {self.rusage.ru_utime:.2f}s, system {self.rusage.ru_stime:.2f}s, "
+            f"max RSS {self.rusage.ru_maxrss / 1024:.1f} MiB"
+        )
@@ -0,0 +1,60 @@
+# SPDX-FileCopyrightText: NVIDIA CORPORATION & AFFILIATES
+# Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+from datetime import datetime
+
+from pydantic import BaseModel, ConfigDict
+
+from cloudai.models.job_accounting import JobAccounting
+
+from .standalone_job import StandaloneJob
+
+
+class StandaloneJobMetadata(BaseModel):
+    """Represents the metadata of a standalone job."""
+
+    model_config = ConfigDict(extra="forbid")
+
+    job_id: int
+    command: str
+    exit_code: int
+    accounting: JobAccounting
+
+    @classmethod
+    def from_job(cls, job: StandaloneJob) -> StandaloneJobMetadata:
+        """
+        Collect metadata of a finished job.
+
+        Raises:
+            ValueError: If the job was not launched or its process has not been reaped yet.
+        """
+        if job.exec_cmd is None or job.returncode is None:
+            raise ValueError(f"Job {job.id} has no metadata, it was not launched or has not finished yet.")
+
+        accounting = JobAccounting()
+        if job.start_time is not None:
+            accounting.submit_time = datetime.fromtimestamp(job.submit_time or job.start_time).isoformat()
+            accounting.queue_wait_sec = job.start_time - (job.submit_time or job.start_time)
+            if job.end_time is not None:
+                accounting.run_time_sec = job.end_time - job.start_time
+        if job.rusage is not None:
+            accounting.total_cpu_sec = job.rusage.ru_utime + job.rusage.ru_stime
+            # ru_maxrss is reported in kilobytes on Linux
+            accounting.max_rss_bytes = job.rusage.ru_maxrss * 1024
+
+        return cls(job_id=int(job.id), command=job.exec_cmd, exit_code=job.returncode, accounting=accounting)
@@ -14,38 +14,128 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
 import logging
+import time
 from pathlib import Path
+from typing import List, cast
 
-from cloudai.core import BaseRunner, JobIdRetrievalError, System, TestRun, TestScenario
-from cloudai.util import CommandShell
+import toml
+
+from cloudai.core import BaseJob, BaseRunner, JobStatusResult, System, TestRun, TestScenario
 
 from .standalone_job import StandaloneJob
+from .standalone_metadata import StandaloneJobMetadata
+from .standalone_system import StandaloneSystem
 
 
 class StandaloneRunner(BaseRunner):
     """
     Implementation of the Runner for a system using Standalone.
 
+    At most `max_parallel_jobs` of the system run at the same time, every job holds one slot from its submission until
+    its completion is handled. Tests submitted while all slots are busy are queued as pending submissions and start in
+    submission order as slots are released.
+
     Attributes
-        cmd_shell (CommandShell): An instance of CommandShell for executing system commands.
+        job_slots (asyncio.Semaphore | None): Free job slots, created for every `run()` because a semaphore is bound to
+            the event loop it is first used in.
+        slot_holders (set[TestRun]): Test runs that hold a job slot.
+        submit_times (dict[TestRun, float]): Submission times of test runs that are not started yet.
     """
 
     def __init__(self, mode: str, system: System, test_scenario: TestScenario, output_path: Path) -> None:
         super().__init__(mode, system, test_scenario, output_path)
-        self.cmd_shell = CommandShell()
+        self.system = cast(StandaloneSystem, system)
+        self.job_slots: asyncio.Semaphore | None = None
+        self.slot_holders: set[TestRun] = set()
+        self.submit_times: dict[TestRun, float] = {}
+
+    async def run(self):
+        self.job_slots = asyncio.Semaphore(self.system.job_slots)
+        self.slot_holders.clear()
+        await super().run()
+
+    async def shutdown(self):
+        await super().shutdown()
+        for tr in list(self.slot_holders):
+            self.release_job_slot(tr)
+
+    async def submit_test(self, tr: TestRun):
+        if self.mode != "run":
+            await super().submit_test(tr)
+            return
+
+        assert self.job_slots is not None, "job slots are created by run()"
+        self.submit_times.setdefault(tr, time.time())
+        if self.job_slots.locked() and self.pending_submissions.get(tr) is not asyncio.current_task():
+            if tr not in self.pending_submissions:
+                logging.info(f"All {self.system.job_slots} job slots are busy, test {tr.name} is queued.")
+                self.pending_submissions[tr] = asyncio.create_task(self.submit_test(tr))
+            return
+
+        await self.job_slots.acquire()
+        self.slot_holders.add(tr)
+        try:
+            await super().submit_test(tr)
+        finally:
+            if tr not in self.testrun_to_job_map:
+                self.release_job_slot(tr)
+
+    def release_job_slot(self, tr: TestRun) -> None:
+        if tr in self.slot_holders:
+            self.slot_holders.remove(tr)
+            if self.job_slots is not None:
+                self.job_slots.release()
 
     def _submit_test(self, tr: TestRun) -> StandaloneJob:
         logging.info(f"Running test: {tr.name}")
         tr.output_path = self.get_job_output_path(tr)
         exec_cmd = self.get_cmd_gen_strategy(self.system, tr).gen_exec_command()
         logging.info(f"Executing command for test {tr.name}: {exec_cmd}")
-        job_id = 0
-        if self.mode == "run":
-            pid = self.cmd_shell.execute(exec_cmd).pid
-            job_id = pid
-            if job_id is None:
-                raise JobIdRetrievalError(
-                    test_name=str(tr.name), command=exec_cmd, stdout="", stderr="", message="Failed to retrieve job ID."
-                )
-        return StandaloneJob(tr, id=job_id)
+        if self.mode != "run":
+            return StandaloneJob(tr, id=0, exec_cmd=exec_cmd)
+
+        submit_time = self.submit_times.pop(tr, None)
+        process = self.system.launch(exec_cmd, tr.output_path)
+        return StandaloneJob(
+            tr, id=process.pid, process=process, exec_cmd=exec_cmd, submit_time=submit_time, start_time=time.time()
+        )
+
+    async def handle_job_completion(self, completed_job: BaseJob):
+        self.release_job_slot(completed_job.test_run)
+        await super().handle_job_completion(completed_job)
+
+    async def handle_dependencies(self, completed_job: BaseJob) -> List[asyncio.Task]:
+        for tr in self.test_scenario.get_dependents("end_post_comp", completed_job.test_run):
+            task = self.pending_submissions.get(tr)
+            if task is not None and tr not in self.slot_holders:
+                logging.info(f"Test {completed_job.test_run.name} has completed, queued test {tr.name} is cancelled.")
+                task.cancel()
+        return await super().handle_dependencies(completed_job)
+
+    def on_job_completion(self, job: BaseJob) -> None:
+        job = cast(StandaloneJob, job)
+        if job.process is None or job.returncode is None:
+            return
+
+        logging.info(
+            f"Process {job.id} of test {job.test_run.name} exited with code {job.returncode} "
+            f"({job.resource_usage_summary()})"
+        )
+        job_file = job.test_run.output_path / "standalone-job.toml"
+        logging.debug(f"Storing job metadata for job {job.id} to {job_file}")
+        with job_file.open("w") as f:
+            toml.dump(StandaloneJobMetadata.from_job(job).model_dump(), f)
+
+    def get_runner_job_status(self, job: BaseJob) -> JobStatusResult:
+        job = cast(StandaloneJob, job)
+        if not job.returncode or job.terminated_by_dependency:
+            return JobStatusResult(is_successful=True)
+        return JobStatusResult(
+            is_successful=False,
+            error_message=(
+                f"Process {job.id} exited with code {job.returncode} ({job.resource_usage_summary()}). "
+                f"Please check {job.test_run.output_path / 'stderr.txt'} for details."
+            ),
+        )
@@ -14,20 +14,34 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import contextlib
 import logging
+import os
+import signal
+import subprocess
+import time
 from pathlib import Path
+from typing import Optional
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, Field
 
 from cloudai.core import BaseJob, System
 from cloudai.util import CommandShell
 
+from .standalone_job import StandaloneJob
+
 
 class StandaloneSystem(BaseModel, System):
     """
     Class representing a Standalone system.
 
-    This class is used for systems that execute commands directly without a job scheduler.
+    This class is used for systems that execute commands directly without a job scheduler. Jobs are child processes of
+    CloudAI, their status is checked by reaping them with `wait4`, which also provides their exit code and resource
+    usage.
+
+    Attributes
+        max_parallel_jobs (Optional[int]): Maximum number of jobs running at the same time, defaults to the number of
+            CPUs.
     """
 
     model_config = ConfigDict(extra="forbid", arbitrary_types_allowed=True)
@@ -37,8 +51,13 @@ class StandaloneSystem(BaseModel, System):
     output_path: Path
     scheduler: str = "standalone"
     monitor_interval: int = 1
+    max_parallel_jobs: Optional[int] = Field(default=None, ge=1)
     cmd_shell: CommandShell = CommandShell()
 
+    @property
+    def job_slots(self) -> int:
+        return self.max_parallel_jobs or os.cpu_count() or 1
+
     def update(self) -> None:
         """
         Update the standalone system's state.
@@ -47,6 +66,59 @@ class StandaloneSystem(BaseModel, System):
         """
         pass
 
+    def launch(self, command: str, output_path: Path) -> subprocess.Popen:
+        """
+        Start a command in a new session, writing its output to stdout.txt and stderr.txt in the output directory.
+
+        Args:
+            command (str): The command to run.
+            output_path (Path): Directory for the output files.
+
+        Returns:
+            subprocess.Popen: Handle of the started process, its PID is also the process group ID.
+        """
+        with (output_path / "stdout.txt").open("w") as stdout, (output_path / "stderr.txt").open("w") as stderr:
+            return subprocess.Popen(
+                command,
+                shell=True,
+                executable=str(self.cmd_shell.executable),
+                stdin=subprocess.DEVNULL,
+                stdout=stdout,
+                stderr=stderr,
+                start_new_session=True,
+            )
+
+    def reap(self, job: StandaloneJob) -> bool:
+        """
+        Collect the exit code and resource usage of a job if its process has exited, without blocking.
+
+        Args:
+            job (StandaloneJob): The job to check, must have a process handle.
+
+        Returns:
+            bool: True if the process has exited, False if it is still running.
+        """
+        if job.returncode is not None:
+            return True
+
+        assert job.process is not None
+        try:
+            pid, status, rusage = os.wait4(job.process.pid, os.WNOHANG)
+        except ChildProcessError:
+            # Already reaped by someone else, Popen knows the exit code in this case.
+            job.returncode = job.process.poll()
+            job.end_time = time.time()
+            return True
+
+        if pid == 0:
+            return False
+
+        job.returncode = job.process.returncode = os.waitstatus_to_exitcode(status)
+        job.rusage = rusage
+        job.end_time = time.time()
+        logging.debug(f"Job {job.id} exited with code {job.returncode} ({job.resource_usage_summary()})")
+        return True
+
     def is_job_running(self, job: BaseJob) -> bool:
         """
         Check if a given standalone job is currently running.
@@ -57,6 +129,9 @@ class StandaloneSystem(BaseModel, System):
         Returns:
             bool: True if the job is running, False otherwise.
         """
+        if isinstance(job, StandaloneJob) and job.process is not None:
+            return not self.reap(job)
+
         command = f"ps -p {job.id}"
         logging.debug(f"Checking job status with command: {command}")
         stdout = self.cmd_shell.execute(command).communicate()[0]
@@ -86,6 +161,13 @@ class StandaloneSystem(BaseModel, System):
         Args:
             job (BaseJob): The job to be terminated.
         """
+        if isinstance(job, StandaloneJob) and job.process is not None:
+            if not self.reap(job):
+                logging.debug(f"Killing process group {job.id}")
+                with contextlib.suppress(ProcessLookupError):
+                    os.killpg(job.process.pid, signal.SIGKILL)
+            return
+
         cmd = f"kill -9 {job.id}"
         logging.debug(f"Executing termination command for job {job.id}: {cmd}")
         self.cmd_shell.execute(cmd)
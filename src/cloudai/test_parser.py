@@ -18,9 +18,9 @@ import logging
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Type, Union, cast
 
-import toml
 from pydantic import BaseModel, ValidationError
 
+from .config_cache import config_cache
 from .core import (
     GradingStrategy,
     JsonGenStrategy,
@@ -64,17 +64,33 @@ class TestParser:
         """
         objects: List[Any] = []
         for f in self.test_tomls:
-            self.current_file = f
             logging.debug(f"Parsing file: {f}")
-            with f.open() as fh:
-                data: Dict[str, Any] = toml.load(fh)
-                parsed_object = self._parse_data(data)
-                obj_name: str = parsed_object.name
-                if obj_name in objects:
-                    raise ValueError(f"Duplicate name found: {obj_name}")
-                objects.append(parsed_object)
+            parsed_object = self._create_test(self.load_test_toml(f))
+            obj_name: str = parsed_object.name
+            if obj_name in objects:
+                raise ValueError(f"Duplicate name found: {obj_name}")
+            objects.append(parsed_object)
         return objects
 
+    def load_test_toml(self, test_toml: Path, strict: bool = False) -> TestDefinition:
+        """
+        Load a test definition from a TOML file.
+
+        The TOML data is read from the configuration cache when it is enabled and the file is unchanged.
+
+        Args:
+            test_toml (Path): Path to the test TOML file.
+            strict (bool): Whether to enforce strict validation for test definition.
+
+        Returns:
+            TestDefinition: The validated test definition.
+        """
+        self.current_file = test_toml
+        test_def = config_cache().load(test_toml, "test", self.load_test_definition)
+        if strict:
+            self.check_strict(test_def)
+        return test_def
+
     @staticmethod
     def model_extras(m: BaseModel, prefix="cmd_args") -> set[str]:
         if m.model_extra is None:
@@ -103,14 +119,18 @@ class TestParser:
                 logging.error(err_msg)
             raise TestConfigParsingError("Failed to parse test spec") from e
 
-        if strict and self.model_extras(test_def.cmd_args):
+        if strict:
+            self.check_strict(test_def)
+
+        return test_def
+
+    def check_strict(self, test_def: TestDefinition) -> None:
+        if self.model_extras(test_def.cmd_args):
             logging.error(f"Strict check failed for test spec: '{self.current_file}'")
             for field in self.model_extras(test_def.cmd_args):
                 logging.error(f"Unexpected field '{field}' in test spec.")
             raise TestConfigParsingError("Failed to parse test spec using strict mode")
 
-        return test_def
-
     def _fetch_strategy(  # noqa: D417
         self,
         strategy_interface: Type[Union[JsonGenStrategy, GradingStrategy]],
@@ -177,6 +197,8 @@ class TestParser:
         Returns:
             Test: Parsed Test object.
         """
-        test_def = self.load_test_definition(data, strict)
+        return self._create_test(self.load_test_definition(data, strict))
+
+    def _create_test(self, test_def: TestDefinition) -> Test:
         test_template = self._get_test_template(test_def.test_template_name, test_def)
         return Test(test_definition=test_def, test_template=test_template)
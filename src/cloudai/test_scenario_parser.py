@@ -18,13 +18,13 @@ import copy
 import logging
 from datetime import timedelta
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set, Tuple, Type
+from typing import Any, Dict, List, Mapping, Optional, Set, Tuple, Type
 
-import toml
 from pydantic import ValidationError
 
 from cloudai.util import format_time_limit, parse_time_limit
 
+from .config_cache import config_cache
 from .core import (
     Registry,
     ReportGenerationStrategy,
@@ -85,8 +85,8 @@ class TestScenarioParser:
         self,
         file_path: Path,
         system: System,
-        test_mapping: Dict[str, Test],
-        hook_mapping: Dict[str, TestScenario],
+        test_mapping: Mapping[str, Test],
+        hook_mapping: Mapping[str, TestScenario],
         strict: bool = False,
     ) -> None:
         self.file_path = file_path
@@ -102,9 +102,8 @@ class TestScenarioParser:
         Returns
             TestScenario: The parsed TestScenario object.
         """
-        with self.file_path.open("r") as file:
-            data: Dict[str, Any] = toml.load(file)
-            return self._parse_data(data)
+        ts_model = config_cache().load(self.file_path, "scenario", self._validate)
+        return self._create_test_scenario(ts_model)
 
     def _parse_data(self, data: Dict[str, Any]) -> TestScenario:
         """
@@ -116,8 +115,11 @@ class TestScenarioParser:
         Returns:
             TestScenario: Parsed TestScenario object.
         """
+        return self._create_test_scenario(self._validate(data))
+
+    def _validate(self, data: Dict[str, Any]) -> TestScenarioModel:
         try:
-            ts_model = TestScenarioModel.model_validate(data)
+            return TestScenarioModel.model_validate(data)
         except ValidationError as e:
             logging.error(f"Failed to parse Test Scenario definition: {self.file_path}")
             for err in e.errors(include_url=False):
@@ -125,6 +127,7 @@ class TestScenarioParser:
                 logging.error(err_msg)
             raise TestScenarioParsingError("Failed to parse Test Scenario definition") from e
 
+    def _create_test_scenario(self, ts_model: TestScenarioModel) -> TestScenario:
         total_weight = sum(tr.weight for tr in ts_model.tests)
         normalized_weight = 0 if total_weight == 0 else 100 / total_weight
 
@@ -0,0 +1,216 @@
+# SPDX-FileCopyrightText: NVIDIA CORPORATION & AFFILIATES
+# Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import copy
+import os
+import threading
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, BinaryIO, Callable, Generic, Hashable, Optional, TypeVar
+
+T = TypeVar("T")
+
+# Number of bytes before the resume offset that must be unchanged for a file to be considered appended to.
+TAIL_CHECK_SIZE = 256
+
+
+class IncrementalParser(ABC, Generic[T]):
+    """Parser that consumes a file line by line, so that parsing can resume when the file grows."""
+
+    @abstractmethod
+    def feed(self, line: str) -> None: ...
+
+    @abstractmethod
+    def result(self) -> T: ...
+
+
+@dataclass
+class ParseCacheStats:
+    """
+    Counters of a parse cache.
+
+    Attributes
+        hits (int): Lookups answered from the cache.
+        misses (int): Lookups that parsed a file from the beginning.
+        resumed (int): Lookups that parsed only the data appended to a file since the previous lookup.
+        evictions (int): Entries dropped because the cache was full.
+    """
+
+    hits: int = 0
+    misses: int = 0
+    resumed: int = 0
+    evictions: int = 0
+
+
+@dataclass
+class _Entry:
+    ino: int
+    size: int
+    mtime_ns: int
+    result: Any
+    parser: Optional[IncrementalParser] = None
+    offset: int = 0
+    tail: bytes = b""
+
+    def matches(self, stat: os.stat_result) -> bool:
+        return (self.ino, self.size, self.mtime_ns) == (stat.st_ino, stat.st_size, stat.st_mtime_ns)
+
+
+class ParseCache:
+    """
+    Bounded LRU cache of results parsed from files.
+
+    Entries are validated on every lookup by inode, size and modification time of the file, so a re-written file is
+    parsed again. Files parsed with an `IncrementalParser` are resumed from the last complete line when they grew and
+    the bytes before that point did not change, which makes polling of growing logs cheap.
+
+    Cached results are shared between callers and must not be modified.
+
+    Attributes
+        maxsize (int): Maximum number of entries.
+        stats (ParseCacheStats): Lookup counters.
+    """
+
+    def __init__(self, maxsize: int = 1024) -> None:
+        self.maxsize = maxsize
+        self.stats = ParseCacheStats()
+        self._entries: OrderedDict[Hashable, _Entry] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Return the number of cached entries."""
+        return len(self._entries)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.stats = ParseCacheStats()
+
+    def parse_file(self, path: Path, parse: Callable[..., T], *args: Hashable) -> T:
+        """
+        Parse a whole file with a function, or return the cached result.
+
+        Args:
+            path (Path): The file to parse.
+            parse (Callable[..., T]): Function called as `parse(path, *args)`.
+            *args (Hashable): Extra arguments for the function, they are part of the cache key.
+
+        Returns:
+            T: The parse result.
+
+        Raises:
+            FileNotFoundError: If the file does not exist.
+        """
+        key = (parse.__module__, parse.__qualname__, path.absolute(), args)
+        stat = path.stat()
+        entry = self._get(key, stat)
+        if entry is not None and entry.matches(stat):
+            return entry.result
+
+        self._count_miss()
+        result = parse(path, *args)
+        self._put(key, _Entry(stat.st_ino, stat.st_size, stat.st_mtime_ns, result))
+        return result
+
+    def parse_lines(self, path: Path, parser: Callable[[], IncrementalParser[T]]) -> T:
+        """
+        Parse a file line by line, resuming from the previous lookup if the file was appended to.
+
+        Args:
+            path (Path): The file to parse.
+            parser (Callable[[], IncrementalParser[T]]): Factory of the parser, usually the parser class. It is part
+                of the cache key.
+
+        Returns:
+            T: The parse result.
+
+        Raises:
+            FileNotFoundError: If the file does not exist.
+        """
+        key = (parser.__module__, parser.__qualname__, path.absolute())
+        stat = path.stat()
+        entry = self._get(key, stat)
+        if entry is not None and entry.matches(stat):
+            return entry.result
+
+        with path.open("rb") as f:
+            if entry is not None and entry.parser is not None and self._is_appended(f, entry, stat):
+                state, offset, tail = entry.parser, entry.offset, entry.tail
+                # the entry's parser is reused, drop the entry so that concurrent lookups do not share it
+                self._pop_resumed(key)
+            else:
+                self._count_miss()
+                state, offset, tail = parser(), 0, b""
+
+            f.seek(offset)
+            data = f.read(stat.st_size - offset)
+
+        complete, newline, partial = data.rpartition(b"\n")
+        if newline:
+            for line in complete.decode("utf-8", errors="ignore").split("\n"):
+                state.feed(line + "\n")
+            offset += len(complete) + 1
+            tail = (tail + complete + newline)[-TAIL_CHECK_SIZE:]
+
+        result_parser = state
+        if partial:
+            # the last line may still be incomplete: parse it into a copy so that it is parsed again when it grows
+            result_parser = copy.deepcopy(state)
+            result_parser.feed(partial.decode("utf-8", errors="ignore"))
+
+        result = result_parser.result()
+        self._put(key, _Entry(stat.st_ino, stat.st_size, stat.st_mtime_ns, result, state, offset, tail))
+        return result
+
+    def _is_appended(self, f: BinaryIO, entry: _Entry, stat: os.stat_result) -> bool:
+        if stat.st_ino != entry.ino or stat.st_size < entry.size:
+            return False
+        f.seek(entry.offset - len(entry.tail))
+        return f.read(len(entry.tail)) == entry.tail
+
+    def _get(self, key: Hashable, stat: os.stat_result) -> Optional[_Entry]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                if entry.matches(stat):
+                    self.stats.hits += 1
+            return entry
+
+    def _pop_resumed(self, key: Hashable) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+            self.stats.resumed += 1
+
+    def _count_miss(self) -> None:
+        with self._lock:
+            self.stats.misses += 1
+
+    def _put(self, key: Hashable, entry: _Entry) -> None:
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.stats.evictions += 1
+
+
+# Shared by metric extractors of all workloads.
+PARSE_CACHE = ParseCache()
@@ -18,11 +18,21 @@ from __future__ import annotations
 
 import logging
 import shutil
-from typing import ClassVar
+from pathlib import Path
+from typing import TYPE_CHECKING, ClassVar
 
 from cloudai.core import METRIC_ERROR, ReportGenerationStrategy
 from cloudai.systems.slurm.slurm_system import SlurmSystem
 from cloudai.util.lazy_imports import lazy
+from cloudai.util.parse_cache import PARSE_CACHE
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+def read_genai_perf_csv(source_csv: Path) -> pd.DataFrame:
+    """Read the GenAI-Perf CSV once per file version, every metric lookup shares the same read-only DataFrame."""
+    return PARSE_CACHE.parse_file(source_csv, lazy.pd.read_csv)
 
 
 class AIDynamoReportGenerationStrategy(ReportGenerationStrategy):
@@ -51,7 +61,7 @@ class AIDynamoReportGenerationStrategy(ReportGenerationStrategy):
         if source_csv.stat().st_size == 0:
             return METRIC_ERROR
 
-        df = lazy.pd.read_csv(source_csv)
+        df = read_genai_perf_csv(source_csv)
         metric_row = df[df["Metric"] == metric_name]
 
         if metric_row.empty:
@@ -18,6 +18,8 @@ from pathlib import Path
 
 from cloudai.core import GradingStrategy
 
+from .report_generation_strategy import parse_nccl_stdout
+
 
 class NcclTestGradingStrategy(GradingStrategy):
     """
@@ -62,15 +64,4 @@ class NcclTestGradingStrategy(GradingStrategy):
         Returns:
             float: The maximum bus bandwidth value.
         """
-        max_bus_bw = 0.0
-        with stdout_path.open("r") as file:
-            for line in file:
-                if line.strip().startswith("#"):
-                    continue
-                parts = line.split()
-                if len(parts) > 10:  # Ensure it's a data line
-                    out_of_place_bw = float(parts[7])
-                    in_place_bw = float(parts[10])
-                    max_bw = max(out_of_place_bw, in_place_bw)
-                    max_bus_bw = max(max_bus_bw, max_bw)
-        return max_bus_bw
+        return parse_nccl_stdout(stdout_path).max_bus_bandwidth
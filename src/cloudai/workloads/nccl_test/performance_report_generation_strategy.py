@@ -16,8 +16,6 @@
 
 from __future__ import annotations
 
-import re
-from io import TextIOWrapper
 from pathlib import Path
 from typing import TYPE_CHECKING, List, Tuple
 
@@ -25,12 +23,15 @@ from cloudai.core import System, TestRun
 from cloudai.report_generator.tool.bokeh_report_tool import BokehReportTool
 from cloudai.report_generator.tool.csv_report_tool import CSVReportTool
 from cloudai.report_generator.util import add_human_readable_sizes
+from cloudai.results_store import store_results
 from cloudai.util.lazy_imports import lazy
 
 if TYPE_CHECKING:
     import pandas as pd
 
-from .report_generation_strategy import NcclTestReportGenerationStrategy
+from .report_generation_strategy import NCCL_COLUMNS, NcclTestReportGenerationStrategy, parse_nccl_stdout
+
+RESULTS_TABLE = "nccl_test"
 
 
 class NcclTestPerformanceReportGenerationStrategy(NcclTestReportGenerationStrategy):
@@ -46,87 +47,21 @@ class NcclTestPerformanceReportGenerationStrategy(NcclTestReportGenerationStrate
 
         self._generate_csv_report(df)
         self._generate_bokeh_report(df)
-
-    def _parse_stdout(self) -> Tuple[List[List[str]], str, int, int]:
-        parsed_data_rows: List[List[str]] = []
-        gpu_type: str = "Unknown"
-        num_ranks: int = 0
-        num_devices_per_node: int = 0
-
-        stdout_path = self.test_run.output_path / "stdout.txt"
-
-        if not stdout_path.is_file():
-            return parsed_data_rows, gpu_type, num_devices_per_node, num_ranks
-
-        with stdout_path.open("r", encoding="utf-8") as file:
-            parsed_data_rows = self._parse_data_rows(file)
-            file.seek(0)
-            num_devices_per_node, gpu_type, num_ranks = self._parse_device_info(file)
-
-        return parsed_data_rows, gpu_type, num_devices_per_node, num_ranks
-
-    def _parse_data_rows(self, file: TextIOWrapper) -> List[List[str]]:
-        parsed_data_rows: List[List[str]] = []
-        for line in file:
-            line: str = line.strip()
-            if re.match(r"^\d", line):
-                parsed_data_rows.append(re.split(r"\s+", line))
-        return parsed_data_rows
-
-    def _parse_device_info(self, file: TextIOWrapper) -> Tuple[int, str, int]:
-        device_indices: dict = {}
-        gpu_type: str = "Unknown"
-        num_ranks: int = 0
-
-        for line in file:
-            if "Rank" in line and "device" in line and "NVIDIA" in line:
-                num_ranks += 1
-
-                if match := re.search(r"on\s+([\w\d\-.]+)\s+device\s+(\d+)", line):
-                    host, device_index = match.groups()
-                    device_indices[host] = max(device_indices.get(host, -1), int(device_index))
-
-                if match := re.search(r"NVIDIA\s+(.+?)(?=\s*$|\s+\[|\s+device)", line):
-                    gpu_type = match.group(1).strip()
-
-        num_devices_per_node: int = max(device_indices.values(), default=-1) + 1 if device_indices else 0
-        return num_devices_per_node, gpu_type, num_ranks
+        store_results(RESULTS_TABLE, self.test_run, df)
 
     def _extract_data(self) -> pd.DataFrame:
-        parsed_data_rows, gpu_type, num_devices_per_node, num_ranks = self._parse_stdout()
-        if not parsed_data_rows:
+        stdout = parse_nccl_stdout(self.test_run.output_path / "stdout.txt")
+        if not stdout.num_rows:
             return lazy.pd.DataFrame()
 
-        df: pd.DataFrame = lazy.pd.DataFrame(
-            parsed_data_rows,
-            columns=[
-                "Size (B)",
-                "Count",
-                "Type",
-                "Redop",
-                "Root",
-                "Time (us) Out-of-place",
-                "Algbw (GB/s) Out-of-place",
-                "Busbw (GB/s) Out-of-place",
-                "#Wrong Out-of-place",
-                "Time (us) In-place",
-                "Algbw (GB/s) In-place",
-                "Busbw (GB/s) In-place",
-                "#Wrong In-place",
-            ],
-        )
+        df: pd.DataFrame = lazy.pd.DataFrame(stdout.columns, columns=NCCL_COLUMNS)
+
+        df["GPU Type"] = stdout.gpu_type
+        df["Devices per Node"] = stdout.num_devices_per_node
+        df["Ranks"] = stdout.num_ranks
 
-        df["GPU Type"] = gpu_type
-        df["Devices per Node"] = num_devices_per_node
-        df["Ranks"] = num_ranks
-
-        df["Size (B)"] = df["Size (B)"].astype(int)
-        df["Time (us) Out-of-place"] = df["Time (us) Out-of-place"].astype(float).round(1)
-        df["Time (us) In-place"] = df["Time (us) In-place"].astype(float).round(1)
-        df["Algbw (GB/s) Out-of-place"] = df["Algbw (GB/s) Out-of-place"].astype(float)
-        df["Busbw (GB/s) Out-of-place"] = df["Busbw (GB/s) Out-of-place"].astype(float)
-        df["Algbw (GB/s) In-place"] = df["Algbw (GB/s) In-place"].astype(float)
-        df["Busbw (GB/s) In-place"] = df["Busbw (GB/s) In-place"].astype(float)
+        df["Time (us) Out-of-place"] = df["Time (us) Out-of-place"].round(1)
+        df["Time (us) In-place"] = df["Time (us) In-place"].round(1)
 
         df = add_human_readable_sizes(df, "Size (B)", "Size Human-readable")
 
@@ -14,9 +14,159 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from __future__ import annotations
+
 import re
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING
 
 from cloudai.core import ReportGenerationStrategy, System, TestRun
+from cloudai.util.lazy_imports import lazy
+from cloudai.util.parse_cache import PARSE_CACHE
+
+if TYPE_CHECKING:
+    import numpy as np
+
+NCCL_COLUMNS = [
+    "Size (B)",
+    "Count",
+    "Type",
+    "Redop",
+    "Root",
+    "Time (us) Out-of-place",
+    "Algbw (GB/s) Out-of-place",
+    "Busbw (GB/s) Out-of-place",
+    "#Wrong Out-of-place",
+    "Time (us) In-place",
+    "Algbw (GB/s) In-place",
+    "Busbw (GB/s) In-place",
+    "#Wrong In-place",
+]
+NCCL_INT_COLUMNS = {"Size (B)"}
+NCCL_FLOAT_COLUMNS = {
+    "Time (us) Out-of-place",
+    "Algbw (GB/s) Out-of-place",
+    "Busbw (GB/s) Out-of-place",
+    "Time (us) In-place",
+    "Algbw (GB/s) In-place",
+    "Busbw (GB/s) In-place",
+}
+
+PLACEMENT_RE = re.compile(r"out-of-place|in-place")
+HEADER_RE = re.compile(
+    r"\b(size\s+count\s+type\s+redop\s+root\s+time\s+algbw\s+busbw\s+#wrong\s+time\s+algbw\s+busbw\s+#wrong)\b",
+    re.IGNORECASE,
+)
+DEVICE_RE = re.compile(r"on\s+([\w\d\-.]+)\s+device\s+(\d+)")
+GPU_TYPE_RE = re.compile(r"NVIDIA\s+(.+?)(?=\s*$|\s+\[|\s+device)")
+
+
+@dataclass
+class NcclStdout:
+    """
+    Data extracted from NCCL test stdout.
+
+    Attributes
+        has_placement (bool): Whether the out-of-place/in-place header line was found.
+        has_header (bool): Whether the column header line was found.
+        gpu_type (str): GPU model reported by the ranks.
+        num_devices_per_node (int): Number of devices used on a node.
+        num_ranks (int): Number of ranks.
+        columns (dict[str, np.ndarray]): Result table, one array per column of `NCCL_COLUMNS`. Sizes are int64,
+            times and bandwidths are float64, other columns are kept as strings.
+    """
+
+    has_placement: bool = False
+    has_header: bool = False
+    gpu_type: str = "Unknown"
+    num_devices_per_node: int = 0
+    num_ranks: int = 0
+    columns: dict[str, np.ndarray] = field(default_factory=dict)
+
+    @property
+    def is_nccl_output(self) -> bool:
+        return self.has_placement and self.has_header
+
+    @property
+    def num_rows(self) -> int:
+        return len(self.columns["Size (B)"]) if self.columns else 0
+
+    @property
+    def max_bus_bandwidth(self) -> float:
+        if not self.num_rows:
+            return 0.0
+        return float(max(self.columns["Busbw (GB/s) Out-of-place"].max(), self.columns["Busbw (GB/s) In-place"].max()))
+
+
+def _parse_rank_line(line: str, result: NcclStdout, device_indices: dict[str, int]) -> None:
+    result.num_ranks += 1
+    if match := DEVICE_RE.search(line):
+        host, device_index = match.groups()
+        device_indices[host] = max(device_indices.get(host, -1), int(device_index))
+    if match := GPU_TYPE_RE.search(line):
+        result.gpu_type = match.group(1).strip()
+
+
+def _to_columns(tokens: list[str]) -> dict[str, np.ndarray]:
+    table = lazy.np.array(tokens).reshape(-1, len(NCCL_COLUMNS))
+    columns: dict[str, np.ndarray] = {}
+    for idx, name in enumerate(NCCL_COLUMNS):
+        if name in NCCL_INT_COLUMNS:
+            columns[name] = table[:, idx].astype(lazy.np.int64)
+        elif name in NCCL_FLOAT_COLUMNS:
+            columns[name] = table[:, idx].astype(lazy.np.float64)
+        else:
+            columns[name] = table[:, idx]
+    return columns
+
+
+def parse_nccl_stdout(stdout_file: Path, header_only: bool = False) -> NcclStdout:
+    """
+    Parse NCCL test stdout in a single streaming pass.
+
+    Lines are read one at a time, so the file is never fully loaded into memory. Result rows are collected as tokens
+    and converted to typed NumPy columns at once after the scan. Results are cached until the file changes, so they
+    are shared between callers and must not be modified.
+
+    Args:
+        stdout_file (Path): Path to the stdout file.
+        header_only (bool): Only look for the result table header and stop as soon as it is found, used to detect
+            NCCL output cheaply.
+
+    Returns:
+        NcclStdout: Extracted data, empty if the file does not exist.
+    """
+    if not stdout_file.is_file():
+        return NcclStdout()
+    return PARSE_CACHE.parse_file(stdout_file, _parse_nccl_stdout, header_only)
+
+
+def _parse_nccl_stdout(stdout_file: Path, header_only: bool) -> NcclStdout:
+    result = NcclStdout()
+    device_indices: dict[str, int] = {}
+    tokens: list[str] = []
+    ncols = len(NCCL_COLUMNS)
+    with stdout_file.open("r", encoding="utf-8", errors="replace") as file:
+        for line in file:
+            stripped = line.lstrip()
+            if stripped[:1].isdigit():
+                if not header_only and len(parts := stripped.split()) == ncols:
+                    tokens.extend(parts)
+            elif "Rank" in line and "device" in line and "NVIDIA" in line:
+                if not header_only:
+                    _parse_rank_line(line, result, device_indices)
+            elif stripped.startswith("#"):
+                result.has_placement = result.has_placement or bool(PLACEMENT_RE.search(line))
+                result.has_header = result.has_header or bool(HEADER_RE.search(line))
+                if header_only and result.is_nccl_output:
+                    return result
+
+    result.num_devices_per_node = max(device_indices.values()) + 1 if device_indices else 0
+    if tokens:
+        result.columns = _to_columns(tokens)
+
+    return result
 
 
 class NcclTestReportGenerationStrategy(ReportGenerationStrategy):
@@ -26,18 +176,4 @@ class NcclTestReportGenerationStrategy(ReportGenerationStrategy):
         super().__init__(system, tr)
 
     def can_handle_directory(self) -> bool:
-        stdout_path = self.test_run.output_path / "stdout.txt"
-        if stdout_path.exists():
-            with stdout_path.open("r") as file:
-                content = file.read()
-                return bool(
-                    re.search(r"out-of-place|in-place", content)
-                    and re.search(
-                        r"\b(size\s+count\s+type\s+redop\s+root\s+"
-                        r"time\s+algbw\s+busbw\s+#wrong\s+time\s+"
-                        r"algbw\s+busbw\s+#wrong)\b",
-                        content,
-                        re.IGNORECASE,
-                    )
-                )
-        return False
+        return parse_nccl_stdout(self.test_run.output_path / "stdout.txt", header_only=True).is_nccl_output
@@ -17,7 +17,6 @@
 import getpass
 import json
 import logging
-import os
 import re
 import socket
 from pathlib import Path
@@ -31,7 +30,7 @@ from cloudai.util.lazy_imports import lazy
 
 from .http_data_repository import HttpDataRepository
 from .nemo_run import NeMoRunTestDefinition
-from .report_generation_strategy import extract_timings
+from .report_generation_strategy import extract_timings, has_timings
 
 
 class NeMoRunDataStoreReportGenerationStrategy(ReportGenerationStrategy):
@@ -44,11 +43,7 @@ class NeMoRunDataStoreReportGenerationStrategy(ReportGenerationStrategy):
         return self.test_run.output_path / "stdout.txt"
 
     def can_handle_directory(self) -> bool:
-        for _, __, files in os.walk(self.test_run.output_path):
-            for file in files:
-                if file.startswith("stdout.txt") and extract_timings(self.test_run.output_path / file):
-                    return True
-        return False
+        return has_timings(self.test_run.output_path)
 
     def generate_report(self) -> None:
         raw_data = self._collect_raw_data()
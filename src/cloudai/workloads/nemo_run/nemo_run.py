@@ -16,12 +16,51 @@
 
 import logging
 from pathlib import Path
-from typing import List, Optional, Union, cast
+from typing import TYPE_CHECKING, Any, List, Optional, Union, cast
 
 from pydantic import BaseModel, ConfigDict, Field
 
-from cloudai.core import DockerImage, File, Installable, JobStatusResult, TestRun
+from cloudai.core import DockerImage, File, Installable, JobStatusResult, ParameterSpace, TestRun
 from cloudai.models.workload import CmdArgs, TestDefinition
+from cloudai.util.lazy_imports import lazy
+
+if TYPE_CHECKING:
+    import numpy as np
+
+GPUS_PER_NODE = 8
+# Encoding of unset optional arguments in constraint columns
+UNSET = -1
+
+
+def parallelism_constraints(
+    num_gpus: "np.ndarray",
+    tp: "np.ndarray",
+    pp: "np.ndarray",
+    cp: "np.ndarray",
+    vp: "np.ndarray",
+    num_layers: "np.ndarray",
+    mbs: "np.ndarray",
+    gbs: "np.ndarray",
+) -> list["np.ndarray"]:
+    """
+    Evaluate NeMoRun parallelism constraints element-wise.
+
+    Unset `vp` and `num_layers` are encoded as `UNSET`. The virtual pipeline constraint is skipped when `vp` is unset
+    and, as the number of layers is defined by the recipe then, when `num_layers` is unset. A `vp` below 1 is never
+    valid.
+
+    Returns:
+        list[np.ndarray]: Masks of the four constraints, see `NeMoRunTestDefinition.constraint_check`.
+    """
+    model_parallel = tp * pp * cp
+    dp = num_gpus // lazy.np.maximum(model_parallel, 1)
+    layers_per_stage = num_layers // lazy.np.maximum(pp, 1)
+    return [
+        (model_parallel > 0) & (num_gpus % lazy.np.maximum(model_parallel, 1) == 0),
+        (vp == UNSET) | ((vp > 0) & ((num_layers == UNSET) | (layers_per_stage % lazy.np.maximum(vp, 1) == 0))),
+        dp != 0,
+        (dp != 0) & (gbs % lazy.np.maximum(mbs * dp, 1) == 0),
+    ]
 
 
 class Plugin(BaseModel):
@@ -146,41 +185,59 @@ class NeMoRunTestDefinition(TestDefinition):
 
     def constraint_check(self, tr: TestRun) -> bool:
         """Check constraints for NeMoRun."""
-        tp = cast(int, self.cmd_args.trainer.strategy.tensor_model_parallel_size)
-        pp = cast(int, self.cmd_args.trainer.strategy.pipeline_model_parallel_size)
-        cp = cast(int, self.cmd_args.trainer.strategy.context_parallel_size)
-        vp = cast(Optional[int], self.cmd_args.trainer.strategy.virtual_pipeline_model_parallel_size)
-        num_gpus = tr.nnodes * 8
-        num_layers = cast(int, self.cmd_args.num_layers)
-        dp = num_gpus // (tp * pp * cp)
+        strategy = self.cmd_args.trainer.strategy
+        tp = cast(int, strategy.tensor_model_parallel_size)
+        pp = cast(int, strategy.pipeline_model_parallel_size)
+        cp = cast(int, strategy.context_parallel_size)
+        vp = cast(Optional[int], strategy.virtual_pipeline_model_parallel_size)
+        num_gpus = tr.nnodes * GPUS_PER_NODE
+        num_layers = cast(Optional[int], self.cmd_args.num_layers)
+        dp = num_gpus // max(tp * pp * cp, 1)
         mbs = cast(int, self.cmd_args.data.micro_batch_size)
         gbs = cast(int, self.cmd_args.data.global_batch_size)
 
-        constraint1 = num_gpus % (tp * pp * cp) == 0
-        if not constraint1:
-            logging.error(
-                "Constraint 1 failed: num_gpus %% (tp * pp * cp) != 0. "
-                f"Values: num_gpus={num_gpus}, tp={tp}, pp={pp}, cp={cp}"
+        constraints = parallelism_constraints(
+            *(
+                lazy.np.array([UNSET if value is None else value], dtype=lazy.np.int64)
+                for value in (num_gpus, tp, pp, cp, vp, num_layers, mbs, gbs)
             )
-
-        constraint2 = True if vp is None else (num_layers // pp) % vp == 0
-        if not constraint2:
-            logging.error(
-                "Constraint 2 failed: vp is not None and (num_layers // pp) %% vp != 0. "
-                f"Values: num_layers={num_layers}, pp={pp}, vp={vp}"
-            )
-
-        constraint3 = dp != 0
-        if not constraint3:
-            logging.error(
-                f"Constraint 3 failed: dp == 0. Values: dp={dp}, num_gpus={num_gpus}, tp={tp}, pp={pp}, cp={cp}"
-            )
-
-        constraint4 = gbs % (mbs * dp) == 0 if dp != 0 else False
-        if not constraint4:
-            logging.error(f"Constraint 4 failed: gbs %% (mbs * dp) != 0. Values: gbs={gbs}, mbs={mbs}, dp={dp}")
-
-        return constraint1 and constraint2 and constraint3 and constraint4
+        )
+        errors = [
+            "Constraint 1 failed: num_gpus %% (tp * pp * cp) != 0. "
+            f"Values: num_gpus={num_gpus}, tp={tp}, pp={pp}, cp={cp}",
+            "Constraint 2 failed: vp is not None and (num_layers // pp) %% vp != 0. "
+            f"Values: num_layers={num_layers}, pp={pp}, vp={vp}",
+            f"Constraint 3 failed: dp == 0. Values: dp={dp}, num_gpus={num_gpus}, tp={tp}, pp={pp}, cp={cp}",
+            f"Constraint 4 failed: gbs %% (mbs * dp) != 0. Values: gbs={gbs}, mbs={mbs}, dp={dp}",
+        ]
+        for constraint, error in zip(constraints, errors, strict=True):
+            if not constraint[0]:
+                logging.error(error)
+
+        return all(bool(constraint[0]) for constraint in constraints)
+
+    def feasible_mask(self, tr: TestRun, space: ParameterSpace) -> "np.ndarray":
+        """Evaluate the constraints of `constraint_check` for all combinations of a DSE space at once."""
+
+        def column(key: str, value: Any) -> "np.ndarray":
+            if key in space.keys:
+                return space.column(key, missing=UNSET).astype(lazy.np.int64)
+            return lazy.np.full(len(space), UNSET if value is None else value, dtype=lazy.np.int64)
+
+        strategy = self.cmd_args.trainer.strategy
+        constraints = parallelism_constraints(
+            num_gpus=column("NUM_NODES", tr.num_nodes) * GPUS_PER_NODE,
+            tp=column("trainer.strategy.tensor_model_parallel_size", strategy.tensor_model_parallel_size),
+            pp=column("trainer.strategy.pipeline_model_parallel_size", strategy.pipeline_model_parallel_size),
+            cp=column("trainer.strategy.context_parallel_size", strategy.context_parallel_size),
+            vp=column(
+                "trainer.strategy.virtual_pipeline_model_parallel_size", strategy.virtual_pipeline_model_parallel_size
+            ),
+            num_layers=column("num_layers", self.cmd_args.num_layers),
+            mbs=column("data.micro_batch_size", self.cmd_args.data.micro_batch_size),
+            gbs=column("data.global_batch_size", self.cmd_args.data.global_batch_size),
+        )
+        return constraints[0] & constraints[1] & constraints[2] & constraints[3]
 
     @property
     def update_num_train_samples(self) -> Optional[int]:
@@ -17,59 +17,65 @@
 from __future__ import annotations
 
 import logging
-import os
-from functools import cache
 from pathlib import Path
 from typing import ClassVar, List
 
 from cloudai.core import METRIC_ERROR, ReportGenerationStrategy
 from cloudai.report_generator.tool.bokeh_report_tool import BokehReportTool
 from cloudai.util.lazy_imports import lazy
+from cloudai.util.parse_cache import PARSE_CACHE, IncrementalParser
+
+from .nemo_run import GPUS_PER_NODE
+
+
+class TimingsParser(IncrementalParser[list[float]]):
+    """Collects `train_step_timing` values from NeMo logs."""
+
+    def __init__(self) -> None:
+        self.train_step_timings: list[float] = []
+        self.step_timings: list[float] = []
+
+    def feed(self, line: str) -> None:
+        if "train_step_timing in s:" not in line:
+            return
+        try:
+            timing = float(line.split("train_step_timing in s:")[1].strip().split()[0])
+            self.train_step_timings.append(timing)
+            if "global_step:" in line:
+                global_step = int(line.split("global_step:")[1].split("|")[0].strip())
+                if 80 <= global_step <= 100:
+                    self.step_timings.append(timing)
+        except (ValueError, IndexError):
+            return
+
+    def result(self) -> list[float]:
+        if len(self.step_timings) < 20:
+            return self.train_step_timings[1:]
+        return list(self.step_timings)
 
 
-@cache
 def extract_timings(stdout_file: Path) -> list[float]:
     if not stdout_file.exists():
         logging.debug(f"{stdout_file} not found")
         return []
 
-    train_step_timings: list[float] = []
-    step_timings: list[float] = []
-
-    with open(stdout_file, "r", encoding="utf-8", errors="ignore") as f:
-        for line in f:
-            if "train_step_timing in s:" in line:
-                try:
-                    timing = float(line.split("train_step_timing in s:")[1].strip().split()[0])
-                    train_step_timings.append(timing)
-                    if "global_step:" in line:
-                        global_step = int(line.split("global_step:")[1].split("|")[0].strip())
-                        if 80 <= global_step <= 100:
-                            step_timings.append(timing)
-                except (ValueError, IndexError):
-                    continue
-
-    if not train_step_timings:
+    step_timings = PARSE_CACHE.parse_lines(stdout_file, TimingsParser)
+    if not step_timings:
         logging.debug(f"No train_step_timing found in {stdout_file}")
-        return []
+    return step_timings
 
-    if len(step_timings) < 20:
-        step_timings = train_step_timings[1:]
 
-    return step_timings
+def has_timings(output_path: Path) -> bool:
+    return any(extract_timings(path) for path in output_path.glob("stdout.txt*") if path.is_file())
 
 
 class NeMoRunReportGenerationStrategy(ReportGenerationStrategy):
     """Strategy for generating reports from NeMoRun directories."""
 
-    metrics: ClassVar[list[str]] = ["default", "step-time"]
+    metrics: ClassVar[list[str]] = ["default", "step-time", "num-gpus"]
 
     def can_handle_directory(self) -> bool:
-        for _, __, files in os.walk(self.test_run.output_path):
-            for file in files:
-                if file.startswith("stdout.txt") and extract_timings(self.test_run.output_path / file):
-                    return True
-        return False
+        return has_timings(self.test_run.output_path)
 
     @property
     def results_file(self) -> Path:
@@ -102,6 +108,9 @@ class NeMoRunReportGenerationStrategy(ReportGenerationStrategy):
         self.generate_bokeh_report(step_timings)
 
     def get_metric(self, metric: str) -> float:
+        if metric == "num-gpus":  # lets multi-objective DSE trade step time for the number of GPUs used
+            return float(self.test_run.nnodes * GPUS_PER_NODE)
+
         logging.debug(f"Getting metric {metric} from {self.results_file.absolute()}")
         step_timings = extract_timings(self.results_file)
         if not step_timings:
@@ -112,6 +121,11 @@ class NeMoRunReportGenerationStrategy(ReportGenerationStrategy):
 
         return float(lazy.np.mean(step_timings))
 
+    def get_live_metric(self, metric: str) -> float:
+        # step time is stable after the first step, the mean over the steps logged so far estimates the final value;
+        # the log is parsed incrementally, so polling a running job only reads the new lines
+        return self.get_metric(metric)
+
     def generate_bokeh_report(self, step_timings: List[float]) -> None:
         if not step_timings:
             return
@@ -17,32 +17,28 @@
 from __future__ import annotations
 
 import logging
-from dataclasses import dataclass
 from pathlib import Path
 from typing import TYPE_CHECKING
 
 import jinja2
-import toml
 from rich.console import Console
 from rich.table import Table
 
 from cloudai.core import Reporter, System, TestScenario
 from cloudai.models.scenario import ReportConfig
+from cloudai.results_store import PARAMS_PREFIX, ResultsStore
 from cloudai.util.lazy_imports import lazy
 
 from .nixl_bench import NIXLBenchTestDefinition
+from .report_generation_strategy import RESULTS_TABLE
 
 if TYPE_CHECKING:
     import bokeh.plotting as bk
     import pandas as pd
 
-
-@dataclass
-class TdefResult:
-    """Convenience class for storing test definition and dataframe results."""
-
-    tdef: NIXLBenchTestDefinition
-    results: pd.DataFrame
+RESULT_COLUMNS = ["block_size", "batch_size", "avg_lat", "bw_gb_sec"]
+ROW_GROUP_KEY = ["test_run", "iteration", "step"]
+PARAM_COLUMNS = ["op_type", "initiator_seg_type", "target_seg_type"]
 
 
 class NIXLBenchSummaryReport(Reporter):
@@ -50,7 +46,8 @@ class NIXLBenchSummaryReport(Reporter):
 
     def __init__(self, system: System, test_scenario: TestScenario, results_root: Path, config: ReportConfig) -> None:
         super().__init__(system, test_scenario, results_root, config)
-        self.tdef_res: list[TdefResult] = []
+        self.results: pd.DataFrame = lazy.pd.DataFrame()
+        self.wide: pd.DataFrame = lazy.pd.DataFrame()
         self.metric2col = {
             "avg_lat": "Avg. Latency (us)",
             "bw_gb_sec": "Bandwidth (GB/sec)",
@@ -64,7 +61,7 @@ class NIXLBenchSummaryReport(Reporter):
 
     def generate(self) -> None:
         self.load_tdef_with_results()
-        if not self.tdef_res:
+        if self.results.empty:
             logging.debug("No NIXL Bench test runs found, skipping report generation.")
             return
 
@@ -93,13 +90,52 @@ class NIXLBenchSummaryReport(Reporter):
         logging.info(f"NIXL summary report created: {html_file}")
 
     def load_tdef_with_results(self) -> None:
+        """
+        Load results of all NIXL Bench test runs from the scenario results store.
+
+        Test runs that are missing in the store, e.g. results produced by an older version, are added to it from their
+        CSV reports.
+        """
         super().load_test_runs()
         self.trs = [tr for tr in self.trs if isinstance(tr.test.test_definition, NIXLBenchTestDefinition)]
+        names = sorted({tr.name for tr in self.trs})
+        if not names:
+            return
 
+        store = ResultsStore.for_scenario(self.results_root)
+        stored = {
+            tuple(g.labels[k] for k in ROW_GROUP_KEY) for g in store.row_groups(RESULTS_TABLE, {"test_run": names})
+        }
         for tr in self.trs:
-            tr_file = toml.load(tr.output_path / "test-run.toml")
-            tdef = NIXLBenchTestDefinition.model_validate(tr_file["test_definition"])
-            self.tdef_res.append(TdefResult(tdef, lazy.pd.read_csv(tr.output_path / "nixlbench.csv")))
+            csv_file = tr.output_path / "nixlbench.csv"
+            if (tr.name, tr.current_iteration, tr.step) not in stored and csv_file.is_file():
+                store.append(RESULTS_TABLE, tr, lazy.pd.read_csv(csv_file))
+
+        results = store.scan(RESULTS_TABLE, {"test_run": names}, columns=RESULT_COLUMNS)
+        results = results.rename(columns={f"{PARAMS_PREFIX}{col}": col for col in PARAM_COLUMNS})
+        for col in PARAM_COLUMNS:
+            results[col] = results[col].fillna("unset") if col in results.columns else "unset"
+        self.results = results
+        self.wide = self.pivot_results(results)
+
+    def pivot_results(self, results: pd.DataFrame) -> pd.DataFrame:
+        """
+        Build a single typed frame with all results.
+
+        Rows are indexed by block and batch size, columns by metric, operation type and segment pair (e.g.
+        `VRAM->DRAM`). When several test runs have the same operation type and segment pair, the last one is used.
+        """
+        if results.empty:
+            return lazy.pd.DataFrame()
+
+        results = results.astype({"block_size": int, "batch_size": int, "avg_lat": float, "bw_gb_sec": float})
+        results["segments"] = results["initiator_seg_type"].astype(str) + "->" + results["target_seg_type"].astype(str)
+        return results.pivot_table(
+            index=["block_size", "batch_size"],
+            columns=["op_type", "segments"],
+            values=list(self.metric2col),
+            aggfunc="last",
+        )
 
     def create_table(self, op_type: str, metric: str) -> Table:
         df = self.construct_df(op_type, metric)
@@ -107,10 +143,8 @@ class NIXLBenchSummaryReport(Reporter):
         for col in df.columns:
             table.add_column(col, justify="right", style="cyan")
 
-        for _, row in df.iterrows():
-            block_size = row["block_size"].astype(int)
-            batch_size = row["batch_size"].astype(int)
-            table.add_row(str(block_size), str(batch_size), *[str(x) for x in row.values[2:]])
+        for row in df.astype(str).to_numpy().tolist():
+            table.add_row(*row)
         return table
 
     def get_bokeh_html(self) -> tuple[str, str]:
@@ -133,27 +167,16 @@ class NIXLBenchSummaryReport(Reporter):
 
     def construct_df(self, op_type: str, metric: str) -> pd.DataFrame:
         """
-        Construct a `DataFrame` with results for all test runs.
+        Select results of one operation type and metric from the pivoted results.
 
-        Block size and Batch size are taken only once assuming they are the same across all test runs.
-        `op_type` is used to filter the test runs.
+        Returns a `DataFrame` with block size, batch size and a column per segment pair, empty if there are no results.
         """
-        final_df = lazy.pd.DataFrame()
-
-        for tdef_res in self.tdef_res:
-            if tdef_res.tdef.cmd_args_dict.get("op_type", "unset") != op_type:
-                continue
-            if final_df.empty:
-                final_df["block_size"] = tdef_res.results["block_size"].astype(int)
-                final_df["batch_size"] = tdef_res.results["batch_size"].astype(int)
-
-            col_name = (
-                f"{tdef_res.tdef.cmd_args_dict.get('initiator_seg_type', 'unset')}->"
-                f"{tdef_res.tdef.cmd_args_dict.get('target_seg_type', 'unset')}"
-            )
-            final_df[col_name] = tdef_res.results[metric].astype(float)
+        if self.wide.empty or (metric, op_type) not in self.wide.columns.droplevel("segments"):
+            return lazy.pd.DataFrame()
 
-        return final_df
+        df = self.wide[metric][op_type].dropna(how="all").reset_index()
+        df.columns.name = None
+        return df
 
     def create_chart(self, op_type: str, metric: str) -> bk.figure | None:
         df = self.construct_df(op_type, metric)
@@ -17,24 +17,30 @@
 from __future__ import annotations
 
 import logging
-from functools import cache
 from pathlib import Path
 from typing import TYPE_CHECKING, ClassVar
 
 from cloudai.core import METRIC_ERROR, ReportGenerationStrategy
 from cloudai.report_generator.tool.bokeh_report_tool import BokehReportTool
+from cloudai.results_store import store_results
 from cloudai.util.lazy_imports import lazy
+from cloudai.util.parse_cache import PARSE_CACHE
 
 if TYPE_CHECKING:
     import pandas as pd
 
+RESULTS_TABLE = "nixl_bench"
+
 
-@cache
 def extract_data(stdout_file: Path) -> pd.DataFrame:
-    if not stdout_file.exists():
+    """Extract NIXL Bench results from stdout, the returned DataFrame is cached and must not be modified."""
+    if not stdout_file.is_file():
         logging.debug(f"{stdout_file} not found")
         return lazy.pd.DataFrame()
+    return PARSE_CACHE.parse_file(stdout_file, _extract_data)
+
 
+def _extract_data(stdout_file: Path) -> pd.DataFrame:
     header_present, data = False, []
     for line in stdout_file.read_text().splitlines():
         if "Block Size (B)      Batch Size     Avg Lat. (us)  B/W (MiB/Sec)  B/W (GiB/Sec)  B/W (GB/Sec)" in line:
@@ -76,6 +82,7 @@ class NIXLBenchReportGenerationStrategy(ReportGenerationStrategy):
         self.generate_bokeh_report()
         df = extract_data(self.results_file)
         df.to_csv(self.test_run.output_path / "nixlbench.csv", index=False)
+        store_results(RESULTS_TABLE, self.test_run, df)
 
     def get_metric(self, metric: str) -> float:
         logging.debug(f"Getting metric {metric} from {self.results_file.absolute()}")
@@ -86,7 +93,7 @@ class NIXLBenchReportGenerationStrategy(ReportGenerationStrategy):
         return float(lazy.np.mean(df["avg_lat"]))
 
     def generate_bokeh_report(self) -> None:
-        df = extract_data(self.results_file)
+        df = extract_data(self.results_file).copy()  # plots may add columns
 
         report_tool = BokehReportTool(self.test_run.output_path)
         p = report_tool.add_log_x_linear_y_multi_line_plot(
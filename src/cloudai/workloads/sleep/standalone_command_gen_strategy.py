@@ -16,7 +16,10 @@
 
 from typing import cast
 
+import toml
+
 from cloudai.core import CommandGenStrategy
+from cloudai.models.scenario import TestRunDetails
 
 from .sleep import SleepCmdArgs, SleepTestDefinition
 
@@ -29,3 +32,9 @@ class SleepStandaloneCommandGenStrategy(CommandGenStrategy):
         tdef_cmd_args: SleepCmdArgs = tdef.cmd_args
         sec = tdef_cmd_args.seconds
         return f"sleep {sec}"
+
+    def store_test_run(self) -> None:
+        cmd = self.gen_exec_command()
+        with (self.test_run.output_path / self.TEST_RUN_DUMP_FILE_NAME).open("w") as f:
+            trd = TestRunDetails.from_test_run(self.test_run, test_cmd=cmd, full_cmd=cmd)
+            toml.dump(trd.model_dump(), f)
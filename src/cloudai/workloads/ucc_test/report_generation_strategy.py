@@ -18,7 +18,6 @@ from __future__ import annotations
 
 import logging
 import re
-from functools import cache
 from pathlib import Path
 from typing import TYPE_CHECKING, ClassVar, Optional
 
@@ -28,11 +27,19 @@ if TYPE_CHECKING:
 from cloudai.core import METRIC_ERROR, ReportGenerationStrategy
 from cloudai.report_generator.tool.bokeh_report_tool import BokehReportTool
 from cloudai.report_generator.util import add_human_readable_sizes
+from cloudai.results_store import store_results
 from cloudai.util.lazy_imports import lazy
+from cloudai.util.parse_cache import PARSE_CACHE
+
+RESULTS_TABLE = "ucc_test"
 
 
-@cache
 def parse_ucc_output(res_file: Path) -> Optional[pd.DataFrame]:
+    """Parse UCC test results, reusing the previous result while the file is unchanged. Do not modify it."""
+    return PARSE_CACHE.parse_file(res_file, _parse_ucc_output)
+
+
+def _parse_ucc_output(res_file: Path) -> Optional[pd.DataFrame]:
     data = []
     with res_file.open("r") as file:
         content = file.read()
@@ -84,12 +91,14 @@ class UCCTestReportGenerationStrategy(ReportGenerationStrategy):
             logging.warning(f"Could not extract data from UCC report in {self.test_run.output_path}")
             return
 
+        df = df.copy()
         df["Size (B)"] = df["Size (B)"].astype(float)
         df["Bandwidth (GB/s) avg"] = df["Bandwidth (GB/s) avg"].astype(float)
         df["Bandwidth (GB/s) max"] = df["Bandwidth (GB/s) max"].astype(float)
         df["Bandwidth (GB/s) min"] = df["Bandwidth (GB/s) min"].astype(float)
         df = add_human_readable_sizes(df, "Size (B)", "Size Human-readable")
         self._generate_plots(df)
+        store_results(RESULTS_TABLE, self.test_run, df)
 
     def _generate_plots(self, df: pd.DataFrame) -> None:
         """
@@ -21,6 +21,7 @@ from unittest.mock import Mock
 import pytest
 import yaml
 
+from cloudai.config_cache import CACHE_DIR_ENV
 from cloudai.core import Test, TestRun, TestTemplate
 from cloudai.models.workload import CmdArgs, TestDefinition
 from cloudai.systems.kubernetes import KubernetesSystem
@@ -40,6 +41,13 @@ def cleanup():
         (Path.cwd() / f).unlink(missing_ok=True)
 
 
+@pytest.fixture(autouse=True)
+def config_cache_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    cache_dir = tmp_path / "config_cache"
+    monkeypatch.setenv(CACHE_DIR_ENV, str(cache_dir))
+    return cache_dir
+
+
 @pytest.fixture
 def slurm_system(tmp_path: Path) -> SlurmSystem:
     system = SlurmSystem(
@@ -22,7 +22,13 @@ import pytest
 
 from cloudai import Test, TestRun
 from cloudai.systems.slurm.slurm_system import SlurmSystem
-from cloudai.workloads.nccl_test import NCCLCmdArgs, NCCLTestDefinition, NcclTestPerformanceReportGenerationStrategy
+from cloudai.workloads.nccl_test import (
+    NCCLCmdArgs,
+    NCCLTestDefinition,
+    NcclTestGradingStrategy,
+    NcclTestPerformanceReportGenerationStrategy,
+)
+from cloudai.workloads.nccl_test.report_generation_strategy import parse_nccl_stdout
 
 
 @pytest.fixture
@@ -132,6 +138,38 @@ def test_parse_gpu_types(report_strategy: NcclTestPerformanceReportGenerationStr
         test_file = tmp_path / "test_stdout.txt"
         test_file.write_text(stdout_content)
 
-        with test_file.open("r", encoding="utf-8") as file:
-            _, gpu_type, _ = report_strategy._parse_device_info(file)
-            assert gpu_type == expected_type, f"Failed to parse GPU type for {gpu_line}"
+        gpu_type = parse_nccl_stdout(test_file).gpu_type
+        assert gpu_type == expected_type, f"Failed to parse GPU type for {gpu_line}"
+
+
+def test_parse_nccl_stdout(nccl_tr: TestRun) -> None:
+    stdout_file = nccl_tr.output_path / "stdout.txt"
+    with stdout_file.open("a") as f:
+        f.write("2024 not a result row\n")
+
+    stdout = parse_nccl_stdout(stdout_file)
+
+    assert stdout.is_nccl_output
+    assert stdout.num_rows == 3
+    assert stdout.num_ranks == 16
+    assert stdout.num_devices_per_node == 8
+    assert stdout.columns["Size (B)"].tolist() == [1000000, 2000000, 12000000]
+    assert stdout.columns["Busbw (GB/s) In-place"].dtype == float
+    assert stdout.columns["Type"].tolist() == ["float"] * 3
+    assert stdout.max_bus_bandwidth == 130.41
+
+
+def test_parse_nccl_stdout_header_only(nccl_tr: TestRun) -> None:
+    stdout = parse_nccl_stdout(nccl_tr.output_path / "stdout.txt", header_only=True)
+    assert stdout.is_nccl_output
+    assert stdout.num_rows == 0
+
+
+def test_can_not_handle_non_nccl_output(report_strategy: NcclTestPerformanceReportGenerationStrategy) -> None:
+    (report_strategy.test_run.output_path / "stdout.txt").write_text("size count type\n")
+    assert report_strategy.can_handle_directory() is False
+
+
+def test_grading_uses_max_bus_bandwidth(nccl_tr: TestRun) -> None:
+    grade = NcclTestGradingStrategy().grade(nccl_tr.output_path, ideal_perf=260.82)
+    assert grade == pytest.approx(50.0)
@@ -157,6 +157,12 @@ def test_metrics(nemo_tr: TestRun, slurm_system: SlurmSystem, metric: str):
     assert value == 12.72090909090909
 
 
+def test_num_gpus_metric(nemo_tr: TestRun, slurm_system: SlurmSystem):
+    nemo_tr.num_nodes = 4
+    nemo_tr.test.test_definition.agent_metrics = ["step-time", "num-gpus"]
+    assert nemo_tr.get_metric_value(slurm_system, "num-gpus") == 32.0
+
+
 def test_extract_timings_valid_file(tmp_path: Path) -> None:
     stdout_file = tmp_path / "stdout.txt"
     stdout_file.write_text(
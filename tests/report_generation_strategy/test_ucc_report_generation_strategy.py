@@ -109,3 +109,21 @@ def test_bokeh_report_generation(slurm_system: SlurmSystem, ucc_tr: TestRun):
     report_gen = UCCTestReportGenerationStrategy(slurm_system, ucc_tr)
     report_gen.generate_report()
     assert (ucc_tr.output_path / "cloudai_ucc_test_bokeh_report.html").exists()
+
+
+def test_report_does_not_modify_parsed_output(slurm_system: SlurmSystem, ucc_tr: TestRun):
+    UCCTestReportGenerationStrategy(slurm_system, ucc_tr).generate_report()
+
+    dt = parse_ucc_output(ucc_tr.output_path / "stdout.txt")
+    assert dt is not None
+    assert "Size Human-readable" not in dt.columns
+    assert dt["Size (B)"].iloc[0] == "4"
+
+
+def test_rewritten_output_is_parsed_again(ucc_tr: TestRun):
+    stdout = ucc_tr.output_path / "stdout.txt"
+    assert parse_ucc_output(stdout) is not None
+
+    stdout.write_text("no results\n")
+
+    assert parse_ucc_output(stdout) is None
@@ -14,7 +14,15 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import Any, Dict, Optional, Tuple
+import asyncio
+import json
+import logging
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional, Tuple, cast
+from unittest.mock import patch
 
 import pytest
 import requests
@@ -52,7 +60,7 @@ def dummy_token_response() -> DummyResponse:
 
 @pytest.fixture
 def dummy_client(monkeypatch: pytest.MonkeyPatch, dummy_token_response: DummyResponse) -> RunAIRestClient:
-    def fake_post(self: requests.Session, url: str, json: Dict[str, Any]) -> DummyResponse:
+    def fake_post(self: requests.Session, url: str, json: Dict[str, Any], **kwargs: Any) -> DummyResponse:
         return dummy_token_response
 
     monkeypatch.setattr(requests.Session, "post", fake_post)
@@ -65,7 +73,7 @@ def test_init_access_token(dummy_client: RunAIRestClient) -> None:
 
 
 def test_get_access_token_error(monkeypatch: pytest.MonkeyPatch) -> None:
-    def fake_post(self: requests.Session, url: str, json: Dict[str, Any]) -> DummyResponse:
+    def fake_post(self: requests.Session, url: str, json: Dict[str, Any], **kwargs: Any) -> DummyResponse:
         return DummyResponse({}, 200)
 
     monkeypatch.setattr(requests.Session, "post", fake_post)
@@ -75,30 +83,32 @@ def test_get_access_token_error(monkeypatch: pytest.MonkeyPatch) -> None:
 
 def test_request_success(dummy_client: RunAIRestClient, monkeypatch: pytest.MonkeyPatch) -> None:
     def fake_request(
+        self: requests.Session,
         method: str,
         url: str,
-        headers: Dict[str, Any],
         params: Optional[Dict[str, Any]] = None,
         json: Optional[Dict[str, Any]] = None,
+        **kwargs: Any,
     ) -> DummyResponse:
         return DummyResponse({"result": "ok"}, 200)
 
-    monkeypatch.setattr(requests, "request", fake_request)
+    monkeypatch.setattr(requests.Session, "request", fake_request)
     result = dummy_client._request("GET", "/test", params={"a": 1})
     assert result == {"result": "ok"}
 
 
 def test_request_http_error(dummy_client: RunAIRestClient, monkeypatch: pytest.MonkeyPatch) -> None:
     def fake_request(
+        self: requests.Session,
         method: str,
         url: str,
-        headers: Dict[str, Any],
         params: Optional[Dict[str, Any]] = None,
         json: Optional[Dict[str, Any]] = None,
+        **kwargs: Any,
     ) -> DummyResponse:
         return DummyResponse({"error": "fail"}, 400)
 
-    monkeypatch.setattr(requests, "request", fake_request)
+    monkeypatch.setattr(requests.Session, "request", fake_request)
     with pytest.raises(requests.exceptions.HTTPError):
         dummy_client._request("GET", "/error")
 
@@ -136,3 +146,167 @@ def test_endpoints(
         assert result["data"] == args[0]
     else:
         assert result["data"] is None
+
+
+class FakeRunAIServer(ThreadingHTTPServer):
+    def __init__(self) -> None:
+        super().__init__(("127.0.0.1", 0), FakeRunAIHandler)
+        self.lock = threading.Lock()
+        self.token_version = 0
+        self.expires_in: Optional[int] = None
+        self.failures_left: Dict[str, int] = {}
+        self.hits: Dict[str, int] = {}
+        self.client_ports: set[int] = set()
+        self.last_authorization: Optional[str] = None
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+    def revoke_token(self) -> None:
+        with self.lock:
+            self.token_version += 1
+
+
+class FakeRunAIHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    @property
+    def fake(self) -> FakeRunAIServer:
+        return cast(FakeRunAIServer, self.server)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        return
+
+    def _reply(self, status: int, body: Dict[str, Any]) -> None:
+        content = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def do_POST(self) -> None:
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        with self.fake.lock:
+            self.fake.hits[self.path] = self.fake.hits.get(self.path, 0) + 1
+            body: Dict[str, Any] = {"accessToken": f"token-{self.fake.token_version}"}
+            if self.fake.expires_in is not None:
+                body["expiresIn"] = self.fake.expires_in
+        self._reply(200, body)
+
+    def do_GET(self) -> None:
+        with self.fake.lock:
+            self.fake.client_ports.add(self.client_address[1])
+            self.fake.hits[self.path] = self.fake.hits.get(self.path, 0) + 1
+            self.fake.last_authorization = self.headers.get("Authorization")
+            authorized = self.headers.get("Authorization") == f"Bearer token-{self.fake.token_version}"
+            failures_left = self.fake.failures_left.get(self.path, 0)
+            if failures_left:
+                self.fake.failures_left[self.path] = failures_left - 1
+
+        if not authorized:
+            self._reply(401, {"error": "unauthorized"})
+        elif failures_left:
+            self._reply(503, {"error": "unavailable"})
+        else:
+            self._reply(200, {"path": self.path})
+
+
+@pytest.fixture
+def fake_server() -> Iterator[FakeRunAIServer]:
+    server = FakeRunAIServer()
+    thread = threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.01}, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+    thread.join()
+
+
+class TestWithFakeServer:
+    def test_connections_are_reused(self, fake_server: FakeRunAIServer) -> None:
+        client = RunAIRestClient(fake_server.url, "app_id", "app_secret")
+
+        for _ in range(20):
+            assert client._request("GET", "/api/v1/workloads/trainings/1") == {"path": "/api/v1/workloads/trainings/1"}
+
+        assert len(fake_server.client_ports) == 1
+
+    def test_pooled_latency_vs_new_connections(self, fake_server: FakeRunAIServer) -> None:
+        client = RunAIRestClient(fake_server.url, "app_id", "app_secret")
+        headers = dict(client.session.headers)
+        url = f"{fake_server.url}/api/v1/workloads/trainings/1"
+
+        start = time.perf_counter()
+        for _ in range(50):
+            requests.get(url, headers=headers, timeout=5).raise_for_status()
+        unpooled = time.perf_counter() - start
+        unpooled_connections = len(fake_server.client_ports)
+
+        fake_server.client_ports.clear()
+        start = time.perf_counter()
+        for _ in range(50):
+            client._request("GET", "/api/v1/workloads/trainings/1")
+        pooled = time.perf_counter() - start
+
+        logging.debug(f"50 requests: pooled {pooled * 1e3:.1f} ms, unpooled {unpooled * 1e3:.1f} ms")
+        assert unpooled_connections == 50
+        assert len(fake_server.client_ports) == 1
+
+    def test_retry_on_server_error(self, fake_server: FakeRunAIServer) -> None:
+        client = RunAIRestClient(fake_server.url, "app_id", "app_secret", backoff_factor=0)
+        fake_server.failures_left["/flaky"] = 2
+
+        assert client._request("GET", "/flaky") == {"path": "/flaky"}
+        assert fake_server.hits["/flaky"] == 3
+
+    def test_retries_exhausted(self, fake_server: FakeRunAIServer) -> None:
+        client = RunAIRestClient(fake_server.url, "app_id", "app_secret", max_retries=1, backoff_factor=0)
+        fake_server.failures_left["/flaky"] = 5
+
+        with pytest.raises(requests.exceptions.HTTPError):
+            client._request("GET", "/flaky")
+        assert fake_server.hits["/flaky"] == 2
+
+    def test_token_refreshed_on_401(self, fake_server: FakeRunAIServer) -> None:
+        client = RunAIRestClient(fake_server.url, "app_id", "app_secret")
+        fake_server.revoke_token()
+
+        assert client._request("GET", "/test") == {"path": "/test"}
+        assert client.access_token == "token-1"
+        assert fake_server.hits["/api/v1/token"] == 2
+
+    def test_token_refreshed_on_expiry(self, fake_server: FakeRunAIServer) -> None:
+        fake_server.expires_in = 0
+        client = RunAIRestClient(fake_server.url, "app_id", "app_secret")
+
+        client._request("GET", "/test")
+        client._request("GET", "/test")
+
+        assert fake_server.hits["/api/v1/token"] == 3
+        assert fake_server.hits["/test"] == 2
+
+    def test_cluster_api_check_uses_current_token(self, fake_server: FakeRunAIServer) -> None:
+        client = RunAIRestClient(fake_server.url, "app_id", "app_secret")
+        fake_server.revoke_token()
+
+        client.is_cluster_api_available(fake_server.url)
+
+        assert fake_server.hits["/cluster-api/status"] == 2
+        assert fake_server.last_authorization == "Bearer token-1"
+
+    def test_log_stream_uses_current_token(self, fake_server: FakeRunAIServer, tmp_path: Path) -> None:
+        fake_server.expires_in = 0
+        client = RunAIRestClient(fake_server.url, "app_id", "app_secret")
+        fake_server.revoke_token()
+
+        with (
+            patch.object(RunAIRestClient, "is_cluster_api_available", return_value=True),
+            patch("cloudai.systems.runai.runai_rest_client.websockets.connect", side_effect=ConnectionError) as connect,
+            pytest.raises(ConnectionError),
+        ):
+            asyncio.run(client.fetch_training_logs(fake_server.url, "project", "training", tmp_path / "log.txt"))
+
+        assert connect.call_args.kwargs["extra_headers"]["Authorization"] == "Bearer token-1"
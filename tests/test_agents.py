@@ -14,11 +14,14 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from typing import Any, Callable
 from unittest.mock import MagicMock
 
+import numpy as np
 import pytest
 
-from cloudai.configurator import CloudAIGymEnv, GridSearchAgent
+from cloudai.configurator import BayesianOptimizationAgent, CloudAIGymEnv, GridSearchAgent
+from cloudai.core import ParameterSpace, Registry
 
 
 @pytest.fixture
@@ -33,6 +36,7 @@ def mock_env():
         "minbytes": [512, 1024, 2048, 4096],
         "ngpus": [4],
     }
+    env.feasible_mask.return_value = np.ones(16, dtype=bool)
     return env
 
 
@@ -65,3 +69,146 @@ def test_grid_search_agent(mock_env):
     ]
 
     assert combinations == expected_combinations
+
+
+def test_select_actions(mock_env):
+    agent = GridSearchAgent(mock_env)
+
+    first = agent.select_actions(3)
+    second = agent.select_actions(3)
+
+    assert [step for step, _ in first] == [1, 2, 3]
+    assert [step for step, _ in second] == [4, 5, 6]
+    assert [action for _, action in first + second] == agent.get_all_combinations()[:6]
+
+
+def test_grid_search_skips_infeasible(mock_env):
+    space = ParameterSpace(mock_env.define_action_space.return_value)
+    mock_env.feasible_mask.return_value = space.column("minbytes") <= space.column("maxbytes")
+    agent = GridSearchAgent(mock_env)
+
+    actions = agent.select_actions(agent.max_steps)
+
+    assert agent.max_steps == 10
+    assert [step for step, _ in actions] == list(range(1, 11))
+    assert all(action["minbytes"] <= action["maxbytes"] for _, action in actions)
+
+
+def make_env(space: dict[str, list[Any]], agent_steps: int, **agent_config: Any) -> MagicMock:
+    env = MagicMock(spec=CloudAIGymEnv)
+    env.define_action_space.return_value = space
+    env.feasible_mask.return_value = np.ones(len(ParameterSpace(space)), dtype=bool)
+    env.test_run = MagicMock()
+    env.test_run.test.test_definition.agent_steps = agent_steps
+    env.test_run.test.test_definition.agent_config = agent_config
+    return env
+
+
+def run_agent(agent: BayesianOptimizationAgent, objective: Callable[[dict[str, Any]], float], batch: int = 1):
+    trials: list[dict[str, Any]] = []
+    while actions := agent.select_actions(batch):
+        for step, action in actions:
+            trials.append(action)
+            agent.update_policy({"trial_index": step, "value": objective(action)})
+    return trials
+
+
+BENCHMARK_SPACE = {
+    "tp": [1, 2, 4, 8, 16, 32],
+    "pp": [1, 2, 4, 8, 16, 32],
+    "mbs": [1, 2, 4, 8, 16, 32],
+    "vp": [1, 2, 3, 4],
+}
+BENCHMARK_OPTIMUM = {"tp": 4, "pp": 8, "mbs": 2, "vp": 3}
+
+
+def benchmark_objective(action: dict[str, Any]) -> float:
+    """Smooth synthetic reward with a single maximum at BENCHMARK_OPTIMUM."""
+    distance = sum(
+        (BENCHMARK_SPACE[key].index(action[key]) - BENCHMARK_SPACE[key].index(BENCHMARK_OPTIMUM[key])) ** 2
+        for key in BENCHMARK_SPACE
+    )
+    return -float(distance)
+
+
+class TestBayesianOptimizationAgent:
+    def test_registered(self):
+        assert Registry().agents_map["bayesian_optimization"] == BayesianOptimizationAgent
+
+    def test_budget(self):
+        agent = BayesianOptimizationAgent(make_env(BENCHMARK_SPACE, agent_steps=7, seed=0))
+
+        trials = run_agent(agent, benchmark_objective)
+
+        assert agent.max_steps == 7
+        assert len(trials) == 7
+
+    def test_seeded(self):
+        first = run_agent(BayesianOptimizationAgent(make_env(BENCHMARK_SPACE, 10, seed=1)), benchmark_objective)
+        second = run_agent(BayesianOptimizationAgent(make_env(BENCHMARK_SPACE, 10, seed=1)), benchmark_objective)
+
+        assert first == second
+
+    def test_small_space_is_exhausted(self):
+        agent = BayesianOptimizationAgent(make_env({"x": [1, 2, 3]}, agent_steps=100, seed=0))
+
+        trials = run_agent(agent, lambda action: action["x"])
+
+        assert sorted(t["x"] for t in trials) == [1, 2, 3]
+
+    def test_infeasible_actions_are_skipped(self):
+        env = make_env(BENCHMARK_SPACE, agent_steps=20, seed=0)
+        space = ParameterSpace(BENCHMARK_SPACE)
+        env.feasible_mask.return_value = space.column("tp") * space.column("pp") <= 32
+        agent = BayesianOptimizationAgent(env)
+
+        trials = run_agent(agent, benchmark_objective)
+
+        assert len(trials) == 20
+        assert all(t["tp"] * t["pp"] <= 32 for t in trials)
+
+    def test_limit_violations_are_not_modelled(self):
+        agent = BayesianOptimizationAgent(make_env({"x": [1, 2, 3]}, agent_steps=3, seed=0))
+        step, _ = agent.select_action()
+
+        agent.update_policy({"trial_index": step, "value": float("-inf")})
+
+        assert agent.observed == {}
+        assert len(agent.candidates()) == 2
+
+    def test_no_initial_random_steps(self):
+        agent = BayesianOptimizationAgent(make_env(BENCHMARK_SPACE, agent_steps=8, seed=0, num_initial=0))
+
+        trials = run_agent(agent, benchmark_objective, batch=2)
+
+        assert len(trials) == 8
+
+    def test_batch_actions_are_distinct(self):
+        agent = BayesianOptimizationAgent(make_env(BENCHMARK_SPACE, agent_steps=24, seed=0, num_initial=4))
+
+        trials = run_agent(agent, benchmark_objective, batch=4)
+
+        assert len(trials) == 24
+        assert len({tuple(t.values()) for t in trials}) == 24
+
+    def test_converged(self):
+        agent = BayesianOptimizationAgent(make_env(BENCHMARK_SPACE, agent_steps=50, seed=0, tolerance=100.0))
+
+        trials = run_agent(agent, benchmark_objective)
+
+        assert len(trials) == agent.num_initial
+        assert agent.converged
+
+    def test_benchmark_against_grid_search(self):
+        """Trials needed to reach the optimum of a synthetic objective, compared to grid search."""
+        grid = GridSearchAgent(make_env(BENCHMARK_SPACE, agent_steps=1))
+        grid_trials = grid.get_all_combinations().index(BENCHMARK_OPTIMUM) + 1
+
+        bo_trials = []
+        for seed in range(3):
+            agent = BayesianOptimizationAgent(make_env(BENCHMARK_SPACE, agent_steps=grid_trials, seed=seed))
+            trials = run_agent(agent, benchmark_objective)
+            assert BENCHMARK_OPTIMUM in trials
+            bo_trials.append(trials.index(BENCHMARK_OPTIMUM) + 1)
+
+        assert max(bo_trials) < grid_trials / 4
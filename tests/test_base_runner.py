@@ -14,6 +14,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
+import threading
+import time
 from pathlib import Path
 from typing import cast
 
@@ -97,3 +100,104 @@ class TestGetJobStatus:
         runner.runner_job_status_result = JobStatusResult(is_successful=False, error_message="runner job failed")
         res = runner.get_job_status(job)
         assert res == runner.runner_job_status_result
+
+
+class TestMonitorInterval:
+    def test_min_interval_right_after_change(self, runner: MyRunner):
+        runner.monitor_interval = 60
+        runner.notify_jobs_changed()
+        assert runner.next_monitor_interval() == runner.min_monitor_interval
+
+    def test_backs_off_with_time_since_last_change(self, runner: MyRunner):
+        runner.monitor_interval = 60
+        runner.last_jobs_change = time.monotonic() - 10
+        assert 10 <= runner.next_monitor_interval() < 60
+
+    def test_capped_by_monitor_interval(self, runner: MyRunner):
+        runner.monitor_interval = 60
+        runner.last_jobs_change = time.monotonic() - 1000
+        assert runner.next_monitor_interval() == 60
+
+    def test_wakes_up_on_jobs_change(self, runner: MyRunner):
+        runner.monitor_interval = 60
+        runner.last_jobs_change = time.monotonic() - 1000
+
+        async def main() -> float:
+            runner.jobs_changed = asyncio.Event()
+            asyncio.get_running_loop().call_later(0.01, runner.notify_jobs_changed)
+            start = time.monotonic()
+            await runner.wait_for_next_tick()
+            return time.monotonic() - start
+
+        assert asyncio.run(main()) < 1
+        assert runner.jobs_changed is not None and not runner.jobs_changed.is_set()
+
+
+class TestEarlyStop:
+    def test_dominated_job_is_killed(self, runner: MyRunner, monkeypatch: pytest.MonkeyPatch):
+        tr = runner.test_scenario.test_runs[0]
+        job = BaseJob(tr, 0)
+        runner.jobs.append(job)
+        runner.early_stop = lambda tr: True
+        monkeypatch.setattr(SlurmSystem, "is_job_running", lambda self, job: True)
+        killed: list[BaseJob] = []
+        monkeypatch.setattr(SlurmSystem, "kill", lambda self, job: killed.append(job))
+
+        asyncio.run(runner.check_early_stop())
+        asyncio.run(runner.check_early_stop())
+
+        assert job.stopped_early
+        assert killed == [job]
+
+    def test_finished_job_is_not_checked(self, runner: MyRunner, monkeypatch: pytest.MonkeyPatch):
+        runner.jobs.append(BaseJob(runner.test_scenario.test_runs[0], 0))
+        checked: list[TestRun] = []
+        runner.early_stop = lambda tr: checked.append(tr) is not None
+        monkeypatch.setattr(SlurmSystem, "is_job_running", lambda self, job: False)
+
+        asyncio.run(runner.check_early_stop())
+
+        assert not checked
+
+    def test_stopped_job_is_successful(self, runner: MyRunner):
+        job = BaseJob(runner.test_scenario.test_runs[0], 0)
+        job.stopped_early = True
+        runner.runner_job_status_result = JobStatusResult(is_successful=False, error_message="killed")
+
+        assert runner.get_job_status(job).is_successful
+
+
+class TestConcurrentSubmission:
+    def test_independent_tests_submitted_concurrently(self, runner: MyRunner, test_scenario: TestScenario):
+        base_tr = test_scenario.test_runs[0]
+        test_scenario.test_runs = [
+            TestRun(f"tr-{i}", base_tr.test, 1, [], output_path=base_tr.output_path) for i in range(4)
+        ]
+        runner.max_concurrent_submissions = 2
+        barrier = threading.Barrier(2, timeout=5)
+
+        def _submit(tr: TestRun) -> BaseJob:
+            barrier.wait()  # would time out if submissions were serialized
+            return BaseJob(tr, tr.name)
+
+        runner._submit_test = _submit
+        runner.min_monitor_interval = 0
+
+        asyncio.run(runner.run())
+
+        assert not runner.jobs
+
+    def test_delayed_submission_scheduled_once(self, runner: MyRunner):
+        tr = runner.test_scenario.test_runs[0]
+
+        async def main() -> None:
+            first = runner.schedule_delayed_submit_test(tr, delay=0)
+            second = runner.schedule_delayed_submit_test(tr, delay=0)
+            assert first is second
+            await first
+
+        asyncio.run(main())
+
+        assert runner.testrun_to_job_map[tr].test_run is tr
+        runner.reap_pending_submissions()
+        assert not runner.pending_submissions
@@ -14,12 +14,25 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from pathlib import Path
+from typing import Optional
 from unittest.mock import MagicMock, PropertyMock, patch
 
 import pytest
-
-from cloudai.configurator import CloudAIGymEnv, GridSearchAgent
-from cloudai.core import Runner, Test, TestRun, TestScenario, TestTemplateStrategy
+import toml
+
+from cloudai.configurator import CloudAIGymEnv, DSEResultCache, GridSearchAgent
+from cloudai.configurator.pareto import PARETO_FRONT_FILE_NAME
+from cloudai.core import (
+    CommandGenStrategy,
+    DSEObjective,
+    EarlyStopConfig,
+    Runner,
+    Test,
+    TestRun,
+    TestScenario,
+    TestTemplateStrategy,
+)
 from cloudai.systems.slurm import SlurmSystem
 from cloudai.workloads.nemo_run import (
     Data,
@@ -126,6 +139,7 @@ def test_observation_space(setup_env):
 def test_compute_reward(reward_function, test_cases):
     test_run = MagicMock()
     test_run.test.test_definition.agent_reward_function = reward_function
+    test_run.test.test_definition.agent_objectives = []
     env = CloudAIGymEnv(test_run=test_run, runner=MagicMock())
 
     for input_value, expected_reward in test_cases:
@@ -276,3 +290,226 @@ def test_params_set_validated(setup_env: tuple[TestRun, Runner], nemorun: NeMoRu
     assert excinfo.type is UserWarning
     assert "Pydantic serializer warnings:" in str(excinfo.value)
     assert "but got `str`" in str(excinfo.value)
+
+
+def test_step_batch(setup_env: tuple[TestRun, Runner]):
+    test_run, runner = setup_env
+    test_run.test.test_definition.cmd_args.data.global_batch_size = 8  # avoid constraint check failure
+    env = CloudAIGymEnv(test_run=test_run, runner=runner)
+    agent = GridSearchAgent(env)
+    actions = agent.select_actions(3)
+
+    with patch.object(runner, "run", wraps=runner.run) as mock_run:
+        results = env.step_batch(actions)
+
+    mock_run.assert_called_once()
+    assert len(results) == 3
+    assert all(not done for _, _, done, _ in results)
+    for step, _ in actions:
+        assert (runner.runner.scenario_root / test_run.name / "0" / str(step)).exists()
+    assert env.test_run.step == actions[-1][0]
+
+
+class TestDSEResultCache:
+    def test_put_get(self, tmp_path: Path, setup_env: tuple[TestRun, Runner]):
+        test_run, runner = setup_env
+        system = runner.runner.system
+        cache = DSEResultCache(tmp_path / "cache")
+        tr = test_run.apply_params_set(test_run.all_combinations[0])
+
+        assert cache.get(system, tr) is None
+        cache.put(system, tr, [1.5, 2.0])
+        assert cache.get(system, tr) == [1.5, 2.0]
+
+    def test_failed_observation_not_stored(self, tmp_path: Path, setup_env: tuple[TestRun, Runner]):
+        test_run, runner = setup_env
+        cache = DSEResultCache(tmp_path / "cache")
+        cache.put(runner.runner.system, test_run, [-1.0])
+        assert not (tmp_path / "cache").exists()
+
+    def test_key_depends_on_params_only(self, setup_env: tuple[TestRun, Runner]):
+        test_run, runner = setup_env
+        system = runner.runner.system
+        combinations = test_run.all_combinations
+        tr1, tr2 = test_run.apply_params_set(combinations[0]), test_run.apply_params_set(combinations[1])
+
+        assert DSEResultCache.key(system, tr1) != DSEResultCache.key(system, tr2)
+
+        tr1_copy = test_run.apply_params_set(combinations[0])
+        tr1_copy.step = 42
+        tr1_copy.test.test_definition.agent_steps = 100
+        assert DSEResultCache.key(system, tr1) == DSEResultCache.key(system, tr1_copy)
+
+    def test_cached_step_is_not_run(self, setup_env: tuple[TestRun, Runner]):
+        test_run, runner = setup_env
+        runner.runner.mode = "run"
+        test_run.test.test_definition.cmd_args.data.global_batch_size = 8  # avoid constraint check failure
+        env = CloudAIGymEnv(test_run=test_run, runner=runner)
+        assert env.results_cache is not None
+        step, action = GridSearchAgent(env).select_action()
+        env.results_cache.put(runner.runner.system, test_run.apply_params_set(action), [0.5])
+
+        with patch.object(runner, "run") as mock_run:
+            observation, reward, done, _ = env.step_batch([(step, action)])[0]
+
+        mock_run.assert_not_called()
+        assert observation == [0.5]
+        assert reward == 2.0
+        assert not done
+
+    def test_cached_step_is_dumped(self, setup_env: tuple[TestRun, Runner]):
+        test_run, runner = setup_env
+        runner.runner.mode = "run"
+        test_run.test.test_definition.cmd_args.data.global_batch_size = 8  # avoid constraint check failure
+        env = CloudAIGymEnv(test_run=test_run, runner=runner)
+        assert env.results_cache is not None
+        step, action = GridSearchAgent(env).select_action()
+        env.results_cache.put(runner.runner.system, test_run.apply_params_set(action), [0.5])
+
+        env.step_batch([(step, action)])
+
+        dump = (
+            runner.runner.scenario_root / test_run.name / "0" / str(step) / CommandGenStrategy.TEST_RUN_DUMP_FILE_NAME
+        )
+        data = toml.load(dump)
+        assert data["step"] == step
+        assert data["test_definition"] == toml.loads(
+            toml.dumps(test_run.apply_params_set(action).test.test_definition.model_dump())
+        )
+
+
+class TestEarlyStop:
+    @pytest.fixture
+    def env(self, setup_env: tuple[TestRun, Runner]) -> CloudAIGymEnv:
+        test_run, runner = setup_env
+        runner.runner.mode = "run"
+        test_run.test.test_definition.agent_early_stop = EarlyStopConfig(min_runtime=0, margin=0.5)
+        return CloudAIGymEnv(test_run=test_run, runner=runner)
+
+    def test_hook_installed(self, env: CloudAIGymEnv):
+        assert env.runner.runner.early_stop == env.should_stop_early
+
+    def test_hook_not_installed_without_config(self, setup_env: tuple[TestRun, Runner]):
+        test_run, runner = setup_env
+        runner.runner.mode = "run"
+        CloudAIGymEnv(test_run=test_run, runner=runner)
+        assert runner.runner.early_stop is None
+
+    def test_no_stop_without_best_reward(self, env: CloudAIGymEnv):
+        with patch.object(TestRun, "get_live_metric_value", return_value=100.0):
+            assert not env.should_stop_early(env.test_run)
+
+    @pytest.mark.parametrize("live_value,expected", [(1.0, False), (2.0, False), (4.0, True), (-1.0, False)])
+    def test_dominated(self, env: CloudAIGymEnv, live_value: float, expected: bool):
+        env.update_best_reward([1.0], env.compute_reward([1.0]))
+        env.test_run.step = 3
+
+        with patch.object(TestRun, "get_live_metric_value", return_value=live_value):
+            assert env.should_stop_early(env.test_run) is expected
+
+        assert (3 in env.partial_observations) is expected
+
+    def test_min_runtime(self, env: CloudAIGymEnv):
+        env.best_reward = 1.0
+        env.test_run.test.test_definition.agent_early_stop = EarlyStopConfig(min_runtime=3600)
+
+        with patch.object(TestRun, "get_live_metric_value", return_value=100.0):
+            assert not env.should_stop_early(env.test_run)
+
+    def test_partial_observation_is_recorded(self, env: CloudAIGymEnv):
+        env.test_run.test.test_definition.cmd_args.data.global_batch_size = 8  # avoid constraint check failure
+        step, action = GridSearchAgent(env).select_action()
+        env.partial_observations[step] = [4.0]
+
+        with patch.object(env.runner, "run"):
+            observation, reward, _, info = env.step_batch([(step, action)])[0]
+
+        assert observation == [4.0]
+        assert reward == 0.25
+        assert info == {"stopped_early": True}
+        assert env.best_reward is None
+        assert env.results_cache is not None
+        assert env.results_cache.get(env.runner.runner.system, env.test_run) is None
+
+
+class TestFeasibleMask:
+    @pytest.fixture
+    def tr(self, setup_env: tuple[TestRun, Runner]) -> TestRun:
+        test_run, _ = setup_env
+        tdef = test_run.test.test_definition
+        tdef.cmd_args.num_layers = 24
+        tdef.cmd_args.trainer.strategy.virtual_pipeline_model_parallel_size = [None, 3, 4]
+        tdef.cmd_args.data.global_batch_size = [4, 8, 12]
+        test_run.num_nodes = [1, 2]
+        return test_run
+
+    def test_matches_constraint_check(self, tr: TestRun):
+        expected = [tr.is_feasible(action) for action in tr.all_combinations]
+
+        mask = tr.feasible_mask()
+
+        assert mask.tolist() == expected
+        assert 0 < mask.sum() < len(mask)
+
+    @pytest.mark.parametrize("num_layers", [None, 24])
+    def test_matches_constraint_check_on_edge_values(self, tr: TestRun, num_layers: Optional[int]):
+        tdef = tr.test.test_definition
+        tdef.cmd_args.num_layers = num_layers
+        tdef.cmd_args.trainer.strategy.pipeline_model_parallel_size = [1, 5]
+        tdef.cmd_args.trainer.strategy.virtual_pipeline_model_parallel_size = [None, 0, 2, 5]
+        expected = [tr.is_feasible(action) for action in tr.all_combinations]
+
+        mask = tr.feasible_mask()
+
+        assert mask.tolist() == expected
+        assert 0 < mask.sum() < len(mask)
+
+    def test_constraint_check_is_not_called(self, tr: TestRun):
+        with patch.object(NeMoRunTestDefinition, "constraint_check") as constraint_check:
+            tr.feasible_mask()
+
+        constraint_check.assert_not_called()
+
+    def test_grid_search_skips_infeasible(self, tr: TestRun, setup_env: tuple[TestRun, Runner]):
+        agent = GridSearchAgent(CloudAIGymEnv(test_run=tr, runner=setup_env[1]))
+
+        assert agent.max_steps == int(tr.feasible_mask().sum())
+        assert all(tr.is_feasible(action) for action in agent.get_all_combinations())
+
+
+class TestMultiObjective:
+    @pytest.fixture
+    def env(self, setup_env: tuple[TestRun, Runner]) -> CloudAIGymEnv:
+        test_run, runner = setup_env
+        tdef = test_run.test.test_definition
+        tdef.agent_metrics = ["step-time", "num-gpus"]
+        tdef.agent_objectives = [
+            DSEObjective(metric="step-time", weight=10.0),
+            DSEObjective(metric="num-gpus", limit=16),
+        ]
+        return CloudAIGymEnv(test_run=test_run, runner=runner)
+
+    def test_weighted_reward(self, env: CloudAIGymEnv):
+        assert env.compute_reward([2.0, 8.0]) == -28.0
+
+    def test_limit_violation(self, env: CloudAIGymEnv):
+        assert env.compute_reward([1.0, 32.0]) == float("-inf")
+
+    def test_failed_metric(self, env: CloudAIGymEnv):
+        assert env.compute_reward([-1.0, 8.0]) == float("-inf")
+
+    def test_pareto_front_file(self, env: CloudAIGymEnv):
+        env.update_pareto_front(1, {"a": 1}, [2.0, 8.0])
+        env.update_pareto_front(2, {"a": 2}, [1.0, 16.0])
+        env.update_pareto_front(3, {"a": 3}, [3.0, 16.0])
+
+        assert env.pareto_front is not None
+        assert [p.step for p in env.pareto_front.points] == [1, 2]
+        lines = (env.iteration_dir / PARETO_FRONT_FILE_NAME).read_text().splitlines()
+        assert [line.split(",")[0] for line in lines] == ["step", "1", "2"]
+
+    def test_unknown_objective_metric(self, nemorun: NeMoRunTestDefinition):
+        with pytest.raises(ValueError, match="not listed in 'agent_metrics'"):
+            NeMoRunTestDefinition.model_validate(
+                {**nemorun.model_dump(), "agent_objectives": [{"metric": "step-time"}]}
+            )
@@ -0,0 +1,148 @@
+# SPDX-FileCopyrightText: NVIDIA CORPORATION & AFFILIATES
+# Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+from importlib.metadata import PackageNotFoundError
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+import pytest
+import toml
+
+from cloudai.config_cache import CACHE_DIR_ENV, ConfigCache, code_fingerprint, config_cache, default_cache_dir
+from cloudai.core import TestConfigParsingError, TestParser
+from cloudai.workloads.nccl_test import NCCLTestDefinition
+
+NCCL_TOML = """name = "nccl"
+description = "desc"
+test_template_name = "NcclTest"
+
+[cmd_args]
+docker_image_url = "fake://url/nccl"
+"""
+
+
+@pytest.fixture
+def test_toml(tmp_path: Path) -> Path:
+    path = tmp_path / "nccl.toml"
+    path.write_text(NCCL_TOML)
+    return path
+
+
+@pytest.fixture
+def cache(config_cache_dir: Path) -> ConfigCache:
+    return ConfigCache(config_cache_dir)
+
+
+def validate(data: dict) -> NCCLTestDefinition:
+    return NCCLTestDefinition.model_validate(data)
+
+
+class TestConfigCache:
+    def test_hit(self, cache: ConfigCache, test_toml: Path):
+        first = cache.load(test_toml, "test", validate)
+        with patch("cloudai.config_cache.toml.loads") as loads:
+            second = cache.load(test_toml, "test", validate)
+
+        loads.assert_not_called()
+        assert first == second
+        assert first is not second
+
+    def test_entry_is_json(self, cache: ConfigCache, test_toml: Path):
+        cache.load(test_toml, "test", validate)
+
+        entry = json.loads(cache.entry_path("test", test_toml).read_text())
+        assert entry["data"] == toml.loads(NCCL_TOML)
+
+    def test_validation_is_not_cached(self, cache: ConfigCache, test_toml: Path):
+        cache.load(test_toml, "test", validate)
+
+        with pytest.raises(ValueError):
+            cache.load(test_toml, "test", Mock(side_effect=ValueError))
+
+    def test_single_entry_per_file(self, cache: ConfigCache, config_cache_dir: Path, test_toml: Path):
+        cache.load(test_toml, "test", validate)
+        test_toml.write_text(NCCL_TOML.replace('"nccl"', '"nccl-2"'))
+        cache.load(test_toml, "test", validate)
+
+        assert len(list(config_cache_dir.iterdir())) == 1
+
+    def test_content_change_invalidates(self, cache: ConfigCache, test_toml: Path):
+        cache.load(test_toml, "test", validate)
+        test_toml.write_text(NCCL_TOML.replace('"nccl"', '"nccl-2"'))
+
+        assert cache.load(test_toml, "test", validate).name == "nccl-2"
+
+    def test_kinds_are_separate(self, cache: ConfigCache, test_toml: Path):
+        cache.load(test_toml, "test", validate)
+
+        assert cache.entry_path("test", test_toml) != cache.entry_path("other", test_toml)
+        with patch("cloudai.config_cache.toml.loads", wraps=toml.loads) as loads:
+            cache.load(test_toml, "other", validate)
+        loads.assert_called_once()
+
+    def test_failures_are_not_cached(self, cache: ConfigCache, config_cache_dir: Path, test_toml: Path):
+        with pytest.raises(ValueError):
+            cache.load(test_toml, "test", Mock(side_effect=ValueError))
+
+        assert not config_cache_dir.exists()
+
+    def test_corrupted_entry_is_ignored(self, cache: ConfigCache, test_toml: Path):
+        cache.entry_path("test", test_toml).parent.mkdir(parents=True)
+        cache.entry_path("test", test_toml).write_bytes(b"garbage")
+
+        assert cache.load(test_toml, "test", validate).name == "nccl"
+
+    def test_disabled(self, test_toml: Path, monkeypatch: pytest.MonkeyPatch, config_cache_dir: Path):
+        monkeypatch.setenv(CACHE_DIR_ENV, "")
+
+        config_cache().load(test_toml, "test", validate)
+
+        assert not config_cache_dir.exists()
+
+    def test_disabled_by_default(self, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.delenv(CACHE_DIR_ENV)
+
+        assert default_cache_dir() is None
+
+
+class TestCachedTestParser:
+    def test_strict_check_applies_to_cached_definition(self, test_toml: Path):
+        test_toml.write_text(NCCL_TOML + 'unknown_arg = "1"\n')
+        tp = TestParser([], None)  # type: ignore
+
+        tp.load_test_toml(test_toml)
+        with pytest.raises(TestConfigParsingError):
+            tp.load_test_toml(test_toml, strict=True)
+
+    def test_parse_all_uses_cache(self, test_toml: Path):
+        tp = TestParser([test_toml], Mock())
+        tp.parse_all()
+
+        with patch("cloudai.config_cache.toml.loads") as loads:
+            tests = tp.parse_all()
+
+        loads.assert_not_called()
+        assert tests[0].name == "nccl"
+
+
+def test_code_fingerprint_without_installed_package():
+    code_fingerprint.cache_clear()
+    try:
+        with patch("cloudai.config_cache.version", side_effect=PackageNotFoundError("cloudai")):
+            assert code_fingerprint()
+    finally:
+        code_fingerprint.cache_clear()
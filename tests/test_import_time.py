@@ -0,0 +1,48 @@
+# SPDX-FileCopyrightText: NVIDIA CORPORATION & AFFILIATES
+# Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import subprocess
+import sys
+
+import pytest
+
+# Modules that make `cloudai.cli` slow to import, plugins are registered on first lookup instead.
+HEAVY_MODULES = ["pandas", "numpy", "kubernetes", "requests", "websockets", "bokeh", "cloudai.workloads"]
+
+
+def import_times(module: str) -> dict[str, int]:
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"], capture_output=True, text=True, check=True
+    )
+    times: dict[str, int] = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if cumulative.strip().isdigit():
+            times[name.strip()] = int(cumulative)
+    return times
+
+
+@pytest.fixture(scope="module")
+def cli_import_times() -> dict[str, int]:
+    return import_times("cloudai.cli")
+
+
+@pytest.mark.parametrize("module", HEAVY_MODULES)
+def test_heavy_modules_are_not_imported(cli_import_times: dict[str, int], module: str):
+    imported = [name for name in cli_import_times if name == module or name.startswith(f"{module}.")]
+    assert not imported, f"{module} is imported on startup: {imported[:5]}"
@@ -16,7 +16,7 @@
 
 
 from cloudai.core import GradingStrategy, JsonGenStrategy, Registry
-from cloudai.reporter import PerTestReporter, StatusReporter, TarballReporter
+from cloudai.reporter import JobAccountingReporter, PerTestReporter, StatusReporter, TarballReporter
 from cloudai.systems.kubernetes import KubernetesSystem
 from cloudai.systems.lsf import LSFInstaller, LSFSystem
 from cloudai.systems.runai import RunAIInstaller, RunAISystem
@@ -203,12 +203,18 @@ def test_definitions():
 
 def test_scenario_reports():
     scenario_reports = Registry().scenario_reports
-    assert list(scenario_reports.keys()) == ["per_test", "status", "tarball", "nixl_bench_summary"]
-    assert list(scenario_reports.values()) == [PerTestReporter, StatusReporter, TarballReporter, NIXLBenchSummaryReport]
+    assert list(scenario_reports.keys()) == ["per_test", "status", "job_accounting", "tarball", "nixl_bench_summary"]
+    assert list(scenario_reports.values()) == [
+        PerTestReporter,
+        StatusReporter,
+        JobAccountingReporter,
+        TarballReporter,
+        NIXLBenchSummaryReport,
+    ]
 
 
 def test_report_configs():
     configs = Registry().report_configs
-    assert list(configs.keys()) == ["per_test", "status", "tarball", "nixl_bench_summary"]
+    assert list(configs.keys()) == ["per_test", "status", "job_accounting", "tarball", "nixl_bench_summary"]
     for name, rep_config in configs.items():
         assert rep_config.enable is True, f"Report {name} is not enabled by default"
@@ -14,11 +14,20 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import copy
+import json
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
+from typing import Any, Callable, Iterator, Optional, cast
+from urllib.parse import parse_qs, urlparse
 
 import pytest
 from kubernetes import client
 
+from cloudai.systems.kubernetes.kubernetes_job import KubernetesJob
 from cloudai.systems.kubernetes.kubernetes_system import KubernetesSystem
 
 
@@ -92,3 +101,361 @@ def test_initialization(k8s_system):
     assert isinstance(k8s_system.core_v1, client.CoreV1Api)
     assert isinstance(k8s_system.batch_v1, client.BatchV1Api)
     assert isinstance(k8s_system.custom_objects_api, client.CustomObjectsApi)
+
+
+def test_copies_get_own_informers_lock(k8s_system: KubernetesSystem):
+    system_copy = copy.deepcopy(k8s_system)
+
+    with k8s_system._informers_lock:
+        assert system_copy._informers_lock.acquire(blocking=False)
+        system_copy._informers_lock.release()
+
+
+RESOURCE_PATHS = {
+    "/apis/batch/v1/namespaces/default/jobs": "jobs",
+    "/apis/kubeflow.org/v2beta1/namespaces/default/mpijobs": "mpijobs",
+}
+PODS_PATH = "/api/v1/namespaces/default/pods"
+
+
+class FakeKubeApiServer(ThreadingHTTPServer):
+    """Minimal API server that supports create, get, list and watch of Jobs and MPIJobs, and pod logs."""
+
+    daemon_threads = True
+
+    def __init__(self) -> None:
+        super().__init__(("127.0.0.1", 0), FakeKubeApiHandler)
+        self.condition = threading.Condition()
+        self.resource_version = 0
+        self.objects: dict[str, dict[str, dict[str, Any]]] = {"jobs": {}, "mpijobs": {}}
+        self.events: list[tuple[int, str, dict[str, Any]]] = []
+        self.requests: Counter[str] = Counter()
+        self.expire_watches = False
+        self.fail_lists = False
+        self.closing = False
+        self.pods: dict[str, tuple[dict[str, str], bytes]] = {}
+        self.active_log_streams = 0
+        self.max_active_log_streams = 0
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+    def emit(self, resource: str, event_type: str, obj: dict[str, Any]) -> None:
+        with self.condition:
+            self.resource_version += 1
+            obj["metadata"]["resourceVersion"] = str(self.resource_version)
+            if event_type == "DELETED":
+                self.objects[resource].pop(obj["metadata"]["name"], None)
+            else:
+                self.objects[resource][obj["metadata"]["name"]] = obj
+            self.events.append((self.resource_version, resource, {"type": event_type, "object": obj}))
+            self.condition.notify_all()
+
+    def set_conditions(self, resource: str, name: str, conditions: list[dict[str, str]]) -> None:
+        obj = json.loads(json.dumps(self.objects[resource][name]))
+        obj["status"] = {"conditions": conditions}
+        self.emit(resource, "MODIFIED", obj)
+
+    def delete(self, resource: str, name: str) -> None:
+        self.emit(resource, "DELETED", self.objects[resource][name])
+
+    def close_watches(self) -> None:
+        with self.condition:
+            self.closing = True
+            self.condition.notify_all()
+
+
+class FakeKubeApiHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    @property
+    def fake(self) -> FakeKubeApiServer:
+        return cast(FakeKubeApiServer, self.server)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        return
+
+    def _reply(self, status: int, body: dict[str, Any]) -> None:
+        content = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def _route(self) -> tuple[Optional[str], Optional[str]]:
+        path = urlparse(self.path).path
+        for prefix, resource in RESOURCE_PATHS.items():
+            if path == prefix:
+                return resource, None
+            if path.startswith(prefix + "/"):
+                return resource, path[len(prefix) + 1 :].split("/")[0]
+        return None, None
+
+    def do_POST(self) -> None:
+        resource, _ = self._route()
+        body = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))))
+        assert resource is not None
+        self.fake.requests[f"create {resource}"] += 1
+        body.setdefault("status", {})
+        self.fake.emit(resource, "ADDED", body)
+        self._reply(201, body)
+
+    def _pods(self) -> None:
+        path, query = urlparse(self.path).path, parse_qs(urlparse(self.path).query)
+        if path == PODS_PATH:
+            self.fake.requests["list pods"] += 1
+            selector = dict(item.split("=", 1) for item in query.get("labelSelector", [""])[0].split(",") if item)
+            items = [
+                {"metadata": {"name": name, "labels": labels}}
+                for name, (labels, _) in self.fake.pods.items()
+                if all(labels.get(k) == v for k, v in selector.items())
+            ]
+            self._reply(200, {"metadata": {}, "items": items})
+            return
+
+        name = path[len(PODS_PATH) + 1 :].split("/")[0]
+        if name not in self.fake.pods:
+            self._reply(404, {"kind": "Status", "code": 404, "reason": "NotFound", "message": "not found"})
+            return
+
+        with self.fake.condition:
+            self.fake.active_log_streams += 1
+            self.fake.max_active_log_streams = max(self.fake.max_active_log_streams, self.fake.active_log_streams)
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        log = self.fake.pods[name][1]
+        for start in range(0, len(log), 4096):
+            self._send_chunk(log[start : start + 4096])
+            time.sleep(0.001)
+        self._send_chunk(b"")
+        with self.fake.condition:
+            self.fake.active_log_streams -= 1
+
+    def do_GET(self) -> None:
+        if urlparse(self.path).path.startswith(PODS_PATH):
+            self._pods()
+            return
+
+        resource, name = self._route()
+        if resource is None:
+            self._reply(404, {"kind": "Status", "code": 404})
+            return
+
+        query = parse_qs(urlparse(self.path).query)
+        if name is not None:
+            self.fake.requests[f"get {resource}"] += 1
+            obj = self.fake.objects[resource].get(name)
+            self._reply(200, obj) if obj else self._reply(404, {"kind": "Status", "code": 404})
+        elif query.get("watch", [""])[0].lower() == "true":
+            self.fake.requests[f"watch {resource}"] += 1
+            self._watch(resource, int(query.get("resourceVersion", ["0"])[0]), float(query["timeoutSeconds"][0]))
+        else:
+            self.fake.requests[f"list {resource}"] += 1
+            if self.fake.fail_lists:
+                self._reply(403, {"kind": "Status", "code": 403, "reason": "Forbidden"})
+                return
+            with self.fake.condition:
+                items = list(self.fake.objects[resource].values())
+                rv = str(self.fake.resource_version)
+            self._reply(200, {"metadata": {"resourceVersion": rv}, "items": items})
+
+    def _send_chunk(self, data: bytes) -> None:
+        self.wfile.write(f"{len(data):x}\r\n".encode() + data + b"\r\n")
+
+    def _watch(self, resource: str, since: int, timeout: float) -> None:
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+
+        deadline = time.monotonic() + timeout
+        while True:
+            with self.fake.condition:
+                self.fake.condition.wait_for(
+                    lambda since=since: self.fake.closing
+                    or self.fake.expire_watches
+                    or any(rv > since and r == resource for rv, r, _ in self.fake.events),
+                    timeout=max(deadline - time.monotonic(), 0),
+                )
+                if self.fake.expire_watches:
+                    self.fake.expire_watches = False
+                    expired = {
+                        "type": "ERROR",
+                        "object": {"kind": "Status", "code": 410, "reason": "Expired", "message": "too old"},
+                    }
+                    events = [expired]
+                else:
+                    events = [e for rv, r, e in self.fake.events if rv > since and r == resource]
+                    since = self.fake.resource_version
+                closing = self.fake.closing
+            for event in events:
+                self._send_chunk(json.dumps(event).encode() + b"\n")
+            if closing or time.monotonic() >= deadline or (events and events[0]["type"] == "ERROR"):
+                break
+        self._send_chunk(b"")
+
+
+@pytest.fixture
+def fake_api_server() -> Iterator[FakeKubeApiServer]:
+    server = FakeKubeApiServer()
+    thread = threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.01}, daemon=True)
+    thread.start()
+    yield server
+    server.close_watches()
+    server.shutdown()
+    server.server_close()
+    thread.join()
+
+
+@pytest.fixture
+def watched_k8s_system(fake_api_server: FakeKubeApiServer, tmp_path: Path) -> Iterator[KubernetesSystem]:
+    kube_config = tmp_path / "kubeconfig"
+    kube_config.write_text(
+        json.dumps(
+            {
+                "apiVersion": "v1",
+                "kind": "Config",
+                "clusters": [{"name": "fake", "cluster": {"server": fake_api_server.url}}],
+                "contexts": [{"name": "fake", "context": {"cluster": "fake", "user": "fake"}}],
+                "current-context": "fake",
+                "users": [{"name": "fake", "user": {"token": "fake-token"}}],
+            }
+        )
+    )
+    system = KubernetesSystem(
+        name="fake",
+        install_path=tmp_path,
+        output_path=tmp_path,
+        kube_config_path=kube_config,
+        default_namespace="default",
+    )
+    yield system
+    system.stop_job_informers()
+
+
+def wait_until(predicate: Callable[[], bool], timeout: float = 5.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return predicate()
+
+
+def batch_job_spec(name: str) -> dict[str, Any]:
+    return {"apiVersion": "batch/v1", "kind": "Job", "metadata": {"name": name}, "spec": {"template": {}}}
+
+
+def mpijob_spec(name: str) -> dict[str, Any]:
+    return {"apiVersion": "kubeflow.org/v2beta1", "kind": "MPIJob", "metadata": {"name": name}, "spec": {}}
+
+
+class TestJobInformer:
+    def test_batch_job_status_is_served_from_cache(
+        self, watched_k8s_system: KubernetesSystem, fake_api_server: FakeKubeApiServer
+    ) -> None:
+        jobs = []
+        for idx in range(20):
+            name = watched_k8s_system.create_job(batch_job_spec(f"job-{idx}"), timeout=5)
+            jobs.append(KubernetesJob(test_run=None, id=name, name=name, kind="job"))  # type: ignore[arg-type]
+
+        assert all(watched_k8s_system.is_job_running(job) for job in jobs)
+
+        for job in jobs[:10]:
+            fake_api_server.set_conditions("jobs", job.name, [{"type": "Complete", "status": "True"}])
+        fake_api_server.delete("jobs", jobs[10].name)
+
+        assert wait_until(lambda: all(watched_k8s_system.is_job_completed(job) for job in jobs[:11]))
+        assert all(watched_k8s_system.is_job_running(job) for job in jobs[11:])
+
+        assert fake_api_server.requests["list jobs"] == 1
+        assert fake_api_server.requests["get jobs"] == 0
+
+    def test_mpijob_status(self, watched_k8s_system: KubernetesSystem, fake_api_server: FakeKubeApiServer) -> None:
+        name = watched_k8s_system.create_job(mpijob_spec("mpi"), timeout=5)
+        job = KubernetesJob(test_run=None, id=name, name=name, kind="mpijob")  # type: ignore[arg-type]
+
+        fake_api_server.set_conditions("mpijobs", name, [{"type": "Created", "status": "True"}])
+        assert wait_until(lambda: watched_k8s_system.is_job_running(job))
+
+        fake_api_server.set_conditions(
+            "mpijobs", name, [{"type": "Created", "status": "True"}, {"type": "Succeeded", "status": "True"}]
+        )
+        assert wait_until(lambda: watched_k8s_system.is_job_completed(job))
+        assert fake_api_server.requests["get mpijobs"] == 0
+
+    def test_relist_on_expired_watch(
+        self, watched_k8s_system: KubernetesSystem, fake_api_server: FakeKubeApiServer
+    ) -> None:
+        watched_k8s_system.create_job(batch_job_spec("job"), timeout=5)
+        job = KubernetesJob(test_run=None, id="job", name="job", kind="job")  # type: ignore[arg-type]
+
+        with fake_api_server.condition:
+            fake_api_server.expire_watches = True
+            fake_api_server.condition.notify_all()
+        assert wait_until(lambda: fake_api_server.requests["list jobs"] == 2)
+
+        fake_api_server.set_conditions("jobs", "job", [{"type": "Failed", "status": "True"}])
+        assert wait_until(lambda: watched_k8s_system.is_job_completed(job))
+
+    def test_fallback_after_failed_sync(
+        self, watched_k8s_system: KubernetesSystem, fake_api_server: FakeKubeApiServer, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr("cloudai.systems.kubernetes.kubernetes_system.INFORMER_SYNC_TIMEOUT", 0.2)
+        fake_api_server.fail_lists = True
+        name = watched_k8s_system.create_job(batch_job_spec("job"), timeout=1)
+        job = KubernetesJob(test_run=None, id=name, name=name, kind="job")  # type: ignore[arg-type]
+
+        assert watched_k8s_system.is_job_running(job)
+        assert watched_k8s_system.job_informer("Job").failed
+
+        start = time.monotonic()
+        for _ in range(5):
+            assert watched_k8s_system.is_job_running(job)
+        assert time.monotonic() - start < 0.2
+        assert fake_api_server.requests["get jobs"] == 7
+
+    def test_stop_job_informers(self, watched_k8s_system: KubernetesSystem) -> None:
+        informer = watched_k8s_system.job_informer("Job")
+        assert informer.wait_for_sync(5)
+
+        watched_k8s_system.stop_job_informers()
+
+        assert informer._stop.is_set()
+        assert watched_k8s_system.job_informer("Job") is not informer
+
+
+class TestPodLogs:
+    def test_store_logs_for_job(
+        self, watched_k8s_system: KubernetesSystem, fake_api_server: FakeKubeApiServer, tmp_path: Path
+    ) -> None:
+        for idx in range(8):
+            labels = {"training.kubeflow.org/job-name": "job"}
+            fake_api_server.pods[f"job-worker-{idx}"] = (labels, f"rank {idx}\n".encode() * 5000)
+        fake_api_server.pods["other-worker-0"] = ({"training.kubeflow.org/job-name": "other"}, b"other\n")
+        watched_k8s_system.log_download_concurrency = 4
+
+        watched_k8s_system.store_logs_for_job("job", tmp_path / "logs")
+
+        pod_names = [f"job-worker-{idx}" for idx in range(8)]
+        for name, (_, log) in fake_api_server.pods.items():
+            assert (tmp_path / "logs" / f"{name}.txt").exists() == (name in pod_names)
+            if name in pod_names:
+                assert (tmp_path / "logs" / f"{name}.txt").read_bytes() == log
+        expected = b"".join(fake_api_server.pods[name][1] + b"\n" for name in pod_names)
+        assert (tmp_path / "logs" / "stdout.txt").read_bytes() == expected
+        assert 1 < fake_api_server.max_active_log_streams <= 4
+
+    def test_pods_are_selected_by_label(
+        self, watched_k8s_system: KubernetesSystem, fake_api_server: FakeKubeApiServer
+    ) -> None:
+        fake_api_server.pods["job-worker-0"] = ({"training.kubeflow.org/job-name": "job"}, b"")
+        fake_api_server.pods["other-worker-0"] = ({"training.kubeflow.org/job-name": "other"}, b"")
+
+        assert watched_k8s_system.get_pod_names_for_job("job") == ["job-worker-0"]
+        assert fake_api_server.requests["list pods"] == 1
@@ -0,0 +1,74 @@
+# SPDX-FileCopyrightText: NVIDIA CORPORATION & AFFILIATES
+# Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from pathlib import Path
+
+import pytest
+
+from cloudai.configurator.pareto import ParetoFront, dominates
+from cloudai.core import DSEObjective
+
+
+@pytest.fixture
+def front() -> ParetoFront:
+    return ParetoFront(
+        ["step-time", "throughput", "extra"],
+        [DSEObjective(metric="step-time"), DSEObjective(metric="throughput", goal="maximize", limit=10.0)],
+    )
+
+
+def test_dominates():
+    assert dominates((1.0, 2.0), (1.0, 1.0))
+    assert not dominates((1.0, 1.0), (1.0, 1.0))
+    assert not dominates((2.0, 0.0), (1.0, 1.0))
+
+
+def test_incremental_updates(front: ParetoFront):
+    assert front.add(1, {}, [2.0, 20.0, 0.0])
+    assert front.add(2, {}, [1.0, 15.0, 0.0])
+    assert not front.add(3, {}, [3.0, 15.0, 0.0])
+    assert front.add(4, {}, [1.0, 25.0, 0.0])
+
+    assert [p.step for p in front.points] == [4]
+    assert front.points[0].scores == (-1.0, 25.0)
+
+
+def test_trade_offs_are_kept(front: ParetoFront):
+    for step, observation in enumerate([[1.0, 12.0, 0.0], [2.0, 20.0, 0.0], [3.0, 30.0, 0.0]], start=1):
+        front.add(step, {"step": step}, observation)
+
+    assert [p.action for p in front.points] == [{"step": 1}, {"step": 2}, {"step": 3}]
+
+
+def test_duplicate_scores_are_not_added(front: ParetoFront):
+    assert front.add(1, {}, [1.0, 12.0, 0.0])
+    assert not front.add(2, {}, [1.0, 12.0, 5.0])
+
+
+@pytest.mark.parametrize("observation", [[1.0, 5.0, 0.0], [-1.0, 20.0, 0.0], [1.0]])
+def test_invalid_observations_are_not_added(front: ParetoFront, observation: list[float]):
+    assert not front.add(1, {}, observation)
+    assert front.points == []
+
+
+def test_dump(front: ParetoFront, tmp_path: Path):
+    front.add(7, {"a": 1}, [1.0, 12.0, 0.0])
+    front.dump(tmp_path / "front.csv")
+
+    assert (tmp_path / "front.csv").read_text().splitlines() == [
+        "step,action,observation",
+        "7,{'a': 1},\"[1.0, 12.0, 0.0]\"",
+    ]
@@ -0,0 +1,150 @@
+# SPDX-FileCopyrightText: NVIDIA CORPORATION & AFFILIATES
+# Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import threading
+from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
+
+from cloudai.util.parse_cache import IncrementalParser, ParseCache
+
+
+class LinesParser(IncrementalParser[list[str]]):
+    def __init__(self) -> None:
+        self.lines: list[str] = []
+
+    def feed(self, line: str) -> None:
+        self.lines.append(line.rstrip("\n"))
+
+    def result(self) -> list[str]:
+        return list(self.lines)
+
+
+@pytest.fixture
+def cache() -> ParseCache:
+    return ParseCache(maxsize=2)
+
+
+@pytest.fixture
+def log_file(tmp_path: Path) -> Path:
+    path = tmp_path / "stdout.txt"
+    path.write_text("a\nb\n")
+    return path
+
+
+def append(path: Path, text: str) -> None:
+    with path.open("a") as f:
+        f.write(text)
+
+
+class TestParseFile:
+    def test_hit(self, cache: ParseCache, log_file: Path):
+        parse = Mock(return_value=1, __module__="test", __qualname__="parse")
+
+        assert cache.parse_file(log_file, parse) == 1
+        assert cache.parse_file(log_file, parse) == 1
+
+        parse.assert_called_once_with(log_file)
+        assert (cache.stats.hits, cache.stats.misses) == (1, 1)
+
+    def test_args_are_part_of_key(self, cache: ParseCache, log_file: Path):
+        parse = Mock(side_effect=lambda _, arg: arg, __module__="test", __qualname__="parse")
+
+        assert cache.parse_file(log_file, parse, True) is True
+        assert cache.parse_file(log_file, parse, False) is False
+
+    def test_rewrite_invalidates(self, cache: ParseCache, log_file: Path):
+        cache.parse_file(log_file, lambda path: path.read_text())
+        log_file.write_text("c\n")
+        os.utime(log_file, ns=(0, 0))
+
+        assert cache.parse_file(log_file, lambda path: path.read_text()) == "c\n"
+
+    def test_eviction(self, cache: ParseCache, tmp_path: Path):
+        for name in ("1", "2", "3"):
+            (tmp_path / name).write_text(name)
+            cache.parse_file(tmp_path / name, lambda path: path.read_text())
+
+        assert len(cache) == 2
+        assert cache.stats.evictions == 1
+
+
+class TestParseLines:
+    def test_hit(self, cache: ParseCache, log_file: Path):
+        first = cache.parse_lines(log_file, LinesParser)
+        second = cache.parse_lines(log_file, LinesParser)
+
+        assert first == second == ["a", "b"]
+        assert (cache.stats.hits, cache.stats.misses) == (1, 1)
+
+    def test_append_resumes(self, cache: ParseCache, log_file: Path):
+        cache.parse_lines(log_file, LinesParser)
+        append(log_file, "c\n")
+
+        assert cache.parse_lines(log_file, LinesParser) == ["a", "b", "c"]
+        assert (cache.stats.resumed, cache.stats.misses) == (1, 1)
+
+    def test_partial_line_is_parsed_again(self, cache: ParseCache, log_file: Path):
+        append(log_file, "c")
+        assert cache.parse_lines(log_file, LinesParser) == ["a", "b", "c"]
+
+        append(log_file, "d\ne")
+        assert cache.parse_lines(log_file, LinesParser) == ["a", "b", "cd", "e"]
+        assert cache.stats.resumed == 1
+
+    def test_rewrite_invalidates(self, cache: ParseCache, log_file: Path):
+        cache.parse_lines(log_file, LinesParser)
+        log_file.write_text("x\ny\nz\n")
+
+        assert cache.parse_lines(log_file, LinesParser) == ["x", "y", "z"]
+        assert (cache.stats.resumed, cache.stats.misses) == (0, 2)
+
+    def test_truncation_invalidates(self, cache: ParseCache, log_file: Path):
+        cache.parse_lines(log_file, LinesParser)
+        log_file.write_text("c\n")
+
+        assert cache.parse_lines(log_file, LinesParser) == ["c"]
+
+    def test_missing_file(self, cache: ParseCache, tmp_path: Path):
+        with pytest.raises(FileNotFoundError):
+            cache.parse_lines(tmp_path / "missing.txt", LinesParser)
+
+    def test_clear(self, cache: ParseCache, log_file: Path):
+        cache.parse_lines(log_file, LinesParser)
+        cache.clear()
+
+        assert len(cache) == 0
+        assert cache.stats.misses == 0
+
+
+def test_stats_are_consistent_across_threads(cache: ParseCache, log_file: Path):
+    parse = Mock(return_value=1, __module__="test", __qualname__="parse")
+    cache.parse_file(log_file, parse)
+
+    def lookup() -> None:
+        for _ in range(1000):
+            cache.parse_file(log_file, parse)
+
+    threads = [threading.Thread(target=lookup) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert cache.stats.hits == 4000
+    assert cache.stats.misses == 1
@@ -15,8 +15,8 @@
 # limitations under the License.
 
 from pathlib import Path
-from typing import Generator, cast
-from unittest.mock import Mock, patch
+from typing import Generator, Optional, cast
+from unittest.mock import patch
 
 import pytest
 from pydantic_core import ErrorDetails
@@ -38,97 +38,73 @@ class Test_Parser:
             parser.parse(tests_dir, None)
         assert "Test path" in str(exc_info.value)
 
-    @patch("cloudai.test_parser.TestParser.parse_all")
-    def test_no_scenario(self, test_parser: Mock, parser: Parser):
-        tests_dir = parser.system_config_path.parent.parent / "test"
-        fake_tests = []
+    @pytest.fixture()
+    def tests_dir(self, tmp_path: Path) -> Path:
+        tests_dir = tmp_path / "tests"
+        tests_dir.mkdir()
         for i in range(3):
-            fake_tests.append(Mock())
-            fake_tests[-1].name = f"test-{i}"
-        test_parser.return_value = fake_tests
+            (tests_dir / f"test-{i}.toml").write_text(
+                f'name = "test-{i}"\ndescription = "desc"\ntest_template_name = "NcclTest"\n\n'
+                '[cmd_args]\ndocker_image_url = "fake://url/nccl"\n'
+            )
+        return tests_dir
+
+    def write_scenario(self, path: Path, test_name: str, pre_test: Optional[str] = None) -> Path:
+        hook = f'pre_test = "{pre_test}"\n' if pre_test else ""
+        path.write_text(f'name = "scenario"\n{hook}\n[[Tests]]\nid = "1"\ntest_name = "{test_name}"\nnum_nodes = 1\n')
+        return path
+
+    def test_no_scenario(self, tests_dir: Path, parser: Parser):
         _, tests, _ = parser.parse(tests_dir, None)
-        assert len(tests) == 3
-
-    @patch("cloudai.test_parser.TestParser.parse_all")
-    @patch("cloudai.test_scenario_parser.TestScenarioParser.parse")
-    def test_scenario_without_hook(self, test_scenario_parser: Mock, test_parser: Mock, parser: Parser):
-        tests_dir = parser.system_config_path.parent.parent / "test"
-
-        fake_tests = [Mock(name=f"test-{i}") for i in range(3)]
-        for i, test in enumerate(fake_tests):
-            test.name = f"test-{i}"
-
-        test_parser.side_effect = [fake_tests, []]
-
-        fake_scenario = Mock()
-        fake_scenario.test_runs = [Mock()]
-        fake_scenario.test_runs[0].test.name = "test-1"
-        test_scenario_parser.return_value = fake_scenario
-
-        _, tests, _ = parser.parse(tests_dir, Path())
-
-        assert len(tests) == 1
-        assert tests[0].name == "test-1"
-
-    @patch("cloudai.test_parser.TestParser.parse_all")
-    @patch("cloudai.test_scenario_parser.TestScenarioParser.parse")
-    @patch("cloudai.parser.Parser.parse_hooks")
-    def test_scenario_with_hook_common_tests(
-        self, parse_hooks: Mock, test_scenario_parser: Mock, test_parser: Mock, parser: Parser
-    ):
-        tests_dir = parser.system_config_path.parent.parent / "test"
-
-        main_tests = [Mock() for _ in range(3)]
-        for i, test in enumerate(main_tests):
-            test.name = f"test-{i}"
-        hook_tests = [Mock()]
-        hook_tests[0].name = "test-1"
-
-        test_parser.side_effect = [main_tests, hook_tests]
-
-        fake_scenario = Mock()
-        fake_scenario.test_runs = [Mock()]
-        fake_scenario.test_runs[0].test.name = "test-1"
-        test_scenario_parser.return_value = fake_scenario
-
-        fake_hook = Mock()
-        fake_hook.test_runs = [Mock()]
-        fake_hook.test_runs[0].test.name = "test-1"
-        parse_hooks.return_value = {"hook-1": fake_hook}
-
-        _, tests, _ = parser.parse(tests_dir, Path())
-
-        filtered_test_names = {"test-1"}
-        assert len(tests) == 1
-        assert "test-1" in filtered_test_names
-
-    @patch("cloudai.test_parser.TestParser.parse_all")
-    @patch("cloudai.test_scenario_parser.TestScenarioParser.parse")
-    def test_scenario_with_hook_exclusive_tests(self, test_scenario_parser: Mock, test_parser: Mock, parser: Parser):
-        tests_dir = parser.system_config_path.parent.parent / "test"
-        test_scenario_path = Path("/mock/test_scenario.toml")
-
-        main_tests = [Mock() for _ in range(3)]
-        hook_tests = [Mock()]
-        for i, test in enumerate(main_tests):
-            test.name = f"test-{i}"
-        hook_tests[0].name = "hook-test-1"
-
-        test_parser.side_effect = [main_tests, hook_tests]
-
-        fake_scenario = Mock()
-        fake_scenario.test_runs = [Mock()]
-        fake_scenario.test_runs[0].test.name = "test-1"
-        test_scenario_parser.return_value = fake_scenario
-
-        _, filtered_tests, _ = parser.parse(tests_dir, test_scenario_path)
-
-        filtered_test_names = {t.name for t in filtered_tests}
-        assert len(filtered_tests) == 2
-        assert "test-1" in filtered_test_names
-        assert "hook-test-1" in filtered_test_names
-        assert "test-0" not in filtered_test_names
-        assert "test-2" not in filtered_test_names
+        assert {t.name for t in tests} == {"test-0", "test-1", "test-2", "nccl_test_all_gather"}
+
+    def test_scenario_without_hook(self, tests_dir: Path, tmp_path: Path, parser: Parser):
+        scenario = self.write_scenario(tmp_path / "scenario.toml", "test-1")
+
+        _, tests, test_scenario = parser.parse(tests_dir, scenario)
+
+        assert [t.name for t in tests] == ["test-1"]
+        assert test_scenario is not None
+        assert test_scenario.test_runs[0].test.name == "test-1"
+
+    def test_scenario_with_hook(self, tests_dir: Path, tmp_path: Path, parser: Parser):
+        scenario = self.write_scenario(tmp_path / "scenario.toml", "test-1", pre_test="nccl_test")
+
+        _, tests, test_scenario = parser.parse(tests_dir, scenario)
+
+        assert {t.name for t in tests} == {"test-1", "nccl_test_all_gather"}
+        assert test_scenario is not None
+        pre_test = test_scenario.test_runs[0].pre_test
+        assert pre_test is not None
+        assert pre_test.test_runs[0].test.name == "nccl_test_all_gather"
+
+    def test_hook_tests_shared_with_scenario(self, tests_dir: Path, tmp_path: Path, parser: Parser):
+        (tests_dir / "nccl_test_all_gather.toml").write_text(
+            Path("conf/hook/test/nccl_test_all_gather.toml").read_text()
+        )
+        scenario = self.write_scenario(tmp_path / "scenario.toml", "nccl_test_all_gather", pre_test="nccl_test")
+
+        _, tests, _ = parser.parse(tests_dir, scenario)
+
+        assert [t.name for t in tests] == ["nccl_test_all_gather"]
+
+    def test_unreferenced_tests_are_not_loaded(self, tests_dir: Path, tmp_path: Path, parser: Parser):
+        (tests_dir / "broken.toml").write_text('name = "broken"\ntest_template_name = "NcclTest"\nunknown = 1\n')
+        (tests_dir / "not-toml.toml").write_text("[[[")
+        scenario = self.write_scenario(tmp_path / "scenario.toml", "test-2")
+
+        with patch("cloudai.parser.Parser.parse_tests", wraps=Parser.parse_tests) as parse_tests:
+            _, tests, _ = parser.parse(tests_dir, scenario)
+
+        assert [t.name for t in tests] == ["test-2"]
+        assert parse_tests.call_count == 1
+
+    def test_invalid_referenced_test_exits(self, tests_dir: Path, tmp_path: Path, parser: Parser):
+        (tests_dir / "broken.toml").write_text('name = "broken"\ntest_template_name = "NcclTest"\nunknown = 1\n')
+        scenario = self.write_scenario(tmp_path / "scenario.toml", "broken")
+
+        with pytest.raises(SystemExit):
+            parser.parse(tests_dir, scenario)
 
     def test_parse_system(self, parser: Parser):
         parser.system_config_path = Path("conf/common/system/example_slurm_cluster.toml")
@@ -15,6 +15,9 @@
 # limitations under the License.
 
 import copy
+import threading
+import time
+from unittest.mock import Mock
 
 import pytest
 
@@ -322,3 +325,89 @@ class TestRegistry__CommandGenStrategiesMap:
         with pytest.raises(KeyError) as exc_info:
             registry.get_command_gen_strategy(MySystem, AnotherTestDefinition)
         assert exc_info.match("Command gen strategy for 'MySystem, AnotherTestDefinition' not found.")
+
+
+class LazySystem(System):
+    pass
+
+
+class LazyTestDefinition(TestDefinition):
+    pass
+
+
+class TestRegistry__Plugins:
+    """This test verifies deferred registration of plugins."""
+
+    @pytest.fixture
+    def plugin(self, registry: Registry):
+        calls: list[str] = []
+
+        def register() -> None:
+            calls.append("registered")
+            registry.add_system("lazy", LazySystem)
+            registry.add_command_gen_strategy(MySystem, LazyTestDefinition, CommandGenStrategy)
+
+        registry.add_plugin(LazyTestDefinition.__module__, register, systems=["lazy"])
+        yield calls
+
+        registry.plugins.pop(LazyTestDefinition.__module__, None)
+        registry.systems_map.pop("lazy", None)
+        registry.systems_map.declared.pop("lazy", None)
+        registry.command_gen_strategies_map.pop((MySystem, LazyTestDefinition), None)
+
+    def test_not_registered_on_declaration(self, registry: Registry, plugin: list[str]):
+        assert registry.systems_map.declared["lazy"] == LazyTestDefinition.__module__
+        assert plugin == []
+
+    def test_registered_on_name_lookup(self, registry: Registry, plugin: list[str]):
+        assert "lazy" in registry.systems_map
+        assert registry.systems_map["lazy"] == LazySystem
+        assert registry.systems_map.get("lazy") == LazySystem
+        assert plugin == ["registered"]
+
+    def test_registered_on_type_lookup(self, registry: Registry, plugin: list[str]):
+        assert registry.get_command_gen_strategy(MySystem, LazyTestDefinition) == CommandGenStrategy
+        assert plugin == ["registered"]
+
+    def test_registered_on_iteration(self, registry: Registry, plugin: list[str]):
+        assert "lazy" in list(registry.systems_map.keys())
+        assert plugin == ["registered"]
+
+    def test_duplicate_plugin(self, registry: Registry, plugin: list[str]):
+        with pytest.raises(ValueError) as exc_info:
+            registry.add_plugin(LazyTestDefinition.__module__, lambda: None)
+        assert str(exc_info.value) == f"Duplicating plugin '{LazyTestDefinition.__module__}'."
+
+    def test_unknown_name_does_not_register(self, registry: Registry, plugin: list[str]):
+        assert "unknown" not in registry.systems_map
+        assert plugin == []
+
+    def test_failed_registration_is_retried(self, registry: Registry, plugin: list[str]):
+        register = registry.plugins[LazyTestDefinition.__module__]
+        registry.plugins[LazyTestDefinition.__module__] = Mock(side_effect=ImportError("missing"))
+
+        with pytest.raises(ImportError):
+            registry.load_plugin(LazyTestDefinition.__module__)
+        assert LazyTestDefinition.__module__ in registry.plugins
+
+        registry.plugins[LazyTestDefinition.__module__] = register
+        assert registry.systems_map["lazy"] == LazySystem
+        assert plugin == ["registered"]
+
+    def test_concurrent_lookups_wait_for_registration(self, registry: Registry, plugin: list[str]):
+        register = registry.plugins[LazyTestDefinition.__module__]
+        started = threading.Event()
+
+        def slow_register() -> None:
+            started.set()
+            time.sleep(0.1)
+            register()
+
+        registry.plugins[LazyTestDefinition.__module__] = slow_register
+        loader = threading.Thread(target=registry.load_plugin, args=(LazyTestDefinition.__module__,))
+        loader.start()
+        started.wait()
+
+        assert registry.systems_map["lazy"] == LazySystem
+        loader.join()
+        assert plugin == ["registered"]
@@ -16,6 +16,7 @@
 
 import copy
 import csv
+import os
 import tarfile
 from pathlib import Path
 
@@ -27,10 +28,21 @@ from cloudai._core.base_reporter import Reporter
 from cloudai._core.registry import Registry
 from cloudai._core.system import System
 from cloudai.cli.handlers import generate_reports
-from cloudai.core import CommandGenStrategy, TestTemplate
+from cloudai.configurator.pareto import PARETO_FRONT_FILE_NAME
+from cloudai.core import CommandGenStrategy, DSEObjective, ReportGenerationStrategy, TestTemplate
+from cloudai.models.job_accounting import JobAccounting
 from cloudai.models.scenario import ReportConfig, TestRunDetails
-from cloudai.reporter import PerTestReporter, StatusReporter, TarballReporter
+from cloudai.reporter import (
+    PER_TEST_REPORT_STATE_FILE,
+    JobAccountingReporter,
+    PerTestReportConfig,
+    PerTestReporter,
+    StatusReporter,
+    TarballReporter,
+)
+from cloudai.systems.slurm import SlurmJobMetadata
 from cloudai.systems.slurm.slurm_system import SlurmSystem
+from cloudai.systems.standalone import StandaloneJobMetadata
 from cloudai.systems.standalone.standalone_system import StandaloneSystem
 from cloudai.workloads.nccl_test import NCCLCmdArgs, NCCLTestDefinition
 
@@ -153,6 +165,50 @@ def test_best_dse_config(dse_tr: TestRun, slurm_system: SlurmSystem) -> None:
     assert nccl.agent_steps == 12
 
 
+def test_best_dse_config_skips_invalid_rewards(dse_tr: TestRun, slurm_system: SlurmSystem) -> None:
+    reporter = StatusReporter(
+        slurm_system, TestScenario(name="test_scenario", test_runs=[dse_tr]), slurm_system.output_path, ReportConfig()
+    )
+    tr_root = reporter.results_root / dse_tr.name / f"{dse_tr.current_iteration}"
+    (tr_root / "trajectory.csv").write_text("step,action,reward,observation\n1,{},-inf,[-1.0]\n2,{},-inf,[-1.0]\n")
+
+    reporter.report_best_dse_config()
+
+    assert not (tr_root / reporter.best_dse_config_file_name(dse_tr)).exists()
+
+
+def test_pareto_dse_configs(dse_tr: TestRun, slurm_system: SlurmSystem) -> None:
+    dse_tr.test.test_definition.agent_objectives = [DSEObjective(metric="default")]
+    reporter = StatusReporter(
+        slurm_system, TestScenario(name="test_scenario", test_runs=[dse_tr]), slurm_system.output_path, ReportConfig()
+    )
+    tr_root = reporter.results_root / dse_tr.name / f"{dse_tr.current_iteration}"
+    (tr_root / PARETO_FRONT_FILE_NAME).write_text("step,action,observation\n2,{},[2.0]\n5,{},[5.0]\n")
+
+    reporter.report_pareto_dse_configs()
+
+    for step in (2, 5):
+        config_path = tr_root / reporter.pareto_dse_config_file_name(dse_tr, step)
+        nccl = NCCLTestDefinition.model_validate(toml.load(config_path))
+        assert nccl.agent_steps == 12
+    assert not (tr_root / reporter.pareto_dse_config_file_name(dse_tr, 3)).exists()
+
+
+def test_pareto_dse_configs_missing_step(dse_tr: TestRun, slurm_system: SlurmSystem) -> None:
+    dse_tr.test.test_definition.agent_objectives = [DSEObjective(metric="default")]
+    reporter = StatusReporter(
+        slurm_system, TestScenario(name="test_scenario", test_runs=[dse_tr]), slurm_system.output_path, ReportConfig()
+    )
+    tr_root = reporter.results_root / dse_tr.name / f"{dse_tr.current_iteration}"
+    (tr_root / PARETO_FRONT_FILE_NAME).write_text("step,action,observation\n2,{},[2.0]\n5,{},[5.0]\n")
+    (tr_root / "2" / CommandGenStrategy.TEST_RUN_DUMP_FILE_NAME).unlink()
+
+    reporter.report_pareto_dse_configs()
+
+    assert not (tr_root / reporter.pareto_dse_config_file_name(dse_tr, 2)).exists()
+    assert (tr_root / reporter.pareto_dse_config_file_name(dse_tr, 5)).exists()
+
+
 @pytest.mark.parametrize(
     "system",
     [
@@ -208,3 +264,159 @@ class TestGenerateReport:
         slurm_system.reports = {"sr1": ReportConfig(enable=False)}
         generate_reports(slurm_system, TestScenario(name="ts", test_runs=[]), slurm_system.output_path)
         assert MY_REPORT_CALLED == 0
+
+
+class CountingReport(ReportGenerationStrategy):
+    def can_handle_directory(self) -> bool:
+        return True
+
+    def generate_report(self) -> None:
+        with (self.test_run.output_path / "report.txt").open("a") as f:
+            f.write(f"{os.getpid()}\n")
+
+
+class FailingReport(CountingReport):
+    def generate_report(self) -> None:
+        raise ValueError("broken")
+
+
+class TestPerTestReporter:
+    def generate(self, system: System, tr: TestRun, **config) -> None:
+        scenario = TestScenario(name="scenario", test_runs=[tr])
+        PerTestReporter(system, scenario, system.output_path, PerTestReportConfig(enable=True, **config)).generate()
+
+    def reports(self, system: System, tr: TestRun) -> list[list[str]]:
+        return [
+            (system.output_path / tr.name / str(i) / "report.txt").read_text().splitlines()
+            for i in range(tr.iterations)
+        ]
+
+    def test_parallel(self, slurm_system: SlurmSystem, benchmark_tr: TestRun) -> None:
+        benchmark_tr.reports = {CountingReport}
+
+        self.generate(slurm_system, benchmark_tr, workers=2)
+
+        reports = self.reports(slurm_system, benchmark_tr)
+        assert all(len(report) == 1 for report in reports)
+        assert os.getpid() not in {int(report[0]) for report in reports}
+
+    def test_worker_failure_falls_back_to_main_process(
+        self, slurm_system: SlurmSystem, benchmark_tr: TestRun, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        class LocalReport(CountingReport):  # local classes can't be pickled
+            pass
+
+        benchmark_tr.reports = {LocalReport}
+
+        self.generate(slurm_system, benchmark_tr, workers=2)
+
+        reports = self.reports(slurm_system, benchmark_tr)
+        assert {int(report[0]) for report in reports} == {os.getpid()}
+        assert "Worker failed to generate reports" in caplog.text
+        assert all(r.levelname == "WARNING" for r in caplog.records if "Worker failed" in r.message)
+
+    def test_unchanged_runs_are_skipped(self, slurm_system: SlurmSystem, benchmark_tr: TestRun) -> None:
+        benchmark_tr.reports = {CountingReport}
+        self.generate(slurm_system, benchmark_tr, workers=1)
+
+        (slurm_system.output_path / benchmark_tr.name / "1" / "stdout.txt").write_text("new output")
+        self.generate(slurm_system, benchmark_tr, workers=1)
+
+        assert [len(report) for report in self.reports(slurm_system, benchmark_tr)] == [1, 2, 1]
+
+    def test_not_incremental(self, slurm_system: SlurmSystem, benchmark_tr: TestRun) -> None:
+        benchmark_tr.reports = {CountingReport}
+        self.generate(slurm_system, benchmark_tr, workers=1, incremental=False)
+        self.generate(slurm_system, benchmark_tr, workers=1, incremental=False)
+
+        assert [len(report) for report in self.reports(slurm_system, benchmark_tr)] == [2, 2, 2]
+
+    def test_failed_runs_are_retried(self, slurm_system: SlurmSystem, benchmark_tr: TestRun) -> None:
+        benchmark_tr.reports = {FailingReport}
+        self.generate(slurm_system, benchmark_tr, workers=1)
+
+        assert not (slurm_system.output_path / benchmark_tr.name / "0" / PER_TEST_REPORT_STATE_FILE).exists()
+
+    def test_strategy_change_invalidates(self, slurm_system: SlurmSystem, benchmark_tr: TestRun) -> None:
+        benchmark_tr.reports = {CountingReport}
+        self.generate(slurm_system, benchmark_tr, workers=1)
+
+        benchmark_tr.reports = {CountingReport, FailingReport}
+        self.generate(slurm_system, benchmark_tr, workers=1)
+
+        assert [len(report) for report in self.reports(slurm_system, benchmark_tr)] == [2, 2, 2]
+
+
+class TestJobAccountingReporter:
+    def write_slurm_job(self, run_dir: Path, job_id: int, accounting: JobAccounting | None) -> None:
+        meta = SlurmJobMetadata(
+            job_id=job_id,
+            name="job",
+            state="COMPLETED",
+            start_time="",
+            end_time="",
+            elapsed_time_sec=0,
+            exit_code="0:0",
+            srun_cmd="",
+            test_cmd="",
+            job_root=run_dir,
+            job_steps=[],
+            accounting=accounting,
+        )
+        (run_dir / "slurm-job.toml").write_text(toml.dumps(meta.model_dump()))
+
+    def generate(self, system: System, tr: TestRun) -> list[dict[str, str]]:
+        scenario = TestScenario(name="scenario", test_runs=[tr])
+        JobAccountingReporter(system, scenario, system.output_path, ReportConfig()).generate()
+        with (system.output_path / "job-accounting.csv").open() as f:
+            return list(csv.DictReader(f))
+
+    def test_slurm(self, slurm_system: SlurmSystem, benchmark_tr: TestRun) -> None:
+        root = slurm_system.output_path / benchmark_tr.name
+        self.write_slurm_job(
+            root / "0",
+            1,
+            JobAccounting(
+                queue_wait_sec=10,
+                run_time_sec=100,
+                max_rss_bytes=2048,
+                alloc_tres={"gres/gpu": "8"},
+                tres_usage={"gres/gpuutil": "95", "cpu": "00:01:00"},
+            ),
+        )
+        self.write_slurm_job(root / "1", 2, JobAccounting(queue_wait_sec=5, run_time_sec=50, max_rss_bytes=4096))
+        self.write_slurm_job(root / "2", 3, None)
+
+        rows = self.generate(slurm_system, benchmark_tr)
+
+        assert [row["test_run"] for row in rows] == ["benchmark", "benchmark iter=1", "total"]
+        assert rows[0]["gpus"] == "8"
+        assert rows[0]["gpu_tres_usage"] == "gres/gpuutil=95"
+        assert float(rows[-1]["queue_wait_sec"]) == 15
+        assert float(rows[-1]["run_time_sec"]) == 150
+        assert int(rows[-1]["max_rss_bytes"]) == 4096
+
+    def test_standalone(self, slurm_system: SlurmSystem, benchmark_tr: TestRun) -> None:
+        meta = StandaloneJobMetadata(
+            job_id=42, command="sleep 1", exit_code=1, accounting=JobAccounting(run_time_sec=1, total_cpu_sec=0.5)
+        )
+        (slurm_system.output_path / benchmark_tr.name / "0" / "standalone-job.toml").write_text(
+            toml.dumps(meta.model_dump())
+        )
+
+        rows = self.generate(slurm_system, benchmark_tr)
+
+        assert rows[0]["job_id"] == "42"
+        assert rows[0]["state"] == "FAILED"
+        assert float(rows[0]["total_cpu_sec"]) == 0.5
+
+    def test_no_accounting(self, slurm_system: SlurmSystem, benchmark_tr: TestRun) -> None:
+        reporter = JobAccountingReporter(
+            slurm_system,
+            TestScenario(name="scenario", test_runs=[benchmark_tr]),
+            slurm_system.output_path,
+            ReportConfig(),
+        )
+        reporter.generate()
+
+        assert not (slurm_system.output_path / "job-accounting.csv").exists()
@@ -0,0 +1,218 @@
+# SPDX-FileCopyrightText: NVIDIA CORPORATION & AFFILIATES
+# Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from pathlib import Path
+from unittest.mock import Mock
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from cloudai.core import Test, TestRun, TestScenario
+from cloudai.models.scenario import ReportConfig
+from cloudai.results_store import ResultsStore, scenario_root, store_results
+from cloudai.systems.slurm import SlurmSystem
+from cloudai.workloads.nixl_bench import NIXLBenchCmdArgs, NIXLBenchSummaryReport, NIXLBenchTestDefinition
+
+
+def nixl_tr(results_root: Path, name: str, op_type: str, seg_type: str, step: int = 0) -> TestRun:
+    tdef = NIXLBenchTestDefinition(
+        name=name,
+        description="desc",
+        test_template_name="NIXLBench",
+        etcd_image_url="etcd",
+        cmd_args=NIXLBenchCmdArgs.model_validate(
+            {
+                "docker_image_url": "fake://url/nixl",
+                "etcd_endpoint": "http://etcd",
+                "path_to_benchmark": "/nixlbench",
+                "op_type": op_type,
+                "initiator_seg_type": seg_type,
+                "target_seg_type": seg_type,
+            }
+        ),
+    )
+    output_path = results_root / name / "0" / (str(step) if step > 0 else "")
+    tr = TestRun(name, Test(tdef, Mock()), 1, [], output_path=output_path, step=step)
+    tr.output_path.mkdir(parents=True, exist_ok=True)
+    return tr
+
+
+def results(scale: float) -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "block_size": [4096, 8192],
+            "batch_size": [1, 1],
+            "avg_lat": [1.0 * scale, 2.0 * scale],
+            "bw_gb_sec": [5.0, 6.0],
+        }
+    )
+
+
+class TestResultsStore:
+    def test_scenario_root(self, tmp_path: Path):
+        assert scenario_root(nixl_tr(tmp_path, "t", "READ", "VRAM")) == tmp_path
+        assert scenario_root(nixl_tr(tmp_path, "t", "READ", "VRAM", step=3)) == tmp_path
+
+    def test_unknown_layout_is_not_stored(self, tmp_path: Path):
+        tr = nixl_tr(tmp_path, "t", "READ", "VRAM")
+        tr.output_path = tmp_path / "somewhere"
+
+        store_results("nixl", tr, results(1))
+
+        assert scenario_root(tr) is None
+        assert not (tmp_path.parent / "results-store").exists()
+
+    def test_scan_adds_labels(self, tmp_path: Path):
+        store_results("nixl", nixl_tr(tmp_path, "t", "READ", "VRAM"), results(1))
+
+        df = ResultsStore.for_scenario(tmp_path).scan("nixl")
+
+        assert len(df) == 2
+        assert set(df["cmd_args.op_type"]) == {"READ"}
+        assert set(df["test_run"]) == {"t"}
+        assert list(df["avg_lat"]) == [1.0, 2.0]
+
+    def test_filter_and_projection(self, tmp_path: Path):
+        store_results("nixl", nixl_tr(tmp_path, "read", "READ", "VRAM"), results(1))
+        store_results("nixl", nixl_tr(tmp_path, "write", "WRITE", "DRAM"), results(2))
+        store = ResultsStore.for_scenario(tmp_path)
+
+        df = store.scan("nixl", {"cmd_args.op_type": "WRITE"}, columns=["avg_lat"])
+
+        assert list(df["avg_lat"]) == [2.0, 4.0]
+        assert "bw_gb_sec" not in df.columns
+        assert len(store.scan("nixl", {"cmd_args.op_type": ["READ", "WRITE"]})) == 4
+        assert store.scan("nixl", {"cmd_args.op_type": "NONE"}).empty
+
+    def test_params_from_test_run_dump(self, tmp_path: Path):
+        tr = nixl_tr(tmp_path, "t", "READ", "VRAM", step=1)
+        (tr.output_path / "test-run.toml").write_text(
+            '[test_definition]\ntest_template_name = "NIXLBench"\n[test_definition.cmd_args]\nop_type = "WRITE"\n'
+        )
+        store_results("nixl", tr, results(1))
+
+        assert [g.labels["cmd_args.op_type"] for g in ResultsStore.for_scenario(tmp_path).row_groups("nixl")] == [
+            "WRITE"
+        ]
+
+    def test_params_do_not_override_test_run_labels(self, tmp_path: Path):
+        tr = nixl_tr(tmp_path, "t", "READ", "VRAM", step=1)
+        (tr.output_path / "test-run.toml").write_text(
+            '[test_definition]\ntest_template_name = "NIXLBench"\n'
+            '[test_definition.cmd_args]\nstep = 7\ntest_run = "x"\n'
+        )
+        store_results("nixl", tr, results(1))
+
+        labels = next(ResultsStore.for_scenario(tmp_path).row_groups("nixl")).labels
+        assert (labels["test_run"], labels["step"]) == ("t", 1)
+        assert (labels["cmd_args.test_run"], labels["cmd_args.step"]) == ("x", 7)
+
+    def test_rewrite_replaces_row_group(self, tmp_path: Path):
+        tr = nixl_tr(tmp_path, "t", "READ", "VRAM")
+        store_results("nixl", tr, results(1))
+        store_results("nixl", tr, results(3))
+
+        assert list(ResultsStore.for_scenario(tmp_path).scan("nixl")["avg_lat"]) == [3.0, 6.0]
+
+    def test_invalid_row_group_is_ignored(self, tmp_path: Path):
+        (tmp_path / "results-store" / "nixl").mkdir(parents=True)
+        (tmp_path / "results-store" / "nixl" / "bad.npz").write_bytes(b"garbage")
+
+        assert ResultsStore.for_scenario(tmp_path).scan("nixl").empty
+
+    def test_non_numeric_columns(self, tmp_path: Path):
+        df = pd.DataFrame({"avg_lat": [1.0, 2.0], "mode": ["a", "b"], "extra": ["x", 3]})
+        store_results("nixl", nixl_tr(tmp_path, "t", "READ", "VRAM"), df)
+
+        loaded = ResultsStore.for_scenario(tmp_path).scan("nixl")
+
+        assert list(loaded["mode"]) == ["a", "b"]
+        assert list(loaded["extra"]) == ["x", 3]
+
+    def test_pickled_data_is_not_loaded(self, tmp_path: Path):
+        tr = nixl_tr(tmp_path, "t", "READ", "VRAM")
+        store_results("nixl", tr, results(1))
+        store = ResultsStore.for_scenario(tmp_path)
+        group = next(store.row_groups("nixl"))
+        with np.load(group.path) as archive:
+            arrays = {name: archive[name] for name in archive.files}
+        arrays["avg_lat"] = np.array([object(), object()], dtype=object)
+        np.savez(group.path, **arrays)
+
+        with pytest.raises(ValueError):
+            store.scan("nixl")
+
+
+class TestNIXLBenchSummaryReport:
+    @pytest.fixture
+    def trs(self, slurm_system: SlurmSystem) -> list[TestRun]:
+        return [
+            nixl_tr(slurm_system.output_path, "read-vram", "READ", "VRAM"),
+            nixl_tr(slurm_system.output_path, "read-dram", "READ", "DRAM"),
+            nixl_tr(slurm_system.output_path, "write-vram", "WRITE", "VRAM"),
+        ]
+
+    def report(self, slurm_system: SlurmSystem, trs: list[TestRun]) -> NIXLBenchSummaryReport:
+        scenario = TestScenario(name="nixl", test_runs=trs)
+        report = NIXLBenchSummaryReport(slurm_system, scenario, slurm_system.output_path, ReportConfig(enable=True))
+        report.load_tdef_with_results()
+        return report
+
+    def test_construct_df(self, slurm_system: SlurmSystem, trs: list[TestRun]):
+        for idx, tr in enumerate(trs, start=1):
+            store_results("nixl_bench", tr, results(idx))
+
+        df = self.report(slurm_system, trs).construct_df("READ", "avg_lat")
+
+        assert list(df.columns) == ["block_size", "batch_size", "DRAM->DRAM", "VRAM->VRAM"]
+        assert list(df["VRAM->VRAM"]) == [1.0, 2.0]
+        assert list(df["DRAM->DRAM"]) == [2.0, 4.0]
+
+    def test_csv_results_are_added_to_store(self, slurm_system: SlurmSystem, trs: list[TestRun]):
+        for tr in trs:
+            results(1).to_csv(tr.output_path / "nixlbench.csv", index=False)
+
+        report = self.report(slurm_system, trs)
+
+        assert len(report.results) == 6
+        assert len(list(ResultsStore.for_scenario(slurm_system.output_path).row_groups("nixl_bench"))) == 3
+
+    def test_missing_op_type(self, slurm_system: SlurmSystem, trs: list[TestRun]):
+        store_results("nixl_bench", trs[0], results(1))
+
+        report = self.report(slurm_system, trs)
+
+        assert report.construct_df("WRITE", "avg_lat").empty
+        assert report.create_chart("WRITE", "avg_lat") is None
+
+    def test_table(self, slurm_system: SlurmSystem, trs: list[TestRun]):
+        store_results("nixl_bench", trs[0], results(1))
+
+        table = self.report(slurm_system, trs).create_table("READ", "avg_lat")
+
+        assert [col.header for col in table.columns] == ["block_size", "batch_size", "VRAM->VRAM"]
+        assert list(table.columns[0].cells) == ["4096", "8192"]
+        assert list(table.columns[2].cells) == ["1.0", "2.0"]
+
+    def test_generate(self, slurm_system: SlurmSystem, trs: list[TestRun]):
+        for idx, tr in enumerate(trs, start=1):
+            store_results("nixl_bench", tr, results(idx))
+
+        scenario = TestScenario(name="nixl", test_runs=trs)
+        NIXLBenchSummaryReport(slurm_system, scenario, slurm_system.output_path, ReportConfig(enable=True)).generate()
+
+        assert (slurm_system.output_path / "nixl_summary.html").is_file()
@@ -17,14 +17,16 @@
 import copy
 import re
 from typing import Generator, cast
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
+import numpy as np
 import pytest
 import toml
 
 from cloudai._core.registry import Registry
 from cloudai.core import Test, TestRun, TestScenario, TestTemplate
-from cloudai.systems.slurm import SingleSbatchRunner, SlurmJob, SlurmJobMetadata, SlurmSystem
+from cloudai.models.job_accounting import JobAccounting
+from cloudai.systems.slurm import SingleSbatchRunner, SlurmJob, SlurmJobMetadata, SlurmStepMetadata, SlurmSystem
 from cloudai.workloads.nccl_test import NCCLCmdArgs, NCCLTestDefinition
 from cloudai.workloads.nccl_test.slurm_command_gen_strategy import NcclTestSlurmCommandGenStrategy
 from cloudai.workloads.sleep import SleepCmdArgs, SleepTestDefinition
@@ -346,6 +348,19 @@ def test_unroll_dse_constraint_check(nccl_tr: TestRun, slurm_system: SlurmSystem
     assert len(dse_runs) == 0
 
 
+def test_unroll_dse_skips_infeasible(nccl_tr: TestRun, slurm_system: SlurmSystem) -> None:
+    nccl_tr.num_nodes = [1, 2, 3]
+    nccl_tr.test.test_definition.extra_env_vars["NCCL_VAR"] = ["v1", "v2"]
+    tc = TestScenario(name="tc", test_runs=[nccl_tr])
+    runner = SingleSbatchRunner(mode="run", system=slurm_system, test_scenario=tc, output_path=slurm_system.output_path)
+
+    with patch.object(MyNCCL, "feasible_mask", return_value=np.array([True, False] * 3)):
+        dse_runs = list(runner.unroll_dse(nccl_tr))
+
+    assert [tr.step for tr in dse_runs] == [1, 3, 5]
+    assert [(tr.test.extra_env_vars["NCCL_VAR"], tr.num_nodes) for tr in dse_runs] == [("v1", 1), ("v1", 3), ("v2", 2)]
+
+
 class TestSbatch:
     def test_single_case(self, slurm_system: SlurmSystem, nccl_tr: TestRun) -> None:
         nccl_tr.test.test_definition.extra_env_vars["NCCL_VAR"] = "nccl_value"
@@ -503,20 +518,54 @@ def test_store_job_metadata(nccl_tr: TestRun, slurm_system: SlurmSystem) -> None
     assert sjm == SlurmJobMetadata.model_validate(toml.loads(toml.dumps(sjm.model_dump())))
 
 
+def test_store_job_metadata_with_accounting(nccl_tr: TestRun, slurm_system: SlurmSystem) -> None:
+    tc = TestScenario(name="tc", test_runs=[nccl_tr])
+    runner = SingleSbatchRunner(mode="run", system=slurm_system, test_scenario=tc, output_path=slurm_system.output_path)
+    runner.scenario_root.mkdir(parents=True, exist_ok=True)
+    steps = [
+        SlurmStepMetadata(
+            job_id=1,
+            step_id=step_id,
+            name="job",
+            state="COMPLETED",
+            exit_code="0:0",
+            start_time="",
+            end_time="",
+            elapsed_time_sec=10,
+            submit_line="",
+        )
+        for step_id in ["", "0"]
+    ]
+    accounting = {"1": JobAccounting(queue_wait_sec=5), "1.0": JobAccounting(max_rss_bytes=1024)}
+
+    with (
+        patch.object(SlurmSystem, "get_job_status", return_value=steps),
+        patch.object(SlurmSystem, "get_job_accounting", return_value=accounting),
+    ):
+        runner.store_job_metadata(SlurmJob(nccl_tr, id=1))
+
+    sjm = SlurmJobMetadata.model_validate(toml.load(runner.scenario_root / "slurm-job.toml"))
+    assert sjm.accounting == JobAccounting(queue_wait_sec=5)
+    assert sjm.job_steps[0].accounting == JobAccounting(max_rss_bytes=1024)
+
+
 def test_pre_test(nccl_tr: TestRun, sleep_tr: TestRun, slurm_system: SlurmSystem) -> None:
     nccl_tr.pre_test = TestScenario(name="pre_test", test_runs=[sleep_tr])
     tc = TestScenario(name="tc", test_runs=[nccl_tr])
     runner = SingleSbatchRunner(mode="run", system=slurm_system, test_scenario=tc, output_path=slurm_system.output_path)
 
+    sleep_output_path = sleep_tr.output_path
     pre_tests = runner.add_pre_tests(nccl_tr.pre_test, nccl_tr)
     tdef = cast(SleepTestDefinition, sleep_tr.test.test_definition)
+    hook_output_path = (runner.scenario_root / "pre_test" / sleep_tr.test.name).absolute()
 
+    assert sleep_tr.output_path == sleep_output_path
     assert pre_tests == "\n".join(
         [
-            f"srun --output={sleep_tr.output_path.absolute()}/stdout.txt "
-            f"--error={sleep_tr.output_path.absolute()}/stderr.txt "
+            f"srun --output={hook_output_path}/stdout.txt "
+            f"--error={hook_output_path}/stderr.txt "
             f"--export=ALL --mpi=pmix bash -c "
-            f'"source {sleep_tr.output_path.absolute()}/env_vars.sh; sleep {tdef.cmd_args.seconds}"',
+            f'"source {hook_output_path}/env_vars.sh; sleep {tdef.cmd_args.seconds}"',
             "SUCCESS_0=$()",
             "PRE_TEST_SUCCESS=$( [ $SUCCESS_0 -eq 1 ] && echo 1 || echo 0 )",
             "if [ $PRE_TEST_SUCCESS -ne 1 ]; then",
@@ -525,3 +574,34 @@ def test_pre_test(nccl_tr: TestRun, sleep_tr: TestRun, slurm_system: SlurmSystem
             "",
         ]
     )
+
+
+def test_dse_unrolled_once(nccl_tr: TestRun, slurm_system: SlurmSystem) -> None:
+    nccl_tr.test.test_definition.extra_env_vars["NCCL_VAR"] = ["v1", "v2"]
+    tc = TestScenario(name="tc", test_runs=[nccl_tr])
+    runner = SingleSbatchRunner(mode="run", system=slurm_system, test_scenario=tc, output_path=slurm_system.output_path)
+    runner.unroll_dse = Mock(wraps=runner.unroll_dse)
+
+    runner.gen_sbatch_content()
+    first = list(runner.all_trs)
+
+    runner.unroll_dse.assert_called_once_with(nccl_tr)
+    assert len(first) == 2
+    assert list(runner.all_trs) == first
+
+    runner.test_scenario.test_runs = [nccl_tr, nccl_tr]
+    assert len(list(runner.all_trs)) == 4
+
+
+def test_dse_unrolled_again_for_replaced_test_run(nccl_tr: TestRun, slurm_system: SlurmSystem) -> None:
+    nccl_tr.test.test_definition.extra_env_vars["NCCL_VAR"] = ["v1", "v2"]
+    tc = TestScenario(name="tc", test_runs=[nccl_tr])
+    runner = SingleSbatchRunner(mode="run", system=slurm_system, test_scenario=tc, output_path=slurm_system.output_path)
+    list(runner.all_trs)
+
+    replaced = copy.copy(nccl_tr)
+    replaced.test = copy.deepcopy(nccl_tr.test)
+    replaced.test.test_definition.extra_env_vars["NCCL_VAR"] = ["v1", "v2", "v3"]
+    runner.test_scenario.test_runs = [replaced]
+
+    assert len(list(runner.all_trs)) == 3
@@ -14,6 +14,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import copy
+import pickle
 import re
 from pathlib import Path
 from typing import Dict, List
@@ -26,12 +28,15 @@ from cloudai.core import BaseJob, Test, TestRun, TestTemplate
 from cloudai.models.scenario import ReportConfig
 from cloudai.systems.slurm import (
     SlurmCommandGenStrategy,
+    SlurmJob,
     SlurmNode,
     SlurmNodeState,
     SlurmSystem,
     parse_node_list,
 )
-from cloudai.systems.slurm.slurm_metadata import SlurmStepMetadata
+from cloudai.systems.slurm.slurm_metadata import SlurmStepMetadata, accounting_from_sacct_output
+from cloudai.systems.slurm.slurm_system import JOBS_STATE_FIELDS
+from cloudai.util import CommandShell
 from cloudai.workloads.nccl_test import NCCLCmdArgs, NCCLTestDefinition
 
 
@@ -307,6 +312,18 @@ def test_model_dump(slurm_system: SlurmSystem):
     assert recreated.model_dump() == sys_dict
 
 
+def test_copies_get_own_nodes_allocation_lock(slurm_system: SlurmSystem):
+    system = SlurmSystem.model_validate({**slurm_system.model_dump(), "cmd_shell": CommandShell()})
+    copied = copy.deepcopy(system)
+    unpickled = pickle.loads(pickle.dumps(system))
+
+    assert copied._nodes_allocation_lock is not system._nodes_allocation_lock
+    assert unpickled._nodes_allocation_lock is not system._nodes_allocation_lock
+    assert unpickled.model_dump() == system.model_dump()
+    with unpickled._nodes_allocation_lock:
+        pass
+
+
 def test_default_partition_is_required():
     with pytest.raises(ValueError):
         SlurmSystem(name="", install_path=Path.cwd(), output_path=Path.cwd(), partitions=[])  # type: ignore
@@ -587,6 +604,46 @@ def test_slurm_job_metadata_from_sacct_output(sacct_output: str, delimiter: str,
     assert len(job_metadata) == expected_nsteps
 
 
+sacct_accounting_output = (
+    "2623913|2025-05-09T01:30:00|2025-05-09T01:34:52|1475|01:02:03|||123|billing=8,cpu=8,gres/gpu=8,node=1||\n"
+    "2623913.batch|2025-05-09T01:34:52|2025-05-09T01:34:52|1475|00:01.500|00:00:01|10M|23|cpu=8,mem=0,node=1|"
+    "cpu=00:00:01,mem=10M|\n"
+    "2623913.0|2025-05-09T01:35:24|2025-05-09T01:35:24|34|1-00:00:00|12:00:00|1.5G|100|cpu=8,gres/gpu=8,node=1|"
+    "cpu=1-00:00:00,gres/gpuutil=95,mem=1.5G|\n"
+)
+
+
+def test_accounting_from_sacct_output():
+    accounting = accounting_from_sacct_output(sacct_accounting_output, delimiter="|")
+
+    assert list(accounting) == ["2623913", "2623913.batch", "2623913.0"]
+    job = accounting["2623913"]
+    assert job.submit_time == "2025-05-09T01:30:00"
+    assert job.queue_wait_sec == 292
+    assert job.run_time_sec == 1475
+    assert job.total_cpu_sec == 3723
+    assert job.ave_cpu_sec is None
+    assert job.max_rss_bytes == int(1.5 * 1024**3)
+    assert job.consumed_energy_joules == 123
+    assert job.gpus == 8
+
+    step = accounting["2623913.0"]
+    assert step.total_cpu_sec == 86400
+    assert step.ave_cpu_sec == 43200
+    assert step.tres_usage["gres/gpuutil"] == "95"
+    assert accounting["2623913.batch"].total_cpu_sec == 1.5
+    assert accounting["2623913.batch"].max_rss_bytes == 10 * 1024**2
+
+
+@pytest.mark.parametrize("stderr", ["error", "Socket timed out"])
+def test_get_job_accounting_failure(slurm_system: SlurmSystem, stderr: str):
+    pp = Mock()
+    pp.communicate = Mock(return_value=("", stderr))
+    slurm_system.cmd_shell.execute = Mock(return_value=pp)
+
+    assert slurm_system.get_job_accounting(BaseJob(test_run=Mock(), id=1)) == {}
+
+
 @pytest.mark.parametrize(
     "sinfo_nodes,squeue_nodes,expected_nodes",
     [
@@ -626,3 +683,112 @@ def test_update(
 
         all_nodes_set = set([node for p in slurm_system.partitions for node in p.slurm_nodes])
         assert all_nodes_set == set(expected_nodes)
+
+
+class TestUpdateJobsState:
+    def test_single_query_for_all_jobs(self, slurm_system: SlurmSystem):
+        jobs = [BaseJob(test_run=Mock(), id=2), BaseJob(test_run=Mock(), id=1), BaseJob(test_run=Mock(), id=3)]
+        pp = Mock()
+        pp.communicate = Mock(
+            return_value=(
+                "1|RUNNING|\n1.batch|RUNNING|\n1.0|RUNNING|\n2|COMPLETED|\n2.batch|COMPLETED|\n"
+                "3|CANCELLED by 42|\n3+0|CANCELLED by 42|\n",
+                "",
+            )
+        )
+        slurm_system.cmd_shell.execute = Mock(return_value=pp)
+
+        slurm_system.update_jobs_state(jobs)
+
+        slurm_system.cmd_shell.execute.assert_called_once_with(
+            f"sacct -j 1,2,3 --format={','.join(JOBS_STATE_FIELDS)} --noheader -p"
+        )
+        assert slurm_system.is_job_running(jobs[1]) is True
+        assert slurm_system.is_job_completed(jobs[1]) is False
+        assert slurm_system.is_job_running(jobs[0]) is False
+        assert slurm_system.is_job_completed(jobs[0]) is True
+        assert slurm_system.is_job_completed(jobs[2]) is True
+        assert slurm_system.cmd_shell.execute.call_count == 1
+
+    def test_job_missing_in_output_is_queried_individually(self, slurm_system: SlurmSystem):
+        jobs = [BaseJob(test_run=Mock(), id=1), BaseJob(test_run=Mock(), id=2)]
+        pp = Mock()
+        pp.communicate = Mock(side_effect=[("1|RUNNING|\n", ""), ("PENDING", "")])
+        slurm_system.cmd_shell.execute = Mock(return_value=pp)
+
+        slurm_system.update_jobs_state(jobs)
+
+        assert slurm_system.jobs_state_cache == {"1": ["RUNNING"]}
+        assert slurm_system.is_job_running(jobs[1]) is False
+        slurm_system.cmd_shell.execute.assert_called_with("sacct -j 2 --format=State --noheader")
+
+    def test_error_resets_cache(self, slurm_system: SlurmSystem):
+        slurm_system.jobs_state_cache = {"1": ["RUNNING"]}
+        pp = Mock()
+        pp.communicate = Mock(return_value=("", "some error"))
+        slurm_system.cmd_shell.execute = Mock(return_value=pp)
+
+        slurm_system.update_jobs_state([BaseJob(test_run=Mock(), id=1)])
+
+        assert slurm_system.jobs_state_cache == {}
+
+    def test_retries_on_transient_errors(self, slurm_system: SlurmSystem):
+        pp = Mock()
+        pp.communicate = Mock(side_effect=[("", "Socket timed out"), ("1|COMPLETED|\n", "")])
+        slurm_system.cmd_shell.execute = Mock(return_value=pp)
+
+        slurm_system.update_jobs_state([BaseJob(test_run=Mock(), id=1)])
+
+        assert slurm_system.cmd_shell.execute.call_count == 2
+        assert slurm_system.jobs_state_cache == {"1": ["COMPLETED"]}
+
+    def test_accounting_of_finished_jobs_is_cached(self, slurm_system: SlurmSystem):
+        output = "".join(
+            f"{job_id}|COMPLETED|{rest}\n"
+            for job_id, rest in (line.split("|", 1) for line in sacct_accounting_output.splitlines())
+        )
+        pp = Mock()
+        pp.communicate = Mock(return_value=(output, ""))
+        slurm_system.cmd_shell.execute = Mock(return_value=pp)
+        job = BaseJob(test_run=Mock(), id=2623913)
+
+        slurm_system.update_jobs_state([job])
+        accounting = slurm_system.get_job_accounting(job)
+
+        assert slurm_system.cmd_shell.execute.call_count == 1
+        assert accounting == accounting_from_sacct_output(sacct_accounting_output, delimiter="|")
+        assert slurm_system.is_job_completed(job) is True
+
+    def test_kill_drops_cached_state(self, slurm_system: SlurmSystem):
+        job, other = BaseJob(test_run=Mock(), id=1), BaseJob(test_run=Mock(), id=2)
+        slurm_system.jobs_state_cache = {"1": ["RUNNING"], "2": ["RUNNING"]}
+        slurm_system.jobs_accounting_cache = {"1": Mock(), "1.0": Mock(), "2": Mock()}
+
+        with patch.object(SlurmSystem, "scancel"):
+            slurm_system.kill(job)
+
+        assert slurm_system.jobs_state_cache == {"2": ["RUNNING"]}
+        assert list(slurm_system.jobs_accounting_cache) == ["2"]
+
+        pp = Mock()
+        pp.communicate = Mock(return_value=("CANCELLED", ""))
+        slurm_system.cmd_shell.execute = Mock(return_value=pp)
+        assert slurm_system.is_job_running(job) is False
+        slurm_system.cmd_shell.execute.assert_called_once()
+        assert slurm_system.is_job_running(other) is True
+
+    def test_complete_job_drops_cached_state(self, slurm_system: SlurmSystem):
+        job = SlurmJob(test_run=Mock(), id=1)
+        slurm_system.jobs_state_cache = {"1": ["COMPLETED"]}
+        slurm_system.jobs_accounting_cache = {"1": Mock()}
+
+        with patch.object(SlurmSystem, "fetch_command_output", return_value=("", "")):
+            slurm_system.complete_job(job)
+
+        assert slurm_system.jobs_state_cache == {}
+        assert list(slurm_system.jobs_accounting_cache) == ["1"]
+
+    def test_no_jobs_no_query(self, slurm_system: SlurmSystem):
+        slurm_system.cmd_shell.execute = Mock()
+        slurm_system.update_jobs_state([])
+        slurm_system.cmd_shell.execute.assert_not_called()
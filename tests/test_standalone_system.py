@@ -15,13 +15,23 @@
 # limitations under the License.
 
 
+import asyncio
+import os
+import signal
+import time
 from pathlib import Path
+from typing import Callable
 from unittest.mock import MagicMock, patch
 
 import pytest
+import toml
 
+from cloudai._core.test_template import TestTemplate
+from cloudai.core import Test, TestRun, TestScenario
+from cloudai.systems.standalone import StandaloneJobMetadata, StandaloneRunner
 from cloudai.systems.standalone.standalone_job import StandaloneJob
 from cloudai.systems.standalone.standalone_system import StandaloneSystem
+from cloudai.workloads.sleep import SleepCmdArgs, SleepTestDefinition
 
 
 @pytest.fixture
@@ -108,3 +118,174 @@ def test_kill_job(mock_execute, standalone_system, standalone_job):
     kill_command = f"kill -9 {standalone_job.id}"
 
     mock_execute.assert_called_once_with(kill_command)
+
+
+@pytest.fixture
+def local_system(tmp_path: Path) -> StandaloneSystem:
+    return StandaloneSystem(name="local", install_path=tmp_path / "install", output_path=tmp_path / "output")
+
+
+def launch_job(system: StandaloneSystem, tmp_path: Path, command: str) -> StandaloneJob:
+    process = system.launch(command, tmp_path)
+    return StandaloneJob(MagicMock(), id=process.pid, process=process)
+
+
+def wait_until(condition: Callable[[], bool], timeout: float = 5) -> bool:
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.01)
+    return True
+
+
+def wait_for_exit(system: StandaloneSystem, job: StandaloneJob) -> None:
+    assert wait_until(lambda: system.is_job_completed(job)), f"Process {job.id} did not exit"
+
+
+class TestProcessHandles:
+    def test_exit_code_and_rusage(self, local_system: StandaloneSystem, tmp_path: Path):
+        job = launch_job(local_system, tmp_path, "echo out; echo err >&2; exit 3")
+
+        wait_for_exit(local_system, job)
+
+        assert job.returncode == 3
+        assert job.rusage is not None
+        assert (tmp_path / "stdout.txt").read_text() == "out\n"
+        assert (tmp_path / "stderr.txt").read_text() == "err\n"
+
+    def test_running(self, local_system: StandaloneSystem, tmp_path: Path):
+        job = launch_job(local_system, tmp_path, "sleep 60")
+
+        assert local_system.is_job_running(job)
+        assert job.returncode is None
+
+        local_system.kill(job)
+        wait_for_exit(local_system, job)
+
+    def test_kill_terminates_process_group(self, local_system: StandaloneSystem, tmp_path: Path):
+        job = launch_job(local_system, tmp_path, f"sleep 60 & echo $! > {tmp_path}/child.pid; wait")
+        assert wait_until(lambda: (tmp_path / "child.pid").exists() and (tmp_path / "child.pid").read_text() != "")
+        child = Path("/proc") / (tmp_path / "child.pid").read_text().strip()
+
+        local_system.kill(job)
+        wait_for_exit(local_system, job)
+
+        assert job.returncode == -signal.SIGKILL
+        # the orphaned child is either reaped by init or stays a zombie
+        assert wait_until(lambda: not child.exists() or (child / "stat").read_text().split()[2] == "Z")
+
+    def test_reaped_by_popen(self, local_system: StandaloneSystem, tmp_path: Path):
+        job = launch_job(local_system, tmp_path, "exit 2")
+        assert job.process is not None
+        job.process.wait()
+
+        assert local_system.is_job_completed(job)
+        assert job.returncode == 2
+
+
+class TestStandaloneRunner:
+    @pytest.fixture
+    def scenario(self, local_system: StandaloneSystem) -> TestScenario:
+        test = Test(
+            test_definition=SleepTestDefinition(
+                name="sleep", description="d", test_template_name="Sleep", cmd_args=SleepCmdArgs(seconds=0)
+            ),
+            test_template=TestTemplate(local_system),
+        )
+        return TestScenario(name="scenario", test_runs=[TestRun(f"tr-{i}", test, 1, []) for i in range(3)])
+
+    def make_runner(self, system: StandaloneSystem, scenario: TestScenario) -> StandaloneRunner:
+        runner = StandaloneRunner("run", system, scenario, system.output_path)
+        runner.min_monitor_interval = 0.01
+        return runner
+
+    def test_default_slots(self, local_system: StandaloneSystem):
+        assert local_system.job_slots == (os.cpu_count() or 1)
+
+    def test_slots_limit_parallel_jobs(self, local_system: StandaloneSystem, scenario: TestScenario):
+        local_system.max_parallel_jobs = 2
+        runner = self.make_runner(local_system, scenario)
+        running, max_running = set(), 0
+        launch, reap = local_system.launch, local_system.reap
+
+        def tracked_launch(command: str, output_path: Path):
+            nonlocal max_running
+            process = launch(command, output_path)
+            running.add(process.pid)
+            max_running = max(max_running, len(running))
+            return process
+
+        def tracked_reap(job: StandaloneJob) -> bool:
+            exited = reap(job)
+            if exited:
+                running.discard(job.id)
+            return exited
+
+        with (
+            patch.object(StandaloneSystem, "launch", side_effect=tracked_launch),
+            patch.object(StandaloneSystem, "reap", side_effect=tracked_reap),
+        ):
+            asyncio.run(runner.run())
+
+        assert max_running == 2
+        assert all((tr.output_path / "stdout.txt").exists() for tr in scenario.test_runs)
+        metadata = [
+            StandaloneJobMetadata.model_validate(toml.load(tr.output_path / "standalone-job.toml"))
+            for tr in scenario.test_runs
+        ]
+        assert all(meta.exit_code == 0 and meta.accounting.run_time_sec is not None for meta in metadata)
+        assert metadata[2].accounting.queue_wait_sec
+        assert not runner.slot_holders
+        assert runner.job_slots is not None and not runner.job_slots.locked()
+
+    def test_run_can_be_repeated(self, local_system: StandaloneSystem, scenario: TestScenario):
+        local_system.max_parallel_jobs = 1
+        runner = self.make_runner(local_system, scenario)
+
+        asyncio.run(runner.run())
+        runner.jobs.clear()
+        runner.testrun_to_job_map.clear()
+        asyncio.run(runner.run())
+
+        assert not runner.slot_holders
+        assert all((tr.output_path / "standalone-job.toml").exists() for tr in scenario.test_runs)
+
+    def test_shutdown_releases_slots(self, local_system: StandaloneSystem, scenario: TestScenario):
+        local_system.max_parallel_jobs = 1
+        runner = self.make_runner(local_system, scenario)
+        runner.job_slots = asyncio.Semaphore(1)
+        asyncio.run(runner.job_slots.acquire())
+        runner.slot_holders.add(scenario.test_runs[0])
+
+        asyncio.run(runner.shutdown())
+
+        assert not runner.slot_holders
+        assert not runner.job_slots.locked()
+
+    def test_failed_process_fails_job(self, local_system: StandaloneSystem, scenario: TestScenario):
+        runner = self.make_runner(local_system, scenario)
+        job = StandaloneJob(scenario.test_runs[0], id=1, returncode=1)
+
+        result = runner.get_runner_job_status(job)
+
+        assert not result.is_successful
+        assert "exited with code 1" in result.error_message
+
+    def test_metadata_stores_executed_command(self, scenario: TestScenario):
+        job = StandaloneJob(scenario.test_runs[0], id=1, exec_cmd="echo 'a b'", returncode=0)
+
+        assert StandaloneJobMetadata.from_job(job).command == "echo 'a b'"
+
+    def test_metadata_of_unfinished_job(self, scenario: TestScenario):
+        job = StandaloneJob(scenario.test_runs[0], id=1, exec_cmd="echo")
+
+        with pytest.raises(ValueError):
+            StandaloneJobMetadata.from_job(job)
+
+    def test_killed_by_dependency_is_successful(self, local_system: StandaloneSystem, scenario: TestScenario):
+        runner = self.make_runner(local_system, scenario)
+        job = StandaloneJob(scenario.test_runs[0], id=1, returncode=-signal.SIGKILL)
+        job.terminated_by_dependency = True
+
+        assert runner.get_runner_job_status(job).is_successful
@@ -14,12 +14,13 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import itertools
 from typing import ClassVar
 
 import pytest
 
 from cloudai._core.test_scenario import TestRun
-from cloudai.core import ReportGenerationStrategy, Test, TestDefinition, TestTemplate
+from cloudai.core import ParameterSpace, ReportGenerationStrategy, Test, TestDefinition, TestTemplate
 from cloudai.models.workload import CmdArgs
 from cloudai.systems.slurm import SlurmSystem
 
@@ -88,3 +89,137 @@ class TestMetricsReporter:
         tr.test.test_definition.agent_metrics = metrics
 
         assert tr.metric_reporter is None
+
+
+class TestParameterSpace:
+    SPACE: ClassVar[dict[str, list]] = {"a": [1, 2, 3], "b": ["x", "y"], "c": [True, False]}
+
+    def test_len(self):
+        assert len(ParameterSpace(self.SPACE)) == 12
+        assert len(ParameterSpace({})) == 0
+        assert len(ParameterSpace({"a": []})) == 0
+
+    def test_order_matches_product(self):
+        expected = [dict(zip(self.SPACE, c, strict=True)) for c in itertools.product(*self.SPACE.values())]
+        space = ParameterSpace(self.SPACE)
+
+        assert list(space) == expected
+        assert [space[i] for i in range(len(space))] == expected
+        assert space[-1] == expected[-1]
+        assert space[2:5] == expected[2:5]
+
+    def test_out_of_range(self):
+        with pytest.raises(IndexError):
+            ParameterSpace(self.SPACE)[12]
+
+    def test_empty_space_yields_nothing(self):
+        assert list(ParameterSpace({})) == []
+
+    def test_filtered(self):
+        space = ParameterSpace(self.SPACE)
+        feasible = list(space.filtered(lambda c: c["a"] == 2 and c["c"]))
+        assert feasible == [(4, {"a": 2, "b": "x", "c": True}), (6, {"a": 2, "b": "y", "c": True})]
+
+    def test_column(self):
+        space = ParameterSpace(self.SPACE)
+        for key in self.SPACE:
+            assert space.column(key).tolist() == [c[key] for c in space]
+
+    def test_column_missing_values(self):
+        space = ParameterSpace({"a": [None, 2], "b": [1, 2]})
+        assert space.column("a", missing=0).tolist() == [0, 0, 2, 2]
+
+    @pytest.mark.parametrize(
+        "values",
+        [[1, "x"], [True, 2], [None, 2], [[1, 2], [3, 4]], [{"a": 1}, {"a": 2}]],
+    )
+    def test_column_keeps_non_native_values(self, values: list):
+        space = ParameterSpace({"a": values, "b": [1, 2]})
+
+        column = space.column("a")
+
+        assert column.dtype == object
+        assert column.shape == (4,)
+        assert column.tolist() == [c["a"] for c in space]
+
+
+class TestVariant:
+    @pytest.fixture
+    def tr(self, slurm_system: SlurmSystem) -> TestRun:
+        return TestRun(
+            name="test",
+            test=Test(
+                test_definition=TestDefinition(
+                    name="test",
+                    description="",
+                    test_template_name="Test",
+                    cmd_args=CmdArgs(),
+                    extra_env_vars={"VAR": ["a", "b"]},
+                ),
+                test_template=TestTemplate(slurm_system),
+            ),
+            num_nodes=[1, 2],
+            nodes=["node1"],
+            reports={MyReport},
+        )
+
+    def test_shares_test_copies_containers(self, tr: TestRun):
+        new_tr = tr.variant(step=3)
+
+        assert new_tr.step == 3 and tr.step == 0
+        assert new_tr.test is tr.test
+
+        new_tr.nodes.append("node2")
+        new_tr.reports.add(MyReport2)
+        assert tr.nodes == ["node1"]
+        assert tr.reports == {MyReport}
+
+    def test_apply_params_set_does_not_copy_template(self, tr: TestRun):
+        new_tr = tr.apply_params_set({"extra_env_vars.VAR": "b", "NUM_NODES": 2})
+
+        assert new_tr.test.test_template is tr.test.test_template
+        assert new_tr.test.test_template.system is tr.test.test_template.system
+        assert new_tr.test.test_definition is not tr.test.test_definition
+        assert new_tr.test.extra_env_vars == {"VAR": "b"}
+        assert tr.test.extra_env_vars == {"VAR": ["a", "b"]}
+        assert new_tr.num_nodes == 2 and tr.num_nodes == [1, 2]
+
+
+class OddNodesDefinition(TestDefinition):
+    def constraint_check(self, tr: TestRun) -> bool:
+        return tr.nnodes % 2 == 1
+
+
+class TestFeasibleCombinations:
+    @pytest.fixture
+    def tr(self, slurm_system: SlurmSystem) -> TestRun:
+        return TestRun(
+            name="test",
+            test=Test(
+                test_definition=TestDefinition(
+                    name="test",
+                    description="",
+                    test_template_name="Test",
+                    cmd_args=CmdArgs(),
+                    extra_env_vars={"VAR": ["a", "b"]},
+                ),
+                test_template=TestTemplate(slurm_system),
+            ),
+            num_nodes=[1, 2, 3],
+            nodes=[],
+        )
+
+    def test_without_constraints_all_are_feasible(self, tr: TestRun):
+        assert tr.feasible_mask().tolist() == [True] * 6
+
+    def test_fallback_to_constraint_check(self, tr: TestRun):
+        tr.test.test_definition = OddNodesDefinition(
+            name="test",
+            description="",
+            test_template_name="Test",
+            cmd_args=CmdArgs(),
+            extra_env_vars={"VAR": ["a", "b"]},
+        )
+
+        assert tr.feasible_mask().tolist() == [True, False, True, True, False, True]
+        assert [idx for idx, _ in tr.feasible_combinations()] == [0, 2, 3, 5]
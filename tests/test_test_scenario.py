@@ -16,7 +16,7 @@
 
 
 from pathlib import Path
-from typing import Set, Type
+from typing import Set, Type, cast
 from unittest.mock import Mock, patch
 
 import pytest
@@ -24,12 +24,14 @@ import toml
 
 from cloudai.core import (
     CmdArgs,
+    DSEObjective,
     GitRepo,
     PredictorConfig,
     Registry,
     ReportGenerationStrategy,
     Test,
     TestDefinition,
+    TestDependency,
     TestRun,
     TestScenario,
     TestScenarioParser,
@@ -195,6 +197,57 @@ def test_two_dependent_cases(test: Test, test_scenario_parser: TestScenarioParse
     assert test_scenario.test_runs[1].dependencies == {}
 
 
+def test_dependents_index(test: Test, test_scenario_parser: TestScenarioParser) -> None:
+    test_scenario_parser.test_mapping = {"nccl": test}
+    test_scenario = test_scenario_parser._parse_data(
+        {
+            "name": "nccl-test",
+            "Tests": [
+                {"id": "1", "test_name": "nccl"},
+                {"id": "2", "test_name": "nccl", "dependencies": [{"type": "start_post_init", "id": "1"}]},
+                {"id": "3", "test_name": "nccl", "dependencies": [{"type": "end_post_comp", "id": "1"}]},
+                {"id": "4", "test_name": "nccl", "dependencies": [{"type": "start_post_comp", "id": "1"}]},
+                {"id": "5", "test_name": "nccl", "dependencies": [{"type": "start_post_comp", "id": "1"}]},
+            ],
+        }
+    )
+    tr1, tr2, tr3, tr4, tr5 = test_scenario.test_runs
+
+    assert test_scenario.get_dependents("start_post_init", tr1) == [tr2]
+    assert test_scenario.get_dependents("end_post_comp", tr1) == [tr3]
+    assert test_scenario.get_dependents("start_post_comp", tr1) == [tr4, tr5]
+    assert test_scenario.get_dependents("start_post_comp", tr2) == []
+
+    test_scenario.test_runs = [tr1, tr4]
+    assert test_scenario.get_dependents("start_post_comp", tr1) == [tr4]
+    assert test_scenario.get_dependents("start_post_init", tr1) == []
+
+
+class CountingList(list):
+    iterations = 0
+
+    def __iter__(self):
+        CountingList.iterations += 1
+        return super().__iter__()
+
+
+def test_dependents_lookup_does_not_scan_test_runs() -> None:
+    trs: list[TestRun] = []
+    for idx in range(10_000):
+        deps = {"start_post_comp": TestDependency(trs[-1])} if trs else {}
+        trs.append(TestRun(name=f"tr{idx}", test=cast(Test, object()), num_nodes=1, nodes=[], dependencies=deps))
+
+    CountingList.iterations = 0
+    test_scenario = TestScenario(name="chain", test_runs=CountingList(trs))
+    assert CountingList.iterations == 1
+
+    dependents = [test_scenario.get_dependents("start_post_comp", tr) for tr in trs]
+
+    assert CountingList.iterations == 1
+    assert dependents[:-1] == [[tr] for tr in trs[1:]]
+    assert dependents[-1] == []
+
+
 def test_ids_must_be_unique() -> None:
     with pytest.raises(ValueError) as exc_info:
         TestScenarioModel.model_validate(
@@ -453,6 +506,63 @@ class TestInScenario:
         assert isinstance(tdef.cmd_args, MegatronRunCmdArgs)
         assert tdef.cmd_args.run_script == Path("run.sh")
 
+    def test_agent_fields_of_test_are_kept(self, test_scenario_parser: TestScenarioParser, slurm_system: SlurmSystem):
+        nccl = NCCLTestDefinition(
+            name="nccl",
+            description="desc",
+            test_template_name="NcclTest",
+            cmd_args=NCCLCmdArgs(docker_image_url="fake://url/nccl"),
+            agent_metrics=["default", "latency"],
+            agent_objectives=[DSEObjective(metric="latency")],
+            agent_config={"num_initial": 3},
+        )
+        test_scenario_parser.test_mapping = {"nccl": Test(test_definition=nccl, test_template=Mock())}
+        model = TestScenarioModel.model_validate(
+            toml.loads(
+                """
+            name = "test"
+
+            [[Tests]]
+            id = "1"
+            test_name = "nccl"
+            """
+            )
+        )
+
+        _, tdef = test_scenario_parser._prepare_tdef(model.tests[0])
+
+        assert tdef.agent_metrics == ["default", "latency"]
+        assert tdef.agent_config == {"num_initial": 3}
+
+    def test_agent_fields_can_be_overridden(self, test_scenario_parser: TestScenarioParser, slurm_system: SlurmSystem):
+        nccl = NCCLTestDefinition(
+            name="nccl",
+            description="desc",
+            test_template_name="NcclTest",
+            cmd_args=NCCLCmdArgs(docker_image_url="fake://url/nccl"),
+        )
+        test_scenario_parser.test_mapping = {"nccl": Test(test_definition=nccl, test_template=Mock())}
+        model = TestScenarioModel.model_validate(
+            toml.loads(
+                """
+            name = "test"
+
+            [[Tests]]
+            id = "1"
+            test_name = "nccl"
+            agent_metrics = ["latency"]
+            agent_config = { num_initial = 2 }
+            agent_early_stop = { min_runtime = 10 }
+            """
+            )
+        )
+
+        _, tdef = test_scenario_parser._prepare_tdef(model.tests[0])
+
+        assert tdef.agent_metrics == ["latency"]
+        assert tdef.agent_config == {"num_initial": 2}
+        assert tdef.agent_early_stop is not None and tdef.agent_early_stop.min_runtime == 10
+
     def test_num_nodes_can_be_list(self, test_scenario_parser: TestScenarioParser, slurm_system: SlurmSystem):
         model = TestScenarioModel.model_validate(
             toml.loads(
@@ -541,7 +651,7 @@ class TestReportMetricsDSE:
             cmd_args=NCCLCmdArgs(docker_image_url="fake://url/nccl"),
             extra_env_vars={"DSE": ["v1", "v2"]},
         )
-        test_scenario_parser.test_mapping["nccl"] = Test(test_definition=nccl, test_template=Mock())
+        test_scenario_parser.test_mapping = {"nccl": Test(test_definition=nccl, test_template=Mock())}
         return test_scenario_parser
 
     def test_raises_on_unknown_metric(